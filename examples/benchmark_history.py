@@ -0,0 +1,59 @@
+"""Micro-benchmark for incremental conversation-history rendering.
+
+Simulates a 10-round debate with 8 debaters, where every debater builds its
+history once per turn, and compares the cached incremental builder with a
+full re-render of the transcript on every turn.
+
+Run with: python examples/benchmark_history.py
+"""
+
+import time
+
+from mad.agents.debater import DebaterAgent
+from mad.core.state import create_initial_state, create_message
+
+ROUNDS = 10
+DEBATERS = 8
+REPEATS = 20
+ARGUMENT = "A detailed argument about trade-offs and evidence. " * 40
+
+
+def render_from_scratch(agent_id, messages):
+    """Render history the way agents did before caching."""
+    history = []
+    for msg in messages:
+        role = "assistant" if msg["agent_id"] == agent_id else "user"
+        prefix = f"[{msg['agent_role'].upper()} - {msg['agent_id']}]"
+        history.append({"role": role, "content": f"{prefix}\n{msg['content']}"})
+    return history
+
+
+def run(build):
+    """Time every debater building its history on every turn of a debate."""
+    best = float("inf")
+    for repeat in range(REPEATS):
+        agents = [DebaterAgent(f"debater_{i}", None, "model") for i in range(DEBATERS)]
+        state = create_initial_state(topic="Topic", debate_id=f"bench-{repeat}")
+        start = time.perf_counter()
+        for round_num in range(1, ROUNDS + 1):
+            for agent in agents:
+                build(agent, state)
+                message = create_message(agent.agent_id, "debater", "p", "m", ARGUMENT, round_num)
+                state["messages"] = [*state["messages"], message]
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """Compare full re-rendering with the incremental cache."""
+    full = run(lambda agent, state: render_from_scratch(agent.agent_id, state["messages"]))
+    incremental = run(lambda agent, state: agent._build_conversation_history(state))
+
+    print(f"{ROUNDS} rounds x {DEBATERS} debaters, best of {REPEATS}")
+    print(f"  full re-render: {full * 1000:8.2f} ms")
+    print(f"  incremental:    {incremental * 1000:8.2f} ms")
+    print(f"  speedup:        {full / incremental:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
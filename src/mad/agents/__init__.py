@@ -1,13 +1,21 @@
 """Agent definitions for MAD Framework."""
 
 from mad.agents.base import BaseAgent
+from mad.agents.compaction import TranscriptCompactor
+from mad.agents.consensus import LexicalConsensus
 from mad.agents.debater import DebaterAgent
+from mad.agents.dedup import TranscriptDeduplicator
 from mad.agents.judge import JudgeAgent
 from mad.agents.moderator import ModeratorAgent
+from mad.agents.retrieval import ContextRetriever
 
 __all__ = [
     "BaseAgent",
+    "ContextRetriever",
     "DebaterAgent",
     "JudgeAgent",
+    "LexicalConsensus",
     "ModeratorAgent",
+    "TranscriptCompactor",
+    "TranscriptDeduplicator",
 ]
@@ -3,15 +3,32 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Literal
 
 from mad.core.state import DebateMessage, DebateState, create_message
+from mad.tokens import estimate_prompt_tokens
 
 if TYPE_CHECKING:
-    from mad.providers.base import LLMProvider
+    from mad.agents.compaction import TranscriptCompactor
+    from mad.providers.base import LLMProvider, ProviderResponse, TokenCallback
 
 AgentRole = Literal["debater", "judge", "moderator", "synthesizer"]
 
+# Debates whose rendered history each agent keeps (agents are shared by
+# concurrent debates through the graph cache)
+HISTORY_CACHE_SIZE = 64
+
+
+@dataclass
+class RenderedHistory:
+    """Conversation history rendered up to a point in a debate's transcript."""
+
+    consumed: int = 0  # transcript messages already rendered
+    last: DebateMessage | None = None  # last consumed message, to detect rewrites
+    messages: list[dict[str, str]] = field(default_factory=list)
+
 
 class BaseAgent(ABC):
     """Abstract base class for all agents in the debate."""
@@ -38,6 +55,9 @@ class BaseAgent(ABC):
         self.model = model
         self.temperature = temperature
         self._system_prompt = system_prompt
+        self._history: OrderedDict[tuple[str, bool, int], RenderedHistory] = OrderedDict()
+        # Summarizes old rounds once prompts pass a budget (set by the orchestrator)
+        self.compactor: TranscriptCompactor | None = None
 
     @property
     @abstractmethod
@@ -56,17 +76,107 @@ class BaseAgent(ABC):
         return self._system_prompt or self.default_system_prompt
 
     @abstractmethod
-    async def act(self, state: DebateState) -> DebateMessage:
+    async def act(
+        self,
+        state: DebateState,
+        on_token: TokenCallback | None = None,
+    ) -> DebateMessage:
         """Perform the agent's action based on current state.
 
         Args:
             state: Current debate state.
+            on_token: Optional callback receiving response chunks as they
+                are generated. When set, the provider is called in
+                streaming mode.
 
         Returns:
             A DebateMessage containing the agent's response.
         """
         ...
 
+    async def _compact(self, state: DebateState) -> tuple[DebateState, dict[str, object]]:
+        """Compact old rounds of the transcript if a compactor is set.
+
+        Args:
+            state: Current debate state.
+
+        Returns:
+            The state to build the prompt from, and compaction metadata for
+            the response message.
+        """
+        if self.compactor is None:
+            return state, {}
+        return await self.compactor.compact(state, self)
+
+    def _context(self, state: DebateState) -> str:
+        """Return the context this agent's prompt shows.
+
+        Args:
+            state: Current debate state.
+
+        Returns:
+            The debate context (empty if there is none).
+        """
+        return state["context"] or ""
+
+    def _build_prompt(self, state: DebateState) -> list[dict[str, str]]:
+        """Build the prompt messages for this agent.
+
+        Args:
+            state: Current debate state.
+
+        Returns:
+            List of messages for LLM.
+        """
+        return self._build_conversation_history(state)
+
+    def estimate_input_cost(self, state: DebateState) -> float:
+        """Estimate the input cost of this agent's next call, before making it.
+
+        Args:
+            state: Debate state the agent would act on.
+
+        Returns:
+            Estimated input cost in USD (0.0 without a provider).
+        """
+        if self.provider is None:
+            return 0.0
+        tokens = estimate_prompt_tokens(
+            self._build_prompt(state), self.system_prompt, self.provider.name
+        )
+        return self.provider.estimate_cost(tokens, 0, self.model)
+
+    async def _generate(
+        self,
+        messages: list[dict[str, str]],
+        on_token: TokenCallback | None = None,
+    ) -> ProviderResponse:
+        """Call the provider, streaming chunks to on_token if given.
+
+        Args:
+            messages: Prompt messages for the LLM.
+            on_token: Optional callback for streamed chunks.
+
+        Returns:
+            The complete provider response.
+        """
+        assert self.provider is not None, "Provider required for generation"
+        if on_token is None:
+            return await self.provider.generate(
+                messages=messages,
+                model=self.model,
+                temperature=self.temperature,
+                system=self.system_prompt,
+            )
+
+        return await self.provider.generate_stream(
+            messages=messages,
+            model=self.model,
+            on_token=on_token,
+            temperature=self.temperature,
+            system=self.system_prompt,
+        )
+
     def _build_conversation_history(
         self,
         state: DebateState,
@@ -74,6 +184,12 @@ class BaseAgent(ABC):
     ) -> list[dict[str, str]]:
         """Build conversation history from debate messages.
 
+        Rendered messages are cached per debate, so each call only renders
+        the messages added since this agent's previous turn. If the
+        transcript no longer extends what was rendered, it is rebuilt.
+        Compacted views are cached separately by how many rounds they
+        summarize, since compaction rewrites earlier messages.
+
         Args:
             state: Current debate state.
             include_own_messages: Whether to include this agent's messages.
@@ -81,9 +197,25 @@ class BaseAgent(ABC):
         Returns:
             List of message dicts for LLM input.
         """
-        messages = []
+        transcript = state["messages"]
+        key = (
+            state.get("debate_id", ""),
+            include_own_messages,
+            state.get("compacted_through_round", 0),
+        )
+        rendered = self._history.get(key)
+        if (
+            rendered is None
+            or rendered.consumed > len(transcript)
+            or (rendered.consumed and transcript[rendered.consumed - 1] != rendered.last)
+        ):
+            rendered = RenderedHistory()
+        self._history[key] = rendered
+        self._history.move_to_end(key)
+        while len(self._history) > HISTORY_CACHE_SIZE:
+            self._history.popitem(last=False)
 
-        for msg in state["messages"]:
+        for msg in transcript[rendered.consumed :]:
             if not include_own_messages and msg["agent_id"] == self.agent_id:
                 continue
 
@@ -92,9 +224,11 @@ class BaseAgent(ABC):
             prefix = f"[{msg['agent_role'].upper()} - {msg['agent_id']}]"
             content = f"{prefix}\n{msg['content']}"
 
-            messages.append({"role": role, "content": content})
+            rendered.messages.append({"role": role, "content": content})
 
-        return messages
+        rendered.consumed = len(transcript)
+        rendered.last = transcript[-1] if transcript else None
+        return list(rendered.messages)
 
     def _create_response_message(
         self,
@@ -0,0 +1,187 @@
+"""Rolling transcript compaction for long debates."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from mad.core.state import DebateMessage, DebateState
+from mad.tokens import MESSAGE_OVERHEAD, count_tokens
+from mad.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from mad.agents.base import BaseAgent
+    from mad.providers.base import LLMProvider
+
+logger = get_logger(__name__)
+
+SUMMARY_SYSTEM_PROMPT = """You condense debate arguments for later rounds.
+Keep the position taken, the key claims and evidence, and any concessions.
+Drop rhetoric and repetition. Write plain prose, no preamble."""
+
+SummaryKey = tuple[str, int, str]  # (debate_id, round, debater agent_id)
+
+
+class TranscriptCompactor:
+    """Replaces old debater turns with short summaries once prompts get large.
+
+    When an agent's estimated prompt passes ``budget_tokens``, every debater
+    message from rounds older than the last ``keep_rounds`` is swapped for a
+    summary written by a cheap model. Each summary is generated once per
+    (debate, round, debater) and reused by every later agent call; agents
+    that need the same summary concurrently share one request. A failed
+    summary leaves the original message in place.
+    """
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        model: str,
+        budget_tokens: int,
+        keep_rounds: int = 1,
+        max_summary_tokens: int = 256,
+        max_entries: int = 4096,
+    ) -> None:
+        """Initialize the compactor.
+
+        Args:
+            provider: Provider for the summarizer model.
+            model: Cheap model used to write summaries.
+            budget_tokens: Estimated prompt size that triggers compaction.
+            keep_rounds: Most recent rounds always kept verbatim.
+            max_summary_tokens: Output limit for each summary.
+            max_entries: Summaries kept in memory across debates.
+        """
+        self.provider = provider
+        self.model = model
+        self.budget_tokens = budget_tokens
+        self.keep_rounds = keep_rounds
+        self.max_summary_tokens = max_summary_tokens
+        self.max_entries = max_entries
+        self._summaries: OrderedDict[SummaryKey, DebateMessage] = OrderedDict()
+        self._pending: dict[SummaryKey, asyncio.Future[tuple[DebateMessage, float, int]]] = {}
+        # Summary spend per debate not yet attributed to an agent's message
+        self._unbilled: dict[str, tuple[float, int]] = {}
+
+    def estimate_tokens(self, state: DebateState, agent: BaseAgent) -> int:
+        """Estimate an agent's prompt size from the raw transcript.
+
+        Counts the context the agent actually shows (e.g. retrieved excerpts)
+        and uses memoized per-text counts, so it does not render the prompt.
+        """
+        provider = agent.provider.name if agent.provider is not None else None
+        total = count_tokens(agent.system_prompt, provider)
+        total += count_tokens(state["topic"], provider)
+        total += count_tokens(agent._context(state), provider)
+        for message in state["messages"]:
+            total += count_tokens(message["content"], provider) + MESSAGE_OVERHEAD
+        return total
+
+    def _remember(self, key: SummaryKey, summary: DebateMessage) -> None:
+        self._summaries[key] = summary
+        while len(self._summaries) > self.max_entries:
+            self._summaries.popitem(last=False)
+
+    async def _summarize(self, message: DebateMessage) -> tuple[DebateMessage, float, int]:
+        response = await self.provider.generate(
+            [
+                {
+                    "role": "user",
+                    "content": (
+                        f"Summarize {message['agent_id']}'s round {message['round']} "
+                        f"argument:\n\n{message['content']}"
+                    ),
+                }
+            ],
+            self.model,
+            temperature=0.0,
+            max_tokens=self.max_summary_tokens,
+            system=SUMMARY_SYSTEM_PROMPT,
+        )
+        summary = DebateMessage(
+            **{
+                **message,
+                "content": f"(Summary of round {message['round']}) {response['content']}",
+                "metadata": {**message["metadata"], "summary": True},
+            }
+        )
+        tokens = response["input_tokens"] + response["output_tokens"]
+        return summary, response["cost"], tokens
+
+    def _finished(
+        self, key: SummaryKey, future: asyncio.Future[tuple[DebateMessage, float, int]]
+    ) -> None:
+        # Runs even if every waiter was cancelled, so finished work is kept and billed
+        self._pending.pop(key, None)
+        if future.cancelled() or future.exception() is not None:
+            return
+        summary, cost, tokens = future.result()
+        self._remember(key, summary)
+        spent_cost, spent_tokens = self._unbilled.get(key[0], (0.0, 0))
+        self._unbilled[key[0]] = (spent_cost + cost, spent_tokens + tokens)
+
+    async def _summary(self, key: SummaryKey, message: DebateMessage) -> DebateMessage:
+        """Return a summary of the message, or the message itself on failure."""
+        cached = self._summaries.get(key)
+        if cached is not None:
+            self._summaries.move_to_end(key)
+            return cached
+
+        future = self._pending.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._summarize(message))
+            future.add_done_callback(lambda done: self._finished(key, done))
+            self._pending[key] = future
+        try:
+            summary, _, _ = await asyncio.shield(future)
+        except Exception as e:
+            logger.warning(
+                "summary_failed", round=message["round"], agent_id=message["agent_id"], error=str(e)
+            )
+            return message
+        return summary
+
+    async def compact(
+        self,
+        state: DebateState,
+        agent: BaseAgent,
+    ) -> tuple[DebateState, dict[str, Any]]:
+        """Return the state the agent should see, compacted if over budget.
+
+        Args:
+            state: Current debate state.
+            agent: Agent about to build its prompt.
+
+        Returns:
+            The (possibly compacted) state, and metadata for the agent's
+            message: ``compacted_through_round`` plus the cost and tokens of
+            summaries finished since the debate's last compaction.
+        """
+        # Keep the newest rounds in the transcript (the ones the agent answers)
+        newest = max((message["round"] for message in state["messages"]), default=0)
+        cutoff = newest - self.keep_rounds
+        if cutoff < 1 or self.estimate_tokens(state, agent) <= self.budget_tokens:
+            return state, {}
+
+        debate_id = state.get("debate_id", "")
+        targets = {
+            index: (debate_id, message["round"], message["agent_id"])
+            for index, message in enumerate(state["messages"])
+            if message["agent_role"] == "debater" and message["round"] <= cutoff
+        }
+        results = await asyncio.gather(
+            *(self._summary(key, state["messages"][index]) for index, key in targets.items())
+        )
+        cost, tokens = self._unbilled.pop(debate_id, (0.0, 0))
+
+        summaries = dict(zip(targets, results, strict=True))
+        messages = [
+            summaries.get(index, message) for index, message in enumerate(state["messages"])
+        ]
+        compacted: DebateState = {**state, "messages": messages, "compacted_through_round": cutoff}
+        return compacted, {
+            "compacted_through_round": cutoff,
+            "compaction_cost": cost,
+            "compaction_tokens": tokens,
+        }
@@ -0,0 +1,161 @@
+"""Local lexical consensus estimate, used to skip clear-cut moderator calls."""
+
+from __future__ import annotations
+
+import math
+import random
+import zlib
+from collections import Counter
+from itertools import combinations
+
+from mad.agents.retrieval import terms
+from mad.core.state import DebateMessage, DebateState
+from mad.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Hashed bag-of-words dimensions
+FEATURES = 1 << 18
+
+STOPWORDS = frozenset(
+    "a an and are as at be by can for from has have i in is it its my of on or our so "
+    "that the their this to was we were will with would you your".split()
+)
+AGREE = frozenset(
+    "agree agreed agreement agrees aligned concede concur consensus convinced "
+    "correct endorse valid".split()
+)
+DISAGREE = frozenset(
+    "contrary disagree disagreement dispute doubt fails flawed however incorrect "
+    "misses oppose overlook overlooks reject unconvinced wrong".split()
+)
+NEGATIONS = frozenset({"not", "no", "never", "t"})  # "t" from "don't", "isn't"
+
+
+def _vectorize(counts: Counter[str], idf: dict[str, float]) -> dict[int, float]:
+    """Return an L2-normalized, hashed TF-IDF vector."""
+    vector: dict[int, float] = {}
+    for term, tf in counts.items():
+        feature = zlib.crc32(term.encode()) % FEATURES
+        vector[feature] = vector.get(feature, 0.0) + (1 + math.log(tf)) * idf[term]
+    norm = math.sqrt(sum(value * value for value in vector.values()))
+    return {feature: value / norm for feature, value in vector.items()} if norm else {}
+
+
+def _stance(words: list[str]) -> float:
+    """Return agreement minus disagreement cues, in [-1, 1] (0 without cues)."""
+    agree = disagree = 0
+    for previous, word in zip(["", *words], words, strict=False):
+        if word not in AGREE and word not in DISAGREE:
+            continue
+        # A negated cue counts for the other side ("not convinced", "don't object")
+        if (word in AGREE) != (previous in NEGATIONS):
+            agree += 1
+        else:
+            disagree += 1
+    total = agree + disagree
+    return (agree - disagree) / total if total else 0.0
+
+
+class LexicalConsensus:
+    """Estimates a round's consensus from its debater messages, without an LLM.
+
+    The score blends the mean pairwise cosine similarity of hashed TF-IDF
+    vectors with the mean stance of agreement/disagreement cue words. Scores
+    below ``decide_below`` or above ``decide_above`` are trusted; scores in
+    between are left to the LLM moderator, whose scores are compared with
+    the local ones and logged as calibration stats.
+    """
+
+    def __init__(
+        self,
+        decide_below: float = 0.2,
+        decide_above: float = 0.85,
+        similarity_weight: float = 0.6,
+        calibration_rate: float = 0.0,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize the estimator.
+
+        Args:
+            decide_below: Scores below this are treated as clear disagreement.
+            decide_above: Scores above this are treated as clear consensus.
+            similarity_weight: Weight of lexical similarity versus stance cues.
+            calibration_rate: Fraction of clear-cut rounds still sent to the
+                LLM moderator, to keep calibration stats unbiased.
+            seed: Seed for calibration sampling.
+        """
+        if decide_below > decide_above:
+            msg = "decide_below must not exceed decide_above"
+            raise ValueError(msg)
+        self.decide_below = decide_below
+        self.decide_above = decide_above
+        self.similarity_weight = similarity_weight
+        self.calibration_rate = calibration_rate
+        self._rng = random.Random(seed)
+        self.samples = 0
+        self._abs_error = 0.0
+        self._error = 0.0
+
+    def score(self, messages: list[DebateMessage]) -> float | None:
+        """Estimate consensus between messages.
+
+        Args:
+            messages: The latest round's debater messages.
+
+        Returns:
+            A score from 0.0 (disagreement) to 1.0 (consensus), or None with
+            fewer than two messages.
+        """
+        if len(messages) < 2:
+            return None
+
+        words = [terms(message["content"]) for message in messages]
+        counts = [Counter(w for w in doc if w not in STOPWORDS) for doc in words]
+        df = Counter(term for doc in counts for term in doc)
+        idf = {term: math.log((1 + len(counts)) / (1 + n)) + 1 for term, n in df.items()}
+        vectors = [_vectorize(doc, idf) for doc in counts]
+
+        similarities = [
+            sum(value * b.get(feature, 0.0) for feature, value in a.items())
+            for a, b in combinations(vectors, 2)
+        ]
+        similarity = sum(similarities) / len(similarities)
+        stance = sum((_stance(doc) + 1) / 2 for doc in words) / len(words)
+        return self.similarity_weight * similarity + (1 - self.similarity_weight) * stance
+
+    def round_score(self, state: DebateState) -> float | None:
+        """Estimate consensus for the current round of a debate."""
+        return self.score(
+            [
+                message
+                for message in state["messages"]
+                if message["agent_role"] == "debater" and message["round"] == state["current_round"]
+            ]
+        )
+
+    def decisive(self, score: float) -> bool:
+        """Whether a local score is clear enough to skip the LLM moderator.
+
+        Clear-cut scores are still sent to the LLM at ``calibration_rate``.
+        """
+        if self.decide_below <= score <= self.decide_above:
+            return False
+        return self._rng.random() >= self.calibration_rate
+
+    def record(self, local: float, llm: float) -> None:
+        """Compare a local score with the LLM moderator's and log calibration stats."""
+        self.samples += 1
+        self._abs_error += abs(local - llm)
+        self._error += local - llm
+        logger.info("consensus_calibration", local=round(local, 3), llm=llm, **self.calibration())
+
+    def calibration(self) -> dict[str, float]:
+        """Return the sample count, mean absolute error and bias (local minus LLM)."""
+        if not self.samples:
+            return {"samples": 0, "mae": 0.0, "bias": 0.0}
+        return {
+            "samples": self.samples,
+            "mae": round(self._abs_error / self.samples, 4),
+            "bias": round(self._error / self.samples, 4),
+        }
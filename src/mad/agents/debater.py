@@ -5,10 +5,12 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from mad.agents.base import AgentRole, BaseAgent
+from mad.agents.retrieval import open_disagreements
 from mad.core.state import DebateMessage, DebateState
 
 if TYPE_CHECKING:
-    from mad.providers.base import LLMProvider
+    from mad.agents.retrieval import ContextRetriever
+    from mad.providers.base import LLMProvider, TokenCallback
 
 
 class DebaterAgent(BaseAgent):
@@ -35,6 +37,8 @@ class DebaterAgent(BaseAgent):
         """
         super().__init__(agent_id, provider, model, system_prompt, temperature)
         self.perspective = perspective
+        # Narrows large contexts to this debater's concerns (set by the orchestrator)
+        self.retriever: ContextRetriever | None = None
 
     @property
     def role(self) -> AgentRole:
@@ -60,26 +64,27 @@ Analyze the topic primarily through this lens while remaining open to other view
 
         return base_prompt
 
-    async def act(self, state: DebateState) -> DebateMessage:
+    async def act(
+        self,
+        state: DebateState,
+        on_token: TokenCallback | None = None,
+    ) -> DebateMessage:
         """Generate a debate argument based on current state.
 
         Args:
             state: Current debate state.
+            on_token: Optional callback for streamed response chunks.
 
         Returns:
             DebateMessage with the agent's argument.
         """
         assert self.provider is not None, "Debater requires a provider"
-        # Build messages for LLM
-        messages = self._build_prompt(state)
+        # Build messages for LLM, with old rounds summarized if over budget
+        prompt_state, compaction = await self._compact(state)
+        messages = self._build_prompt(prompt_state)
 
         # Generate response
-        response = await self.provider.generate(
-            messages=messages,
-            model=self.model,
-            temperature=self.temperature,
-            system=self.system_prompt,
-        )
+        response = await self._generate(messages, on_token)
 
         return self._create_response_message(
             content=response["content"],
@@ -88,6 +93,8 @@ Analyze the topic primarily through this lens while remaining open to other view
             output_tokens=response["output_tokens"],
             cost=response["cost"],
             latency_ms=response["latency_ms"],
+            **compaction,
+            **response.get("metadata", {}),
         )
 
     def _build_prompt(self, state: DebateState) -> list[dict[str, str]]:
@@ -104,9 +111,10 @@ Analyze the topic primarily through this lens while remaining open to other view
         # Initial topic and context
         topic_msg = f"## Debate Topic\n{state['topic']}"
         if state["context"]:
-            topic_msg += f"\n\n## Context\n{state['context']}"
+            topic_msg += f"\n\n## Context\n{self._context(state)}"
 
-        messages.append({"role": "user", "content": topic_msg})
+        # Identical on every turn (per round with retrieval); providers cache this prefix
+        messages.append({"role": "user", "content": topic_msg, "cache_control": "ephemeral"})
 
         # Add conversation history
         history = self._build_conversation_history(state)
@@ -136,3 +144,19 @@ Analyze the topic primarily through this lens while remaining open to other view
         messages.append({"role": "user", "content": instruction})
 
         return messages
+
+    def _context(self, state: DebateState) -> str:
+        """Return the context to show, narrowed by the retriever if set.
+
+        Args:
+            state: Current debate state.
+
+        Returns:
+            The full context, or the excerpts most relevant to this
+            debater's perspective and the open disagreements.
+        """
+        if self.retriever is None:
+            return state["context"] or ""
+        query = " ".join([self.perspective or "", state["topic"], *open_disagreements(state)])
+        provider = self.provider.name if self.provider is not None else None
+        return self.retriever.select(state, query, provider)
@@ -0,0 +1,194 @@
+"""Near-duplicate paragraph removal for debate transcripts."""
+
+from __future__ import annotations
+
+import hashlib
+import random
+import re
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from mad.core.state import DebateMessage
+
+_WORD_RE = re.compile(r"\w+")
+_PARAGRAPH_RE = re.compile(r"\n\s*\n")
+_PRIME = (1 << 61) - 1  # Mersenne prime for the hash permutations
+
+# Compressed transcripts kept in memory (the judge builds each prompt more than once)
+CACHE_SIZE = 64
+
+
+def _hash(text: str) -> int:
+    """Stable 64-bit hash, so compressed prompts are identical across runs."""
+    return int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), "big")
+
+
+class MinHasher:
+    """MinHash signatures over word shingles."""
+
+    def __init__(self, num_perm: int = 64, shingle_size: int = 5, seed: int = 1) -> None:
+        """Initialize the hasher.
+
+        Args:
+            num_perm: Hash permutations per signature.
+            shingle_size: Words per shingle.
+            seed: Seed for the permutations.
+        """
+        rng = random.Random(seed)
+        self.shingle_size = shingle_size
+        self._perms = [(rng.randrange(1, _PRIME), rng.randrange(_PRIME)) for _ in range(num_perm)]
+
+    def signature(self, text: str) -> tuple[int, ...]:
+        """Return the MinHash signature of text's word shingles."""
+        words = [word.lower() for word in _WORD_RE.findall(text)]
+        k = self.shingle_size
+        shingles = {_hash(" ".join(words[i : i + k])) for i in range(max(len(words) - k + 1, 1))}
+        return tuple(min((a * h + b) % _PRIME for h in shingles) for a, b in self._perms)
+
+    @staticmethod
+    def similarity(a: tuple[int, ...], b: tuple[int, ...]) -> float:
+        """Estimate the Jaccard similarity of two signatures."""
+        return sum(x == y for x, y in zip(a, b, strict=True)) / len(a)
+
+
+@dataclass
+class _Paragraph:
+    text: str
+    label: str  # "debater_1 R2"
+    signature: tuple[int, ...] | None = None  # None for paragraphs too short to compare
+    canonical: int | None = None  # index of the paragraph this one restates
+    restated_by: list[str] = field(default_factory=list)
+
+
+class TranscriptDeduplicator:
+    """Collapses restated paragraphs across rounds and debaters.
+
+    Paragraphs are compared with MinHash, using LSH banding to find
+    candidates. A paragraph whose estimated similarity to an earlier one
+    reaches ``threshold`` is replaced by a reference to it. The earlier,
+    canonical copy is tagged and attributed to everyone who restated it.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        num_perm: int = 64,
+        bands: int = 16,
+        shingle_size: int = 5,
+        min_words: int = 12,
+    ) -> None:
+        """Initialize the deduplicator.
+
+        Args:
+            threshold: Estimated Jaccard similarity that counts as a restatement.
+            num_perm: Hash permutations per signature (a multiple of ``bands``).
+            bands: LSH bands used to find candidate pairs.
+            shingle_size: Words per shingle.
+            min_words: Shorter paragraphs are always kept verbatim.
+        """
+        self.threshold = threshold
+        self.bands = bands
+        self.min_words = min_words
+        self.hasher = MinHasher(num_perm, shingle_size)
+        self._rows = num_perm // bands
+        self._cache: OrderedDict[tuple[tuple[str, int, str], ...], list[str]] = OrderedDict()
+
+    def compress(self, messages: list[DebateMessage]) -> list[str]:
+        """Return each message's content with restated paragraphs collapsed.
+
+        Args:
+            messages: Transcript messages, oldest first.
+
+        Returns:
+            Compressed content for each message, in the same order.
+        """
+        key = tuple((m["agent_id"], m["round"], m["content"]) for m in messages)
+        cached = self._cache.get(key)
+        if cached is None:
+            cached = self._compress(messages)
+            self._cache[key] = cached
+            while len(self._cache) > CACHE_SIZE:
+                self._cache.popitem(last=False)
+        self._cache.move_to_end(key)
+        return cached
+
+    def _compress(self, messages: list[DebateMessage]) -> list[str]:
+        paragraphs: list[_Paragraph] = []
+        layout: list[list[int]] = []
+        buckets: dict[tuple[int, tuple[int, ...]], list[int]] = {}
+
+        for message in messages:
+            label = f"{message['agent_id']} R{message['round']}"
+            indexes = []
+            for text in _PARAGRAPH_RE.split(message["content"].strip()):
+                index = len(paragraphs)
+                paragraph = _Paragraph(text, label)
+                paragraphs.append(paragraph)
+                indexes.append(index)
+                if len(_WORD_RE.findall(text)) < self.min_words:
+                    continue
+
+                paragraph.signature = self.hasher.signature(text)
+                bands = [
+                    (band, paragraph.signature[band * self._rows : (band + 1) * self._rows])
+                    for band in range(self.bands)
+                ]
+                match = self._best_match(paragraph, paragraphs, bands, buckets)
+                if match is not None:
+                    paragraph.canonical = match
+                    if label not in paragraphs[match].restated_by:
+                        paragraphs[match].restated_by.append(label)
+                    continue
+                for band in bands:
+                    buckets.setdefault(band, []).append(index)
+            layout.append(indexes)
+
+        # Number only the canonical paragraphs that something refers to
+        ids = {
+            index: f"P{n}"
+            for n, index in enumerate(
+                (i for i, paragraph in enumerate(paragraphs) if paragraph.restated_by), start=1
+            )
+        }
+        return [self._render(indexes, paragraphs, ids) for indexes in layout]
+
+    def _best_match(
+        self,
+        paragraph: _Paragraph,
+        paragraphs: list[_Paragraph],
+        bands: list[tuple[int, tuple[int, ...]]],
+        buckets: dict[tuple[int, tuple[int, ...]], list[int]],
+    ) -> int | None:
+        assert paragraph.signature is not None
+        candidates = {index for band in bands for index in buckets.get(band, [])}
+        best, best_similarity = None, 0.0
+        for index in sorted(candidates):
+            signature = paragraphs[index].signature
+            assert signature is not None
+            similarity = self.hasher.similarity(paragraph.signature, signature)
+            if similarity >= self.threshold and similarity > best_similarity:
+                best, best_similarity = index, similarity
+        return best
+
+    @staticmethod
+    def _render(indexes: list[int], paragraphs: list[_Paragraph], ids: dict[int, str]) -> str:
+        blocks: list[str] = []
+        restated: list[str] = []
+        for index in indexes:
+            paragraph = paragraphs[index]
+            if paragraph.canonical is not None:
+                restated.append(ids[paragraph.canonical])
+                continue
+            if restated:
+                blocks.append(f"[Restates {', '.join(restated)}]")
+                restated = []
+            if index in ids:
+                blocks.append(
+                    f"[{ids[index]}] {paragraph.text}\n"
+                    f"(Also argued by: {', '.join(paragraph.restated_by)})"
+                )
+            else:
+                blocks.append(paragraph.text)
+        if restated:
+            blocks.append(f"[Restates {', '.join(restated)}]")
+        return "\n\n".join(blocks)
@@ -7,9 +7,11 @@ from typing import TYPE_CHECKING, Any
 
 from mad.agents.base import AgentRole, BaseAgent
 from mad.core.state import DebateMessage, DebateState
+from mad.tokens import count_tokens
 
 if TYPE_CHECKING:
-    from mad.providers.base import LLMProvider
+    from mad.agents.dedup import TranscriptDeduplicator
+    from mad.providers.base import LLMProvider, TokenCallback
 
 
 class JudgeAgent(BaseAgent):
@@ -33,6 +35,8 @@ class JudgeAgent(BaseAgent):
             temperature: Sampling temperature (lower for consistency).
         """
         super().__init__(agent_id, provider, model, system_prompt, temperature)
+        # Collapses restated paragraphs in the transcript (set by the orchestrator)
+        self.deduplicator: TranscriptDeduplicator | None = None
 
     @property
     def role(self) -> AgentRole:
@@ -56,24 +60,27 @@ When rendering your verdict, provide:
 - Key reasoning that led to your decision
 - Acknowledgment of valid dissenting points"""
 
-    async def act(self, state: DebateState) -> DebateMessage:
+    async def act(
+        self,
+        state: DebateState,
+        on_token: TokenCallback | None = None,
+    ) -> DebateMessage:
         """Evaluate the debate and render a verdict.
 
         Args:
             state: Current debate state.
+            on_token: Optional callback for streamed response chunks.
 
         Returns:
             DebateMessage with the verdict.
         """
         assert self.provider is not None, "Judge requires a provider"
-        messages = self._build_prompt(state)
+        prompt_state, metadata = await self._compact(state)
+        messages = self._build_prompt(prompt_state)
+        if self.deduplicator is not None:
+            metadata["transcript_tokens_saved"] = self._tokens_saved(prompt_state)
 
-        response = await self.provider.generate(
-            messages=messages,
-            model=self.model,
-            temperature=self.temperature,
-            system=self.system_prompt,
-        )
+        response = await self._generate(messages, on_token)
 
         return self._create_response_message(
             content=response["content"],
@@ -82,6 +89,8 @@ When rendering your verdict, provide:
             output_tokens=response["output_tokens"],
             cost=response["cost"],
             latency_ms=response["latency_ms"],
+            **metadata,
+            **response.get("metadata", {}),
         )
 
     def _build_prompt(self, state: DebateState) -> list[dict[str, str]]:
@@ -103,11 +112,12 @@ When rendering your verdict, provide:
         prompt += "\n\n## Debate Transcript\n"
 
         # Add all debate messages
-        for msg in state["messages"]:
-            if msg["agent_role"] == "debater":
-                prompt += f"\n### {msg['agent_id']} (Round {msg['round']})\n"
-                prompt += msg["content"]
-                prompt += "\n"
+        debater_messages = [m for m in state["messages"] if m["agent_role"] == "debater"]
+        if self.deduplicator is None:
+            prompt += self._render_transcript(debater_messages)
+        else:
+            contents = self.deduplicator.compress(debater_messages)
+            prompt += self._render_transcript(debater_messages, contents)
 
         messages.append({"role": "user", "content": prompt})
 
@@ -132,6 +142,45 @@ Ensure the JSON is valid and complete."""
 
         return messages
 
+    @staticmethod
+    def _render_transcript(
+        messages: list[DebateMessage],
+        contents: list[str] | None = None,
+    ) -> str:
+        """Render debater messages, optionally with replacement contents.
+
+        Args:
+            messages: Debater messages, oldest first.
+            contents: Content to show for each message (defaults to its own).
+
+        Returns:
+            The transcript section of the prompt.
+        """
+        if contents is None:
+            contents = [msg["content"] for msg in messages]
+        transcript = ""
+        for msg, content in zip(messages, contents, strict=True):
+            transcript += f"\n### {msg['agent_id']} (Round {msg['round']})\n"
+            transcript += content
+            transcript += "\n"
+        return transcript
+
+    def _tokens_saved(self, state: DebateState) -> int:
+        """Measure the transcript tokens removed by deduplication.
+
+        Args:
+            state: Debate state the prompt was built from.
+
+        Returns:
+            Verbatim transcript tokens minus compressed transcript tokens.
+        """
+        assert self.deduplicator is not None
+        messages = [m for m in state["messages"] if m["agent_role"] == "debater"]
+        provider = self.provider.name if self.provider is not None else None
+        verbatim = self._render_transcript(messages)
+        compressed = self._render_transcript(messages, self.deduplicator.compress(messages))
+        return count_tokens(verbatim, provider) - count_tokens(compressed, provider)
+
     def parse_verdict(self, content: str) -> dict[str, Any]:
         """Parse the judge's verdict from response content.
 
@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 import json
+import time
 from typing import TYPE_CHECKING, Any
 
 from mad.agents.base import AgentRole, BaseAgent
-from mad.core.state import DebateMessage, DebateState
+from mad.core.state import DebateMessage, DebateState, create_message
 
 if TYPE_CHECKING:
-    from mad.providers.base import LLMProvider
+    from mad.agents.consensus import LexicalConsensus
+    from mad.providers.base import LLMProvider, TokenCallback
 
 
 class ModeratorAgent(BaseAgent):
@@ -36,6 +38,8 @@ class ModeratorAgent(BaseAgent):
         """
         super().__init__(agent_id, provider, model, system_prompt, temperature)
         self.consensus_threshold = consensus_threshold
+        # Local estimate that settles clear-cut rounds (set by the orchestrator)
+        self.precheck: LexicalConsensus | None = None
 
     @property
     def role(self) -> AgentRole:
@@ -56,24 +60,38 @@ You should recommend stopping the debate early if:
 - No new information is being presented
 - The positions have stabilized"""
 
-    async def act(self, state: DebateState) -> DebateMessage:
+    async def act(
+        self,
+        state: DebateState,
+        on_token: TokenCallback | None = None,
+    ) -> DebateMessage:
         """Evaluate the current debate round and provide moderation.
 
         Args:
             state: Current debate state.
+            on_token: Optional callback for streamed response chunks.
 
         Returns:
             DebateMessage with moderation decision.
         """
         assert self.provider is not None, "Moderator requires a provider"
+        start_time = time.perf_counter()
+        local_score = None
+        if self.precheck is not None:
+            local_score = self.precheck.round_score(state)
+            if local_score is not None and self.precheck.decisive(local_score):
+                return self._local_moderation(state, local_score, start_time, on_token)
+
         messages = self._build_prompt(state)
 
-        response = await self.provider.generate(
-            messages=messages,
-            model=self.model,
-            temperature=self.temperature,
-            system=self.system_prompt,
-        )
+        response = await self._generate(messages, on_token)
+
+        metadata: dict[str, Any] = {}
+        if self.precheck is not None and local_score is not None:
+            metadata["local_consensus_score"] = local_score
+            llm_score = self.parse_moderation(response["content"]).get("consensus_score")
+            if isinstance(llm_score, int | float):
+                self.precheck.record(local_score, float(llm_score))
 
         return self._create_response_message(
             content=response["content"],
@@ -82,6 +100,52 @@ You should recommend stopping the debate early if:
             output_tokens=response["output_tokens"],
             cost=response["cost"],
             latency_ms=response["latency_ms"],
+            **metadata,
+            **response.get("metadata", {}),
+        )
+
+    def _local_moderation(
+        self,
+        state: DebateState,
+        score: float,
+        start_time: float,
+        on_token: TokenCallback | None = None,
+    ) -> DebateMessage:
+        """Build a moderation message from the local consensus estimate.
+
+        Args:
+            state: Current debate state.
+            score: Local consensus score.
+            start_time: ``perf_counter`` value when moderation started.
+            on_token: Optional callback, sent the whole message as one chunk.
+
+        Returns:
+            DebateMessage in the moderator's JSON format, at zero cost.
+        """
+        content = json.dumps(
+            {
+                "consensus_score": round(score, 3),
+                "should_continue": True,
+                "reasoning": "Local lexical consensus estimate; LLM moderation skipped",
+                "key_disagreements": [],
+                "key_agreements": [],
+                "quality_score": 0.5,
+            }
+        )
+        if on_token is not None:
+            on_token(content)
+        return create_message(
+            agent_id=self.agent_id,
+            agent_role=self.role,
+            provider="local",
+            model="lexical",
+            content=content,
+            current_round=state["current_round"],
+            input_tokens=0,
+            output_tokens=0,
+            cost=0.0,
+            latency_ms=(time.perf_counter() - start_time) * 1000,
+            consensus_source="local",
         )
 
     def _build_prompt(self, state: DebateState) -> list[dict[str, str]]:
@@ -139,7 +203,8 @@ Ensure the JSON is valid."""
 
         return messages
 
-    def parse_moderation(self, content: str) -> dict[str, Any]:
+    @staticmethod
+    def parse_moderation(content: str) -> dict[str, Any]:
         """Parse the moderator's assessment from response content.
 
         Args:
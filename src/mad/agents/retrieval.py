@@ -0,0 +1,232 @@
+"""Per-perspective retrieval over large debate contexts."""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+
+from mad.agents.moderator import ModeratorAgent
+from mad.core.state import DebateState
+from mad.tokens import Tokenizer, count_tokens, get_tokenizer
+
+# Words, split at underscores, camelCase humps and digits
+_TERM_RE = re.compile(r"[A-Z]?[a-z]+|[A-Z]+(?![a-z])|\d+")
+
+# Debates whose context index is kept in memory
+INDEX_CACHE_SIZE = 64
+
+
+def terms(text: str) -> list[str]:
+    """Split text (prose or code) into lowercase search terms."""
+    return [term.lower() for term in _TERM_RE.findall(text)]
+
+
+@dataclass
+class Chunk:
+    """A contiguous run of context lines."""
+
+    start_line: int  # 1-based
+    end_line: int
+    text: str
+
+
+def split_text(text: str, max_tokens: int, tokenizer: Tokenizer) -> list[str]:
+    """Split text into pieces of at most ``max_tokens``, preferring whitespace.
+
+    Args:
+        text: Text to split, usually one long line.
+        max_tokens: Token limit per piece.
+        tokenizer: Tokenizer used to measure pieces.
+
+    Returns:
+        Pieces that concatenate back to ``text``.
+    """
+    if len(text) <= 1 or tokenizer.count(text) <= max_tokens:
+        return [text]
+    middle = len(text) // 2
+    cut = max(text.rfind(" ", 0, middle), text.rfind("\n", 0, middle)) + 1
+    if cut <= 0:
+        cut = middle
+    return split_text(text[:cut], max_tokens, tokenizer) + split_text(
+        text[cut:], max_tokens, tokenizer
+    )
+
+
+def chunk_context(context: str, chunk_tokens: int, provider: str | None = None) -> list[Chunk]:
+    """Split context into chunks of about ``chunk_tokens`` at line boundaries.
+
+    Args:
+        context: Context text, typically source files.
+        chunk_tokens: Target tokens per chunk. A longer line is split into
+            pieces that each become a chunk.
+        provider: Provider name whose tokenizer sizes the chunks.
+
+    Returns:
+        Chunks in document order.
+    """
+    tokenizer = get_tokenizer(provider)
+    chunks: list[Chunk] = []
+    lines: list[str] = []
+    tokens = 0
+    start = 1
+    for number, line in enumerate(context.splitlines(), start=1):
+        line_tokens = tokenizer.count(line) + 1
+        if lines and (tokens + line_tokens > chunk_tokens or line_tokens > chunk_tokens):
+            chunks.append(Chunk(start, number - 1, "\n".join(lines)))
+            lines, tokens, start = [], 0, number
+        if line_tokens > chunk_tokens:
+            chunks.extend(
+                Chunk(number, number, piece)
+                for piece in split_text(line, chunk_tokens - 1, tokenizer)
+            )
+            start = number + 1
+            continue
+        lines.append(line)
+        tokens += line_tokens
+    if lines:
+        chunks.append(Chunk(start, start + len(lines) - 1, "\n".join(lines)))
+    return chunks
+
+
+class BM25Index:
+    """Okapi BM25 ranking over a fixed set of chunks."""
+
+    def __init__(self, chunks: list[Chunk], k1: float = 1.5, b: float = 0.75) -> None:
+        """Index chunks.
+
+        Args:
+            chunks: Chunks to rank.
+            k1: Term-frequency saturation.
+            b: Document-length normalization.
+        """
+        self.chunks = chunks
+        self.k1 = k1
+        self.b = b
+        self._lengths: list[int] = []
+        self._postings: dict[str, list[tuple[int, int]]] = {}
+        for index, chunk in enumerate(chunks):
+            counts = Counter(terms(chunk.text))
+            self._lengths.append(sum(counts.values()))
+            for term, tf in counts.items():
+                self._postings.setdefault(term, []).append((index, tf))
+        self._avg_length = sum(self._lengths) / len(chunks) if chunks else 0.0
+
+    def scores(self, query: str) -> list[float]:
+        """Return the BM25 score of every chunk for a query."""
+        scores = [0.0] * len(self.chunks)
+        n = len(self.chunks)
+        for term in set(terms(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+            for index, tf in postings:
+                norm = 1 - self.b + self.b * self._lengths[index] / self._avg_length
+                scores[index] += idf * tf * (self.k1 + 1) / (tf + self.k1 * norm)
+        return scores
+
+
+def open_disagreements(state: DebateState) -> list[str]:
+    """Return the key disagreements from the latest moderator assessment."""
+    for message in reversed(state["messages"]):
+        if message["agent_role"] == "moderator":
+            disagreements = ModeratorAgent.parse_moderation(message["content"])
+            return [str(d) for d in disagreements.get("key_disagreements", [])]
+    return []
+
+
+class ContextRetriever:
+    """Selects the parts of a large context relevant to one debater.
+
+    The context is chunked and indexed once per debate. Contexts within
+    ``budget_tokens`` are passed through unchanged; larger ones are reduced
+    to the ``top_k`` best-ranked chunks that fit the budget, shown in
+    document order with their line numbers.
+    """
+
+    def __init__(
+        self,
+        budget_tokens: int = 2000,
+        top_k: int = 8,
+        chunk_tokens: int = 200,
+    ) -> None:
+        """Initialize the retriever.
+
+        Args:
+            budget_tokens: Maximum context tokens given to each debater.
+            top_k: Maximum chunks selected per prompt.
+            chunk_tokens: Target tokens per chunk.
+        """
+        self.budget_tokens = budget_tokens
+        self.top_k = top_k
+        self.chunk_tokens = chunk_tokens
+        self._indexes: OrderedDict[tuple[str, str | None], tuple[str, BM25Index]] = OrderedDict()
+
+    def index(self, state: DebateState, provider: str | None = None) -> BM25Index:
+        """Return the debate's context index, building it on first use.
+
+        Chunks are sized with the provider's tokenizer, so each provider in a
+        debate gets its own index.
+        """
+        key = (state.get("debate_id", ""), provider)
+        context = state["context"] or ""
+        cached = self._indexes.get(key)
+        if cached is None or cached[0] != context:
+            chunks = chunk_context(context, self.chunk_tokens, provider)
+            cached = (context, BM25Index(chunks))
+            self._indexes[key] = cached
+        self._indexes.move_to_end(key)
+        while len(self._indexes) > INDEX_CACHE_SIZE:
+            self._indexes.popitem(last=False)
+        return cached[1]
+
+    def select(self, state: DebateState, query: str, provider: str | None = None) -> str:
+        """Return the context to show for a query, within the token budget.
+
+        Args:
+            state: Current debate state.
+            query: What the debater is looking for (perspective, topic,
+                open disagreements).
+            provider: Provider name whose tokenizer sizes the budget.
+
+        Returns:
+            The whole context if it fits the budget, otherwise the selected
+            excerpts.
+        """
+        context = state["context"] or ""
+        if count_tokens(context, provider) <= self.budget_tokens:
+            return context
+
+        index = self.index(state, provider)
+        scores = index.scores(query)
+        ranked = sorted(range(len(index.chunks)), key=lambda i: (-scores[i], i))
+        if scores and scores[ranked[0]] == 0.0:
+            ranked = list(range(len(index.chunks)))  # nothing matched: keep the head
+
+        selected: list[int] = []
+        used = 0
+        for i in ranked:
+            if len(selected) == self.top_k:
+                break
+            tokens = count_tokens(index.chunks[i].text, provider)
+            if used + tokens <= self.budget_tokens:
+                selected.append(i)
+                used += tokens
+
+        texts = {i: index.chunks[i].text for i in selected}
+        if not selected and ranked:
+            # Even the best chunk is over budget: show its head rather than nothing
+            best = ranked[0]
+            pieces = split_text(
+                index.chunks[best].text, self.budget_tokens, get_tokenizer(provider)
+            )
+            selected, texts = [best], {best: pieces[0]}
+
+        excerpts = [
+            f"[lines {index.chunks[i].start_line}-{index.chunks[i].end_line}]\n{texts[i]}"
+            for i in sorted(selected)
+        ]
+        header = f"(Excerpts: {len(selected)} of {len(index.chunks)} sections)"
+        return "\n\n".join([header, *excerpts])
@@ -0,0 +1,143 @@
+"""Process-wide cache of compiled debate graphs for MAD Framework."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from langgraph.graph.state import CompiledStateGraph
+
+    from mad.agents.debater import DebaterAgent
+    from mad.agents.judge import JudgeAgent
+    from mad.agents.moderator import ModeratorAgent
+    from mad.core.config import DebateConfig, MADConfig
+    from mad.core.state import DebateState
+
+
+@dataclass
+class CompiledDebate:
+    """Agents and compiled graph built for one debate configuration."""
+
+    debaters: list[DebaterAgent]
+    judge: JudgeAgent
+    moderator: ModeratorAgent | None
+    graph: CompiledStateGraph[DebateState]
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss statistics for a GraphCache."""
+
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def config_cache_key(
+    config: DebateConfig,
+    global_config: MADConfig,
+    extra: object = None,
+) -> str:
+    """Return a canonical hash of a debate configuration.
+
+    Equal configurations hash equally regardless of how they were built
+    (keyword order, dicts vs. config objects, presets).
+
+    Args:
+        config: Debate configuration.
+        global_config: Global configuration (supplies default debaters).
+        extra: Additional JSON-serializable data to include in the key.
+
+    Returns:
+        Hex digest identifying the configuration.
+    """
+    payload: dict[str, Any] = {
+        "config": config.model_dump(mode="json"),
+        "default_provider": global_config.default_provider,
+        "default_model": global_config.default_model,
+        "extra": extra,
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class GraphCache:
+    """Thread-safe LRU cache of CompiledDebate objects keyed by config hash."""
+
+    def __init__(self, maxsize: int = 32) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries before the least recently
+                used entry is evicted.
+        """
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, CompiledDebate] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get_or_create(self, key: str, factory: Callable[[], CompiledDebate]) -> CompiledDebate:
+        """Return the cached entry for key, building it with factory on a miss.
+
+        Args:
+            key: Cache key (see config_cache_key).
+            factory: Callable that builds the entry.
+
+        Returns:
+            The cached or newly built entry.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry
+            self._misses += 1
+
+        entry = factory()
+
+        with self._lock:
+            # Another thread may have built the same entry meanwhile
+            existing = self._entries.get(key)
+            if existing is not None:
+                self._entries.move_to_end(key)
+                return existing
+            self._entries[key] = entry
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return entry
+
+    def stats(self) -> CacheStats:
+        """Return current hit/miss statistics."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._entries),
+                maxsize=self.maxsize,
+            )
+
+    def clear(self) -> None:
+        """Remove all entries and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+# Shared by every MAD instance in the process
+graph_cache = GraphCache()
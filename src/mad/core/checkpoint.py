@@ -0,0 +1,43 @@
+"""Durable checkpointing for MAD Framework debates."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+
+def sqlite_checkpointer(path: str | Path) -> AsyncSqliteSaver:
+    """Create a checkpointer that persists debate state to a local SQLite file.
+
+    The debate graph saves its state after every node, so a debate
+    interrupted by a crash can be resumed with ``MAD.resume``. The returned
+    checkpointer owns a database connection; close it with
+    ``await checkpointer.conn.close()`` (``MAD.aclose`` does this for
+    checkpointers it created).
+
+    Requires the optional ``sqlite`` extra
+    (``pip install mad-framework[sqlite]``).
+
+    Args:
+        path: Path to the SQLite database file (created if missing).
+
+    Returns:
+        An async SQLite checkpointer for ``create_debate_graph``.
+
+    Raises:
+        ImportError: If langgraph-checkpoint-sqlite is not installed.
+    """
+    try:
+        import aiosqlite
+        from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+    except ImportError as e:
+        msg = (
+            "SQLite checkpointing requires 'langgraph-checkpoint-sqlite'. "
+            "Install it with: pip install mad-framework[sqlite]"
+        )
+        raise ImportError(msg) from e
+
+    return AsyncSqliteSaver(aiosqlite.connect(str(path)))
@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
-from typing import Literal
+from typing import Literal, Self
 
-from pydantic import Field
+from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# "_http" variants call vendor APIs directly over a pooled httpx client;
+# "openai_compatible" targets self-hosted servers via base_url
+ProviderName = Literal[
+    "anthropic", "openai", "google", "anthropic_http", "openai_http", "openai_compatible"
+]
+AgentRole = Literal["debater", "judge", "moderator"]
+
 
 class MADConfig(BaseSettings):
     """Global configuration for MAD Framework."""
@@ -19,19 +26,23 @@ class MADConfig(BaseSettings):
     )
 
     # Defaults
-    default_provider: Literal["anthropic", "openai", "google"] = "anthropic"
+    default_provider: ProviderName = "anthropic"
     default_model: str = "claude-sonnet-4-20250514"
     max_rounds: int = Field(default=3, ge=1, le=10)
     log_level: str = "INFO"
 
+    # Retries for rate limits, overloads and transient errors (0 disables)
+    max_retries: int = Field(default=3, ge=0)
+
 
 class DebaterConfig(BaseSettings):
     """Configuration for a single debater agent."""
 
     model_config = SettingsConfigDict(extra="ignore")
 
-    provider: Literal["anthropic", "openai", "google"] = "anthropic"
+    provider: ProviderName = "anthropic"
     model: str = "claude-sonnet-4-20250514"
+    base_url: str | None = None  # API base URL for HTTP providers
     perspective: str | None = None
     temperature: float = Field(default=0.7, ge=0.0, le=2.0)
     system_prompt: str | None = None
@@ -42,11 +53,87 @@ class JudgeConfig(BaseSettings):
 
     model_config = SettingsConfigDict(extra="ignore")
 
-    provider: Literal["anthropic", "openai", "google"] = "anthropic"
+    provider: ProviderName = "anthropic"
     model: str = "claude-sonnet-4-20250514"
+    base_url: str | None = None  # API base URL for HTTP providers
     temperature: float = Field(default=0.3, ge=0.0, le=2.0)
     system_prompt: str | None = None
 
+    # Collapse transcript paragraphs at least this similar (MinHash estimate)
+    dedup_threshold: float | None = Field(default=None, gt=0.0, le=1.0)
+
+
+class ModeratorConfig(BaseSettings):
+    """Configuration for the moderator agent."""
+
+    model_config = SettingsConfigDict(extra="ignore")
+
+    provider: ProviderName = "anthropic"
+    model: str = "claude-sonnet-4-20250514"
+    base_url: str | None = None  # API base URL for HTTP providers
+
+
+class RouteConfig(BaseSettings):
+    """A candidate provider/model for a routed role."""
+
+    model_config = SettingsConfigDict(extra="ignore")
+
+    provider: ProviderName = "anthropic"
+    model: str = "claude-sonnet-4-20250514"
+    base_url: str | None = None  # API base URL for HTTP providers
+
+
+class RouterConfig(BaseSettings):
+    """Latency- and cost-aware routing across candidate models for one role."""
+
+    model_config = SettingsConfigDict(extra="ignore")
+
+    candidates: list[RouteConfig] = Field(min_length=1)
+    policy: Literal["fastest", "cheapest", "cheapest_under_p95"] = "fastest"
+    p95_target_ms: float | None = Field(default=None, gt=0.0)  # for cheapest_under_p95
+
+
+class CompactionConfig(BaseSettings):
+    """Summarizing old rounds once an agent's prompt grows past a budget."""
+
+    model_config = SettingsConfigDict(extra="ignore")
+
+    provider: ProviderName = "anthropic"
+    model: str = "claude-3-5-haiku-latest"  # cheap summarizer
+    base_url: str | None = None  # API base URL for HTTP providers
+    budget_tokens: int = Field(ge=1)  # estimated prompt size that triggers compaction
+    keep_rounds: int = Field(default=1, ge=1)  # most recent rounds kept verbatim
+    max_summary_tokens: int = Field(default=256, ge=1)
+
+
+class RetrievalConfig(BaseSettings):
+    """Showing each debater only the context chunks relevant to its perspective."""
+
+    model_config = SettingsConfigDict(extra="ignore")
+
+    budget_tokens: int = Field(default=2000, ge=1)  # larger contexts are narrowed
+    top_k: int = Field(default=8, ge=1)  # chunks per prompt
+    chunk_tokens: int = Field(default=200, ge=1)
+
+
+class ConsensusPrecheckConfig(BaseSettings):
+    """Local lexical consensus estimate that settles clear-cut rounds."""
+
+    model_config = SettingsConfigDict(extra="ignore")
+
+    # Local scores outside [decide_below, decide_above] skip the LLM moderator
+    decide_below: float = Field(default=0.2, ge=0.0, le=1.0)
+    decide_above: float = Field(default=0.85, ge=0.0, le=1.0)
+    # Fraction of clear-cut rounds still sent to the LLM for calibration
+    calibration_rate: float = Field(default=0.0, ge=0.0, le=1.0)
+
+    @model_validator(mode="after")
+    def _check_band(self) -> Self:
+        if self.decide_below > self.decide_above:
+            msg = "decide_below must not exceed decide_above"
+            raise ValueError(msg)
+        return self
+
 
 class DebateConfig(BaseSettings):
     """Configuration for a debate session."""
@@ -62,11 +149,48 @@ class DebateConfig(BaseSettings):
     # Judge
     judge: JudgeConfig = Field(default_factory=JudgeConfig)
 
+    # Moderator (defaults to the judge's provider and model)
+    moderator: ModeratorConfig | None = None
+
     # Debate parameters
     max_rounds: int = Field(default=3, ge=1, le=10)
     early_stop_on_consensus: bool = True
     consensus_threshold: float = Field(default=0.8, ge=0.0, le=1.0)
 
+    # Execution settings
+    parallel_debaters: bool = False
+    max_concurrency: int | None = Field(default=None, ge=1)
+    speculative_rounds: bool = False
+
+    # Latency budget: past it, skip remaining rounds and go to the judge
+    deadline_ms: int | None = Field(default=None, ge=1)
+
+    # Spend limit: past it, skip remaining rounds (or the verdict) entirely
+    max_cost_usd: float | None = Field(default=None, gt=0.0)
+
+    # Duplicate provider calls slower than this latency percentile (0-1)
+    hedge_percentile: float | None = Field(default=None, gt=0.0, lt=1.0)
+
+    # Persist state after every node to this SQLite file (enables MAD.resume)
+    checkpoint_path: str | None = None
+
+    # Serve identical prompts from cache for these roles (opt-in, zero cost)
+    response_cache_roles: list[AgentRole] = Field(default_factory=list)
+    response_cache_path: str | None = None  # SQLite disk tier (memory-only if None)
+    response_cache_ttl_s: float = Field(default=86400.0, gt=0.0)
+
+    # Route these roles across candidate models instead of their own provider/model
+    routing: dict[AgentRole, RouterConfig] = Field(default_factory=dict)
+
+    # Summarize rounds older than keep_rounds once prompts pass budget_tokens
+    compaction: CompactionConfig | None = None
+
+    # Give debaters BM25-ranked excerpts of contexts larger than budget_tokens
+    retrieval: RetrievalConfig | None = None
+
+    # Estimate consensus locally and call the moderator only when unclear
+    consensus_precheck: ConsensusPrecheckConfig | None = None
+
     # Output settings
     include_reasoning: bool = True
     include_dissenting: bool = True
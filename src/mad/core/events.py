@@ -0,0 +1,35 @@
+"""Streaming event definitions for MAD Framework."""
+
+from __future__ import annotations
+
+from typing import Any, Literal, TypedDict
+
+from mad.core.state import DebateMessage
+
+
+class TokenEvent(TypedDict):
+    """A chunk of an agent's response as it is generated."""
+
+    type: Literal["token"]
+    agent_id: str
+    agent_role: str
+    round: int
+    content: str
+
+
+class MessageEvent(TypedDict):
+    """A complete agent message, emitted as soon as the agent finishes."""
+
+    type: Literal["message"]
+    message: DebateMessage
+
+
+class UpdateEvent(TypedDict):
+    """A state update produced by a graph node."""
+
+    type: Literal["update"]
+    node: str
+    update: dict[str, Any]
+
+
+DebateEvent = TokenEvent | MessageEvent | UpdateEvent
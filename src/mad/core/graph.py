@@ -2,24 +2,229 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Literal
 
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.config import get_stream_writer
 from langgraph.graph import END, StateGraph
 from langgraph.graph.state import CompiledStateGraph
+from langgraph.types import StreamWriter
 
-from mad.core.state import DebateState
+from mad.core.events import MessageEvent, TokenEvent
+from mad.core.state import DebateMessage, DebateState
 
 if TYPE_CHECKING:
+    from mad.agents.base import BaseAgent
     from mad.agents.debater import DebaterAgent
     from mad.agents.judge import JudgeAgent
     from mad.agents.moderator import ModeratorAgent
 
 
+def get_event_writer(config: RunnableConfig | None) -> StreamWriter | None:
+    """Return the stream writer if token streaming was requested for this run.
+
+    Token streaming is requested by passing ``{"stream_tokens": True}`` in
+    the run's ``configurable`` and streaming with the "custom" mode.
+    """
+    if not (config or {}).get("configurable", {}).get("stream_tokens"):
+        return None
+    return get_stream_writer()
+
+
+async def run_agent(
+    agent: BaseAgent,
+    state: DebateState,
+    writer: StreamWriter | None = None,
+) -> DebateMessage:
+    """Run one agent, streaming its tokens and final message to writer.
+
+    Args:
+        agent: Agent to run.
+        state: Current debate state.
+        writer: Optional stream writer for TokenEvent/MessageEvent output.
+
+    Returns:
+        The agent's message.
+    """
+    if writer is None:
+        return await agent.act(state)
+
+    def on_token(chunk: str) -> None:
+        writer(
+            TokenEvent(
+                type="token",
+                agent_id=agent.agent_id,
+                agent_role=agent.role,
+                round=state["current_round"],
+                content=chunk,
+            )
+        )
+
+    message = await agent.act(state, on_token=on_token)
+    writer(MessageEvent(type="message", message=message))
+    return message
+
+
+async def run_debaters(
+    debaters: list[DebaterAgent],
+    state: DebateState,
+    parallel: bool = False,
+    max_concurrency: int | None = None,
+    writer: StreamWriter | None = None,
+) -> list[DebateMessage]:
+    """Run every debater once against the same state.
+
+    All debaters in a round see the same snapshot of the debate, so running
+    them concurrently does not change what any of them is prompted with.
+    Messages are always returned in debater order.
+
+    Args:
+        debaters: List of debater agents.
+        state: Current debate state.
+        parallel: Whether to run the debaters concurrently.
+        max_concurrency: Maximum number of in-flight debater calls
+            (None for no limit). Only used when parallel is True.
+        writer: Optional stream writer for token and message events.
+
+    Returns:
+        One message per debater, in debater order.
+    """
+    if not parallel:
+        return [await run_agent(debater, state, writer) for debater in debaters]
+
+    # A failing (or cancelled) round cancels the other debaters' calls
+    tasks = start_debaters(debaters, state, parallel, max_concurrency, writer)
+    try:
+        messages, _ = await collect_debaters(tasks)
+    except BaseException:
+        await cancel_debaters(tasks)
+        raise
+    return messages
+
+
+def start_debaters(
+    debaters: list[DebaterAgent],
+    state: DebateState,
+    parallel: bool = False,
+    max_concurrency: int | None = None,
+    writer: StreamWriter | None = None,
+) -> list[asyncio.Task[DebateMessage]]:
+    """Start one task per debater without waiting for them.
+
+    Sequential mode is kept by letting only one task run at a time, in
+    debater order.
+
+    Args:
+        debaters: List of debater agents.
+        state: Debate state the debaters should act on.
+        parallel: Whether the debaters may run concurrently.
+        max_concurrency: Maximum number of in-flight debater calls
+            (None for no limit). Only used when parallel is True.
+        writer: Optional stream writer for token and message events.
+
+    Returns:
+        One task per debater, in debater order.
+    """
+    limit = (max_concurrency or len(debaters) or 1) if parallel else 1
+    semaphore = asyncio.Semaphore(limit)
+
+    async def act(debater: DebaterAgent) -> DebateMessage:
+        async with semaphore:
+            return await run_agent(debater, state, writer)
+
+    return [asyncio.ensure_future(act(debater)) for debater in debaters]
+
+
+async def collect_debaters(
+    tasks: list[asyncio.Task[DebateMessage]],
+    timeout: float | None = None,
+) -> tuple[list[DebateMessage], bool]:
+    """Wait for debater tasks, cancelling any still running at the timeout.
+
+    Args:
+        tasks: Tasks returned by start_debaters.
+        timeout: Seconds to wait (None to wait indefinitely).
+
+    Returns:
+        Messages of the finished tasks in debater order, and whether the
+        timeout cut the round short.
+    """
+    if timeout is not None and timeout <= 0:
+        return await cancel_debaters(tasks), True
+
+    _, pending = await asyncio.wait(tasks, timeout=timeout, return_when=asyncio.FIRST_EXCEPTION)
+    failed = next(
+        (task for task in tasks if task.done() and not task.cancelled() and task.exception()),
+        None,
+    )
+    if failed is not None:
+        await cancel_debaters(tasks)
+        failed.result()  # re-raise the debater's error
+    if pending:
+        return await cancel_debaters(tasks), True
+    return [task.result() for task in tasks], False
+
+
+async def cancel_debaters(
+    tasks: list[asyncio.Task[DebateMessage]],
+) -> list[DebateMessage]:
+    """Cancel debater tasks, keeping the messages of those that finished.
+
+    Args:
+        tasks: Tasks returned by start_debaters.
+
+    Returns:
+        Messages from tasks that completed before cancellation.
+    """
+    finished = [
+        task.result()
+        for task in tasks
+        if task.done() and not task.cancelled() and task.exception() is None
+    ]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return finished
+
+
+def accumulate_usage(
+    messages: list[DebateMessage],
+    total_tokens: int,
+    total_cost: float,
+) -> tuple[int, float]:
+    """Add the token and cost metadata of messages to running totals.
+
+    Args:
+        messages: Messages whose metadata should be counted.
+        total_tokens: Running token total.
+        total_cost: Running cost total in USD.
+
+    Returns:
+        Updated (total_tokens, total_cost).
+    """
+    for message in messages:
+        total_tokens += message["metadata"].get("input_tokens", 0)
+        total_tokens += message["metadata"].get("output_tokens", 0)
+        total_cost += message["metadata"].get("cost", 0.0)
+        # Summaries generated by transcript compaction for this message
+        total_tokens += message["metadata"].get("compaction_tokens", 0)
+        total_cost += message["metadata"].get("compaction_cost", 0.0)
+    return total_tokens, total_cost
+
+
 def create_debate_graph(
     debaters: list[DebaterAgent],
     judge: JudgeAgent,
     moderator: ModeratorAgent | None = None,
+    parallel: bool = False,
+    max_concurrency: int | None = None,
+    checkpointer: BaseCheckpointSaver[Any] | None = None,
+    speculative: bool = False,
+    deadline_ms: int | None = None,
+    max_cost_usd: float | None = None,
 ) -> CompiledStateGraph[DebateState]:
     """Create a LangGraph StateGraph for debate orchestration.
 
@@ -27,6 +232,30 @@ def create_debate_graph(
         debaters: List of debater agents.
         judge: Judge agent for final verdict.
         moderator: Optional moderator agent for flow control.
+        parallel: Run the debaters of a round concurrently.
+        max_concurrency: Maximum concurrent debater calls per round
+            when parallel is enabled (None for no limit).
+        checkpointer: Optional checkpointer that persists the state after
+            every node. Runs must then pass a ``thread_id`` in their
+            ``configurable`` config.
+        speculative: Start the next round's debaters while the moderator
+            is still evaluating the current round. Their messages are kept
+            if the moderator continues the debate; otherwise they are
+            cancelled and any spend is recorded as speculative waste.
+            Speculative debaters do not see the moderator's message for the
+            round they follow. Requires a moderator.
+        deadline_ms: Optional latency budget for the debate, measured from
+            initialization. Debater and moderator calls that would overrun
+            it are cancelled and the debate goes straight to the judge with
+            the transcript so far, marked ``deadline_truncated``. The judge
+            always runs.
+        max_cost_usd: Optional hard spend limit. Before each round,
+            moderator call and judge call the agents estimate their prompt's
+            input cost; if the next calls plus the judge would exceed the
+            budget, the debate skips to the judge, and if even the judge
+            would exceed it the debate ends without a verdict. Either way it
+            is marked ``budget_exhausted``. Output tokens are not estimated,
+            so the limit can still be overshot by one call's output.
 
     Returns:
         Compiled StateGraph ready for execution.
@@ -42,35 +271,107 @@ def create_debate_graph(
             "start_time": datetime.now().isoformat(),
         }
 
+    def time_left(state: DebateState) -> float | None:
+        """Return seconds until the deadline (None when there is none)."""
+        if deadline_ms is None:
+            return None
+        started = datetime.fromisoformat(state["start_time"])
+        elapsed = (datetime.now() - started).total_seconds()
+        return deadline_ms / 1000 - elapsed
+
+    def discard_speculation(
+        state: DebateState,
+        wasted: list[DebateMessage],
+        cancelled: int,
+        update: dict[str, Any],
+    ) -> None:
+        """Add the spend of a discarded speculative round to update's totals."""
+        # Finished speculative calls were paid for; cancelled ones may
+        # have been billed for input but report no usage.
+        wasted_tokens, wasted_cost = accumulate_usage(wasted, 0, 0.0)
+        update["total_tokens"] += wasted_tokens
+        update["total_cost"] += wasted_cost
+        update["speculative_wasted_tokens"] = (
+            state.get("speculative_wasted_tokens", 0) + wasted_tokens
+        )
+        update["speculative_wasted_cost"] = state.get("speculative_wasted_cost", 0.0) + wasted_cost
+        update["speculative_cancelled_calls"] = (
+            state.get("speculative_cancelled_calls", 0) + cancelled
+        )
+
+    def over_budget(state: DebateState, *estimates: float) -> bool:
+        """Return True if spending the estimated costs would exceed the budget."""
+        if max_cost_usd is None:
+            return False
+        return state.get("total_cost", 0.0) + sum(estimates) > max_cost_usd
+
+    def truncate(
+        state: DebateState,
+        messages: list[DebateMessage],
+        reason: Literal["deadline_truncated", "budget_exhausted"] = "deadline_truncated",
+    ) -> dict[str, Any]:
+        """Return an update that keeps messages and short-circuits to the judge."""
+        total_tokens, total_cost = accumulate_usage(
+            messages,
+            state.get("total_tokens", 0),
+            state.get("total_cost", 0.0),
+        )
+        return {
+            "messages": messages,
+            "phase": "judge",
+            "should_continue": False,
+            reason: True,
+            "total_tokens": total_tokens,
+            "total_cost": total_cost,
+        }
+
     # Node: Run debate round (all debaters)
-    async def debate_node(state: DebateState) -> dict[str, Any]:
+    async def debate_node(state: DebateState, config: RunnableConfig) -> dict[str, Any]:
         """Execute one round of debate with all debaters."""
-        messages = []
-        total_tokens = state.get("total_tokens", 0)
-        total_cost = state.get("total_cost", 0.0)
+        writer = get_event_writer(config)
+        timeout = time_left(state)
+
+        if max_cost_usd is not None:
+            round_cost = sum(debater.estimate_input_cost(state) for debater in debaters)
+            if over_budget(state, round_cost, judge.estimate_input_cost(state)):
+                return truncate(state, [], "budget_exhausted")
 
-        for debater in debaters:
-            message = await debater.act(state)
-            messages.append(message)
+        if timeout is None:
+            messages = await run_debaters(debaters, state, parallel, max_concurrency, writer)
+        elif timeout <= 0:
+            return truncate(state, [])
+        else:
+            tasks = start_debaters(debaters, state, parallel, max_concurrency, writer)
+            messages, timed_out = await collect_debaters(tasks, timeout)
+            if timed_out:
+                return truncate(state, messages)
 
-            # Accumulate costs
-            total_tokens += message["metadata"].get("input_tokens", 0)
-            total_tokens += message["metadata"].get("output_tokens", 0)
-            total_cost += message["metadata"].get("cost", 0.0)
+        # Accumulate costs
+        total_tokens, total_cost = accumulate_usage(
+            messages,
+            state.get("total_tokens", 0),
+            state.get("total_cost", 0.0),
+        )
 
         return {
             "messages": messages,
+            "phase": "moderate",
             "total_tokens": total_tokens,
             "total_cost": total_cost,
         }
 
     # Node: Moderator review
-    async def moderate_node(state: DebateState) -> dict[str, Any]:
+    async def moderate_node(state: DebateState, config: RunnableConfig) -> dict[str, Any]:
         """Moderator evaluates the round and decides whether to continue."""
+        current = state["current_round"]
+        max_rounds = state["max_rounds"]
+        timeout = time_left(state)
+
+        if timeout is not None and timeout <= 0:
+            return truncate(state, [])
+
         if moderator is None:
             # No moderator: continue until max rounds
-            current = state["current_round"]
-            max_rounds = state["max_rounds"]
             should_continue = current < max_rounds
 
             return {
@@ -79,21 +380,79 @@ def create_debate_graph(
                 "should_continue": should_continue,
             }
 
+        next_state: DebateState = {**state, "current_round": current + 1}
+        if max_cost_usd is not None:
+            reserved = moderator.estimate_input_cost(state) + judge.estimate_input_cost(state)
+            if over_budget(state, reserved):
+                return truncate(state, [], "budget_exhausted")
+            speculate = not over_budget(
+                state,
+                reserved,
+                *(debater.estimate_input_cost(next_state) for debater in debaters),
+            )
+        else:
+            speculate = True
+
+        # Speculatively start the next round while the moderator deliberates
+        speculation: list[asyncio.Task[DebateMessage]] = []
+        if speculative and speculate and current < max_rounds:
+            speculation = start_debaters(
+                debaters, next_state, parallel, max_concurrency, get_event_writer(config)
+            )
+
         # Run moderator
-        message = await moderator.act(state)
+        try:
+            message = await asyncio.wait_for(
+                run_agent(moderator, state, get_event_writer(config)),
+                timeout=timeout,
+            )
+        except TimeoutError:
+            truncated = truncate(state, [])
+            if speculation:
+                wasted = await cancel_debaters(speculation)
+                discard_speculation(state, wasted, len(speculation) - len(wasted), truncated)
+            return truncated
+        except BaseException:
+            await cancel_debaters(speculation)
+            raise
         moderation = moderator.parse_moderation(message["content"])
 
         should_stop = moderator.should_stop_early(moderation)
-        current = state["current_round"]
-        max_rounds = state["max_rounds"]
+
+        total_tokens, total_cost = accumulate_usage(
+            [message],
+            state.get("total_tokens", 0),
+            state.get("total_cost", 0.0),
+        )
 
         if should_stop or current >= max_rounds:
-            return {
+            update: dict[str, Any] = {
                 "messages": [message],
                 "phase": "judge",
                 "should_continue": False,
                 "early_consensus": should_stop and current < max_rounds,
                 "consensus_score": moderation.get("consensus_score", 0.0),
+                "total_tokens": total_tokens,
+                "total_cost": total_cost,
+            }
+            if speculation:
+                wasted = await cancel_debaters(speculation)
+                discard_speculation(state, wasted, len(speculation) - len(wasted), update)
+            return update
+
+        if speculation:
+            # Commit the speculative round and go straight back to moderation
+            round_messages, timed_out = await collect_debaters(speculation, time_left(state))
+            total_tokens, total_cost = accumulate_usage(round_messages, total_tokens, total_cost)
+            return {
+                "messages": [message, *round_messages],
+                "phase": "judge" if timed_out else "moderate",
+                "current_round": current + 1,
+                "should_continue": not timed_out,
+                "deadline_truncated": timed_out,
+                "consensus_score": moderation.get("consensus_score", 0.0),
+                "total_tokens": total_tokens,
+                "total_cost": total_cost,
             }
 
         return {
@@ -102,19 +461,30 @@ def create_debate_graph(
             "current_round": current + 1,
             "should_continue": True,
             "consensus_score": moderation.get("consensus_score", 0.0),
+            "total_tokens": total_tokens,
+            "total_cost": total_cost,
         }
 
     # Node: Judge deliberation
-    async def judge_node(state: DebateState) -> dict[str, Any]:
+    async def judge_node(state: DebateState, config: RunnableConfig) -> dict[str, Any]:
         """Judge evaluates arguments and renders verdict."""
-        message = await judge.act(state)
+        if max_cost_usd is not None and over_budget(state, judge.estimate_input_cost(state)):
+            # Not even the verdict fits in the budget: end without one
+            return {
+                "phase": "complete",
+                "should_continue": False,
+                "budget_exhausted": True,
+                "end_time": datetime.now().isoformat(),
+            }
+
+        message = await run_agent(judge, state, get_event_writer(config))
         verdict = judge.parse_verdict(message["content"])
 
-        total_tokens = state.get("total_tokens", 0)
-        total_cost = state.get("total_cost", 0.0)
-        total_tokens += message["metadata"].get("input_tokens", 0)
-        total_tokens += message["metadata"].get("output_tokens", 0)
-        total_cost += message["metadata"].get("cost", 0.0)
+        total_tokens, total_cost = accumulate_usage(
+            [message],
+            state.get("total_tokens", 0),
+            state.get("total_cost", 0.0),
+        )
 
         return {
             "messages": [message],
@@ -134,24 +504,39 @@ def create_debate_graph(
     graph.add_node("moderate", moderate_node)
     graph.add_node("judge", judge_node)
 
-    # Define routing function
+    # Define routing functions
+    def route_after_debate(
+        state: DebateState,
+    ) -> Literal["moderate", "judge"]:
+        """Route to the judge when the round was cut short by the deadline."""
+        if state["phase"] == "judge":
+            return "judge"
+        return "moderate"
+
     def route_after_moderate(
         state: DebateState,
-    ) -> Literal["debate", "judge"]:
+    ) -> Literal["debate", "moderate", "judge"]:
         """Route based on moderation result."""
         if state["phase"] == "judge":
             return "judge"
+        if state["phase"] == "moderate":
+            # Next round already ran speculatively
+            return "moderate"
         return "debate"
 
     # Add edges
     graph.set_entry_point("initialize")
     graph.add_edge("initialize", "debate")
-    graph.add_edge("debate", "moderate")
+    graph.add_conditional_edges(
+        "debate",
+        route_after_debate,
+        {"moderate": "moderate", "judge": "judge"},
+    )
     graph.add_conditional_edges(
         "moderate",
         route_after_moderate,
-        {"debate": "debate", "judge": "judge"},
+        {"debate": "debate", "moderate": "moderate", "judge": "judge"},
     )
     graph.add_edge("judge", END)
 
-    return graph.compile()  # type: ignore[return-value]
+    return graph.compile(checkpointer=checkpointer)  # type: ignore[return-value]
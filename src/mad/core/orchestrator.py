@@ -2,19 +2,43 @@
 
 from __future__ import annotations
 
-from collections.abc import AsyncIterator
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator, Iterable
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, cast
 
+from mad.agents.compaction import TranscriptCompactor
+from mad.agents.consensus import LexicalConsensus
 from mad.agents.debater import DebaterAgent
+from mad.agents.dedup import TranscriptDeduplicator
 from mad.agents.judge import JudgeAgent
 from mad.agents.moderator import ModeratorAgent
-from mad.core.config import DebateConfig, DebaterConfig, JudgeConfig, MADConfig
+from mad.agents.retrieval import ContextRetriever
+from mad.core.cache import CompiledDebate, config_cache_key, graph_cache
+from mad.core.checkpoint import sqlite_checkpointer
+from mad.core.config import (
+    AgentRole,
+    DebateConfig,
+    DebaterConfig,
+    JudgeConfig,
+    MADConfig,
+    ModeratorConfig,
+)
+from mad.core.events import DebateEvent, UpdateEvent
 from mad.core.graph import create_debate_graph
 from mad.core.state import DebateState, create_initial_state
-from mad.providers.registry import get_provider
+from mad.providers.batch import BatchBackend, BatchCollector, BatchingProvider
+from mad.providers.hedging import hedged
+from mad.providers.registry import ProviderRegistry, get_provider
+from mad.providers.resilience import resilient
+from mad.providers.response_cache import cached, shared_response_cache
+from mad.providers.router import routed
 
 if TYPE_CHECKING:
+    from langchain_core.runnables import RunnableConfig
+    from langgraph.checkpoint.base import BaseCheckpointSaver
+
     from mad.providers.base import LLMProvider
 
 
@@ -39,6 +63,26 @@ class DebateResult:
     # Full state for debugging
     final_state: DebateState
 
+    @property
+    def debate_id(self) -> str:
+        """Return the debate id (the checkpoint thread id when checkpointing)."""
+        return self.final_state.get("debate_id", "")
+
+    @property
+    def deadline_truncated(self) -> bool:
+        """Return True if the deadline cut the debate short."""
+        return self.final_state.get("deadline_truncated", False)
+
+    @property
+    def budget_exhausted(self) -> bool:
+        """Return True if the cost budget cut the debate short."""
+        return self.final_state.get("budget_exhausted", False)
+
+    @property
+    def speculative_wasted_cost(self) -> float:
+        """Return the spend on speculative rounds that were discarded."""
+        return self.final_state.get("speculative_wasted_cost", 0.0)
+
     @property
     def cost_summary(self) -> str:
         """Return formatted cost summary."""
@@ -49,6 +93,36 @@ class DebateResult:
         )
 
 
+@dataclass
+class DebateOutcome:
+    """Outcome of one item in a batch of debates."""
+
+    index: int
+    topic: str
+    result: DebateResult | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Return True if the debate completed successfully."""
+        return self.error is None
+
+
+DebateItem = tuple[str, str | None]
+
+
+async def _iterate_items(
+    items: Iterable[DebateItem] | AsyncIterable[DebateItem],
+) -> AsyncGenerator[DebateItem, None]:
+    """Iterate over a sync or async iterable of debate items."""
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
 class MAD:
     """Multi-Agent Debate orchestrator.
 
@@ -81,42 +155,192 @@ class MAD:
         self,
         config: DebateConfig,
         global_config: MADConfig | None = None,
+        checkpointer: BaseCheckpointSaver[Any] | None = None,
+        batch: BatchCollector | None = None,
     ):
         """Initialize the MAD orchestrator.
 
         Args:
             config: Debate configuration.
             global_config: Optional global configuration for API keys.
+            checkpointer: Optional checkpointer that persists debate state
+                after every node. Defaults to a SQLite checkpointer when
+                ``config.checkpoint_path`` is set.
+            batch: Optional collector that routes every agent call through
+                a provider batch API (see ``debate_batch``).
         """
         self.config = config
         self.global_config = global_config or MADConfig()
+        self._batch = batch
+
+        # Checkpointers created here are closed by aclose()
+        self._owns_checkpointer = False
+        if checkpointer is None and config.checkpoint_path is not None:
+            checkpointer = sqlite_checkpointer(config.checkpoint_path)
+            self._owns_checkpointer = True
+        self._checkpointer = checkpointer
+
+        # Agents and graph are shared across instances with equal configs.
+        # A checkpointer or batch collector is bound into the agents and
+        # graph, so those are not.
+        if checkpointer is None and batch is None:
+            compiled = graph_cache.get_or_create(self._cache_key(), self._compile)
+        else:
+            compiled = self._compile()
+
+        self._debaters = compiled.debaters
+        self._judge = compiled.judge
+        self._moderator = compiled.moderator
+        self._graph = compiled.graph
+
+    async def __aenter__(self) -> MAD:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Release resources owned by this orchestrator."""
+        if self._owns_checkpointer and self._checkpointer is not None:
+            conn = getattr(self._checkpointer, "conn", None)
+            if conn is not None:
+                await conn.close()
+            self._owns_checkpointer = False
+
+    def _run_config(self, debate_id: str) -> RunnableConfig:
+        """Return the graph run config for a debate."""
+        if self._checkpointer is None:
+            return {}
+        return {"configurable": {"thread_id": debate_id}}
+
+    def _compile(self) -> CompiledDebate:
+        """Create the agents and compile the debate graph."""
+        debaters = self._create_debaters()
+        judge = self._create_judge()
+        moderator = self._create_moderator()
+        compactor = self._create_compactor()
+        for agent in [*debaters, judge]:
+            agent.compactor = compactor
+        retriever = self._create_retriever()
+        for debater in debaters:
+            debater.retriever = retriever
+
+        graph = create_debate_graph(
+            debaters=debaters,
+            judge=judge,
+            moderator=moderator,
+            parallel=self.config.parallel_debaters,
+            max_concurrency=self.config.max_concurrency,
+            checkpointer=self._checkpointer,
+            speculative=self.config.speculative_rounds,
+            deadline_ms=self.config.deadline_ms,
+            max_cost_usd=self.config.max_cost_usd,
+        )
+        return CompiledDebate(debaters=debaters, judge=judge, moderator=moderator, graph=graph)
 
-        # Initialize agents
-        self._debaters = self._create_debaters()
-        self._judge = self._create_judge()
-        self._moderator = self._create_moderator()
+    def _cache_key(self) -> str:
+        """Return the graph cache key for this orchestrator's configuration.
 
-        # Build graph
-        self._graph = create_debate_graph(
-            debaters=self._debaters,
-            judge=self._judge,
-            moderator=self._moderator,
-        )
+        The key includes the identity of the provider instances the agents
+        would use, so clearing or replacing registry providers never serves
+        agents bound to stale providers.
+        """
+        configs: list[DebaterConfig | JudgeConfig | ModeratorConfig] = [
+            self._judge_config(),
+            self._moderator_config(),
+            *(self._debater_config(d) for d in self.config.debaters),
+        ]
+        targets = {(config.provider, config.base_url) for config in configs}
+        for router_config in self.config.routing.values():
+            targets.update((route.provider, route.base_url) for route in router_config.candidates)
+        if self.config.compaction is not None:
+            targets.add((self.config.compaction.provider, self.config.compaction.base_url))
+        if not self.config.debaters:
+            targets.add((self.global_config.default_provider, None))
+        providers = {
+            f"{name}@{base_url}": id(self._get_provider(name, base_url=base_url))
+            for name, base_url in sorted(targets, key=str)
+        }
+        return config_cache_key(self.config, self.global_config, extra=providers)
+
+    @staticmethod
+    def _debater_config(debater_config: DebaterConfig | dict[str, Any]) -> DebaterConfig:
+        """Coerce a debater config entry to DebaterConfig."""
+        if isinstance(debater_config, dict):
+            return DebaterConfig(**debater_config)
+        return debater_config
+
+    def _judge_config(self) -> JudgeConfig:
+        """Return the judge config as a JudgeConfig."""
+        judge_config = self.config.judge
+        if isinstance(judge_config, dict):
+            return JudgeConfig(**judge_config)
+        return judge_config
+
+    def _moderator_config(self) -> ModeratorConfig:
+        """Return the moderator config, defaulting to the judge's provider."""
+        moderator_config = self.config.moderator
+        if isinstance(moderator_config, dict):
+            return ModeratorConfig(**moderator_config)
+        if moderator_config is None:
+            judge_config = self._judge_config()
+            return ModeratorConfig(
+                provider=judge_config.provider,
+                model=judge_config.model,
+                base_url=judge_config.base_url,
+            )
+        return moderator_config
+
+    def _get_provider(
+        self,
+        provider_name: str,
+        role: AgentRole | None = None,
+        base_url: str | None = None,
+    ) -> LLMProvider:
+        """Get a provider instance, wrapped for the agent role using it."""
+        if self._batch is not None:
+            # Batch jobs are neither rate limited nor latency sensitive
+            base = get_provider(provider_name, base_url)  # type: ignore[arg-type]
+            return BatchingProvider(base, self._batch)
+
+        provider: LLMProvider
+        router_config = self.config.routing.get(role) if role is not None else None
+        if router_config is not None:
+            candidates = [
+                (self._wrapped_provider(route.provider, route.base_url), route.model)
+                for route in router_config.candidates
+            ]
+            provider = routed(candidates, router_config.policy, router_config.p95_target_ms)
+        else:
+            provider = self._wrapped_provider(provider_name, base_url)
+
+        if role is not None and role in self.config.response_cache_roles:
+            cache = shared_response_cache(
+                self.config.response_cache_path, self.config.response_cache_ttl_s
+            )
+            provider = cached(provider, cache)
+        return provider
 
-    def _get_provider(self, provider_name: str) -> LLMProvider:
-        """Get a provider instance."""
+    def _wrapped_provider(self, provider_name: str, base_url: str | None) -> LLMProvider:
+        """Get a provider with rate limiting, retries and hedging applied."""
         # Cast to ProviderType for type safety
-        return get_provider(provider_name)  # type: ignore[arg-type]
+        base = get_provider(provider_name, base_url)  # type: ignore[arg-type]
+        provider: LLMProvider = ProviderRegistry.rate_limited(base, provider_name)
+        if self.global_config.max_retries:
+            provider = resilient(provider, self.global_config.max_retries + 1)
+        if self.config.hedge_percentile is not None:
+            provider = hedged(provider, self.config.hedge_percentile)
+        return provider
 
     def _create_debaters(self) -> list[DebaterAgent]:
         """Create debater agents from config."""
         debaters = []
 
-        for i, debater_config in enumerate(self.config.debaters):
-            if isinstance(debater_config, dict):
-                debater_config = DebaterConfig(**debater_config)
-
-            provider = self._get_provider(debater_config.provider)
+        for i, entry in enumerate(self.config.debaters):
+            debater_config = self._debater_config(entry)
+            provider = self._get_provider(
+                debater_config.provider, "debater", debater_config.base_url
+            )
 
             agent = DebaterAgent(
                 agent_id=f"debater_{i + 1}",
@@ -130,7 +354,7 @@ class MAD:
 
         # Default: 2 debaters if none specified
         if not debaters:
-            default_provider = self._get_provider(self.global_config.default_provider)
+            default_provider = self._get_provider(self.global_config.default_provider, "debater")
             debaters = [
                 DebaterAgent(
                     agent_id="debater_1",
@@ -150,44 +374,77 @@ class MAD:
 
     def _create_judge(self) -> JudgeAgent:
         """Create judge agent from config."""
-        judge_config = self.config.judge
-        if isinstance(judge_config, dict):
-            judge_config = JudgeConfig(**judge_config)
-
-        provider = self._get_provider(judge_config.provider)
+        judge_config = self._judge_config()
+        provider = self._get_provider(judge_config.provider, "judge", judge_config.base_url)
 
-        return JudgeAgent(
+        judge = JudgeAgent(
             agent_id="judge",
             provider=provider,
             model=judge_config.model,
             system_prompt=judge_config.system_prompt,
             temperature=judge_config.temperature,
         )
+        if judge_config.dedup_threshold is not None:
+            judge.deduplicator = TranscriptDeduplicator(judge_config.dedup_threshold)
+        return judge
 
     def _create_moderator(self) -> ModeratorAgent | None:
         """Create moderator agent if early stopping is enabled."""
         if not self.config.early_stop_on_consensus:
             return None
 
-        # Use same provider as judge for moderator
-        judge_config = self.config.judge
-        if isinstance(judge_config, dict):
-            judge_config = JudgeConfig(**judge_config)
-
-        provider = self._get_provider(judge_config.provider)
+        moderator_config = self._moderator_config()
+        provider = self._get_provider(
+            moderator_config.provider, "moderator", moderator_config.base_url
+        )
 
-        return ModeratorAgent(
+        moderator = ModeratorAgent(
             agent_id="moderator",
             provider=provider,
-            model=judge_config.model,
+            model=moderator_config.model,
             consensus_threshold=self.config.consensus_threshold,
         )
+        precheck = self.config.consensus_precheck
+        if precheck is not None:
+            moderator.precheck = LexicalConsensus(
+                decide_below=precheck.decide_below,
+                decide_above=precheck.decide_above,
+                calibration_rate=precheck.calibration_rate,
+            )
+        return moderator
+
+    def _create_compactor(self) -> TranscriptCompactor | None:
+        """Create the transcript compactor shared by debaters and the judge."""
+        compaction = self.config.compaction
+        if compaction is None:
+            return None
+
+        return TranscriptCompactor(
+            provider=self._get_provider(compaction.provider, base_url=compaction.base_url),
+            model=compaction.model,
+            budget_tokens=compaction.budget_tokens,
+            keep_rounds=compaction.keep_rounds,
+            max_summary_tokens=compaction.max_summary_tokens,
+        )
+
+    def _create_retriever(self) -> ContextRetriever | None:
+        """Create the context retriever shared by debaters."""
+        retrieval = self.config.retrieval
+        if retrieval is None:
+            return None
+
+        return ContextRetriever(
+            budget_tokens=retrieval.budget_tokens,
+            top_k=retrieval.top_k,
+            chunk_tokens=retrieval.chunk_tokens,
+        )
 
     async def debate(
         self,
         topic: str,
         context: str | None = None,
         preset: str | None = None,
+        debate_id: str | None = None,
     ) -> DebateResult:
         """Run a debate on the given topic.
 
@@ -195,6 +452,8 @@ class MAD:
             topic: The debate topic or question.
             context: Optional additional context (e.g., code to review).
             preset: Optional preset name to apply.
+            debate_id: Optional debate id. With checkpointing enabled this
+                is the id to pass to ``resume`` (generated if omitted).
 
         Returns:
             DebateResult with verdict and metadata.
@@ -206,13 +465,154 @@ class MAD:
             preset=preset or self.config.preset,
             max_rounds=self.config.max_rounds,
             debater_count=len(self._debaters),
+            debate_id=debate_id,
         )
 
         # Run the graph
-        result = await self._graph.ainvoke(initial_state)
+        result = await self._graph.ainvoke(
+            initial_state,
+            config=self._run_config(initial_state["debate_id"]),
+        )
         final_state: DebateState = result  # type: ignore[assignment]
 
-        # Extract result
+        return self._build_result(final_state)
+
+    async def resume(self, debate_id: str) -> DebateResult:
+        """Resume a checkpointed debate from its last completed node.
+
+        Completed nodes are not re-run, so no LLM calls are repeated for
+        rounds that finished before the interruption. Resuming a debate that
+        already finished returns its result without running anything.
+
+        Args:
+            debate_id: Id of the debate to resume.
+
+        Returns:
+            DebateResult with verdict and metadata.
+
+        Raises:
+            ValueError: If checkpointing is disabled or no checkpoint exists.
+        """
+        if self._checkpointer is None:
+            msg = "resume() requires a checkpointer (set checkpoint_path or pass checkpointer)"
+            raise ValueError(msg)
+
+        config = self._run_config(debate_id)
+        snapshot = await self._graph.aget_state(config)
+        if not snapshot.values:
+            msg = f"No checkpoint found for debate '{debate_id}'"
+            raise ValueError(msg)
+
+        if snapshot.next:
+            result = await self._graph.ainvoke(None, config=config)
+            final_state: DebateState = result  # type: ignore[assignment]
+        else:
+            final_state = snapshot.values  # type: ignore[assignment]
+
+        return self._build_result(final_state)
+
+    async def debate_many(
+        self,
+        items: Iterable[DebateItem] | AsyncIterable[DebateItem],
+        concurrency: int = 4,
+    ) -> AsyncIterator[DebateOutcome]:
+        """Run many debates with bounded concurrency.
+
+        All debates share this orchestrator's agents, provider instances and
+        compiled graph. Items are pulled lazily, so ``items`` may be a
+        long-running async source such as a queue consumer.
+
+        Args:
+            items: Iterable or async iterable of (topic, context) pairs.
+            concurrency: Maximum number of debates in flight.
+
+        Yields:
+            DebateOutcome for each item, in completion order. A failing
+            debate yields an outcome with ``error`` set instead of raising.
+
+        Raises:
+            ValueError: If concurrency is less than 1.
+        """
+        if concurrency < 1:
+            msg = f"concurrency must be >= 1, got {concurrency}"
+            raise ValueError(msg)
+
+        async def run(index: int, topic: str, context: str | None) -> DebateOutcome:
+            try:
+                result = await self.debate(topic=topic, context=context)
+            except Exception as e:
+                return DebateOutcome(index=index, topic=topic, error=e)
+            return DebateOutcome(index=index, topic=topic, result=result)
+
+        iterator = _iterate_items(items)
+        running: set[asyncio.Future[Any]] = set()
+        fetch: asyncio.Future[Any] | None = None
+        exhausted = False
+        index = 0
+
+        try:
+            while True:
+                if not exhausted and fetch is None and len(running) < concurrency:
+                    fetch = asyncio.ensure_future(anext(iterator))
+
+                waiting = running | ({fetch} if fetch is not None else set())
+                if not waiting:
+                    break
+
+                done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+
+                if fetch is not None and fetch in done:
+                    done.discard(fetch)
+                    try:
+                        topic, context = fetch.result()
+                    except StopAsyncIteration:
+                        exhausted = True
+                    else:
+                        running.add(asyncio.ensure_future(run(index, topic, context)))
+                        index += 1
+                    fetch = None
+
+                for task in done:
+                    running.discard(task)
+                    yield task.result()
+        finally:
+            leftovers = [*running, *([fetch] if fetch is not None else [])]
+            for task in leftovers:
+                task.cancel()
+            await asyncio.gather(*leftovers, return_exceptions=True)
+            await iterator.aclose()
+
+    async def debate_batch(
+        self,
+        items: Iterable[DebateItem] | AsyncIterable[DebateItem],
+        backend: BatchBackend,
+        poll_interval_s: float = 30.0,
+        window_s: float = 0.05,
+        concurrency: int = 10_000,
+    ) -> AsyncIterator[DebateOutcome]:
+        """Run many debates offline through a provider batch API.
+
+        Debates advance in lockstep: at every step, the pending agent calls of
+        all debates are submitted as one batch job, which is polled until it
+        finishes. Latency is traded for the batch discount.
+
+        Args:
+            items: Iterable or async iterable of (topic, context) pairs.
+            backend: Batch API to submit jobs to.
+            poll_interval_s: Seconds between job status checks.
+            window_s: Quiet period that closes a batch.
+            concurrency: Maximum number of debates in flight.
+
+        Yields:
+            DebateOutcome for each item, as from ``debate_many``.
+        """
+        collector = BatchCollector(backend, window_s=window_s, poll_interval_s=poll_interval_s)
+        batch_mad = MAD(self.config, self.global_config, batch=collector)
+        async for outcome in batch_mad.debate_many(items, concurrency=concurrency):
+            yield outcome
+
+    def _build_result(self, final_state: DebateState) -> DebateResult:
+        """Build a DebateResult from a finished debate state."""
         verdict: dict[str, Any] = final_state.get("judge_verdict") or {}
 
         # Calculate execution time
@@ -220,14 +620,12 @@ class MAD:
         end = final_state.get("end_time", "")
         execution_time = 0.0
         if start and end:
-            from datetime import datetime
-
             start_dt = datetime.fromisoformat(start)
             end_dt = datetime.fromisoformat(end)
             execution_time = (end_dt - start_dt).total_seconds() * 1000
 
         return DebateResult(
-            verdict=str(verdict.get("verdict", final_state.get("final_answer", ""))),
+            verdict=str(verdict.get("verdict", final_state.get("final_answer") or "")),
             confidence=float(final_state.get("confidence_score") or 0.5),
             reasoning=verdict.get("reasoning", ""),
             consensus_points=verdict.get("consensus_points", []),
@@ -245,15 +643,21 @@ class MAD:
         self,
         topic: str,
         context: str | None = None,
-    ) -> AsyncIterator[dict[str, Any]]:
+        stream_tokens: bool = False,
+    ) -> AsyncIterator[dict[str, Any] | DebateEvent]:
         """Stream debate progress (yields intermediate states).
 
         Args:
             topic: The debate topic.
             context: Optional additional context.
+            stream_tokens: If True, yield typed events instead of raw node
+                updates: a TokenEvent for every response chunk of every
+                agent, a MessageEvent as each agent finishes, and an
+                UpdateEvent for each node's state update.
 
         Yields:
-            Intermediate DebateState updates.
+            Intermediate DebateState updates, or DebateEvents when
+            stream_tokens is True.
         """
         initial_state = create_initial_state(
             topic=topic,
@@ -262,5 +666,21 @@ class MAD:
             debater_count=len(self._debaters),
         )
 
-        async for state in self._graph.astream(initial_state):
-            yield state
+        config = self._run_config(initial_state["debate_id"])
+
+        if not stream_tokens:
+            async for state in self._graph.astream(initial_state, config=config):
+                yield state
+            return
+
+        config.setdefault("configurable", {})["stream_tokens"] = True
+        async for mode, chunk in self._graph.astream(
+            initial_state,
+            config=config,
+            stream_mode=["updates", "custom"],
+        ):
+            if mode == "custom":
+                yield cast(DebateEvent, chunk)
+                continue
+            for node, update in cast(dict[str, Any], chunk).items():
+                yield UpdateEvent(type="update", node=node, update=update)
@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
+import operator
+import uuid
 from datetime import datetime
 from typing import Annotated, Any, Literal, TypedDict
 
-from langgraph.graph.message import add_messages
-
 
 class DebateMessage(TypedDict):
     """A single message in the debate."""
@@ -47,6 +47,7 @@ class DebateState(TypedDict):
     """LangGraph state schema for debate sessions."""
 
     # Input
+    debate_id: str
     topic: str
     context: str | None
     preset: str | None
@@ -57,7 +58,7 @@ class DebateState(TypedDict):
     debater_count: int
 
     # Debate progress
-    messages: Annotated[list[DebateMessage], add_messages]
+    messages: Annotated[list[DebateMessage], operator.add]
     phase: Literal["init", "debate", "moderate", "judge", "synthesize", "complete"]
 
     # Moderator control
@@ -76,6 +77,16 @@ class DebateState(TypedDict):
     total_cost: float
     start_time: str
     end_time: str | None
+    deadline_truncated: bool
+    budget_exhausted: bool
+
+    # Speculative execution (spend already included in the totals above)
+    speculative_wasted_tokens: int
+    speculative_wasted_cost: float
+    speculative_cancelled_calls: int
+
+    # Rounds replaced by summaries in the view an agent builds its prompt from
+    compacted_through_round: int
 
 
 def create_initial_state(
@@ -84,9 +95,11 @@ def create_initial_state(
     preset: str | None = None,
     max_rounds: int = 3,
     debater_count: int = 2,
+    debate_id: str | None = None,
 ) -> DebateState:
     """Create an initial debate state."""
     return DebateState(
+        debate_id=debate_id or uuid.uuid4().hex,
         topic=topic,
         context=context,
         preset=preset,
@@ -106,4 +119,10 @@ def create_initial_state(
         total_cost=0.0,
         start_time=datetime.now().isoformat(),
         end_time=None,
+        deadline_truncated=False,
+        budget_exhausted=False,
+        speculative_wasted_tokens=0,
+        speculative_wasted_cost=0.0,
+        speculative_cancelled_calls=0,
+        compacted_through_round=0,
     )
@@ -43,6 +43,10 @@ class Preset(ABC):
         """Return the consensus threshold for early stopping."""
         return 0.8
 
+    def get_parallel_debaters(self) -> bool:
+        """Return whether debaters in a round should run concurrently."""
+        return False
+
     def to_config(self) -> DebateConfig:
         """Convert preset to a DebateConfig.
 
@@ -56,4 +60,5 @@ class Preset(ABC):
             max_rounds=self.get_max_rounds(),
             early_stop_on_consensus=True,
             consensus_threshold=self.get_consensus_threshold(),
+            parallel_debaters=self.get_parallel_debaters(),
         )
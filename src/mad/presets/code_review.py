@@ -102,3 +102,6 @@ class CodeReviewPreset(Preset):
 
     def get_consensus_threshold(self) -> float:
         return 0.7  # Allow some disagreement on minor issues
+
+    def get_parallel_debaters(self) -> bool:
+        return True  # Reviewers are independent within a round
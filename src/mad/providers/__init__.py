@@ -1,11 +1,24 @@
 """LLM Provider adapters for MAD Framework."""
 
+from mad.providers.anthropic_http import AnthropicHTTPProvider
 from mad.providers.base import LLMProvider, ProviderResponse
+from mad.providers.cassette import RecordingProvider, ReplayProvider
+from mad.providers.hedging import HedgedProvider
+from mad.providers.openai_compatible import OpenAICompatibleProvider
+from mad.providers.openai_http import OpenAIHTTPProvider
 from mad.providers.registry import ProviderRegistry, get_provider
+from mad.providers.router import RouterProvider
 
 __all__ = [
+    "AnthropicHTTPProvider",
+    "HedgedProvider",
     "LLMProvider",
+    "OpenAICompatibleProvider",
+    "OpenAIHTTPProvider",
     "ProviderResponse",
     "ProviderRegistry",
+    "RecordingProvider",
+    "ReplayProvider",
+    "RouterProvider",
     "get_provider",
 ]
@@ -3,30 +3,124 @@
 from __future__ import annotations
 
 import time
+from collections import OrderedDict
 from collections.abc import AsyncIterator
+from functools import cached_property
 from typing import Any
 
+import anthropic
 from langchain_anthropic import ChatAnthropic
-from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+from langchain_core.messages import (
+    AIMessage,
+    AIMessageChunk,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+)
+from pydantic import Field
 
-from mad.providers.base import LLMProvider, ProviderResponse
+from mad.providers.base import LLMProvider, ProviderResponse, TokenCallback
+from mad.providers.http import pool_stats
 
-# Pricing per 1M tokens (as of Dec 2024)
+# Pricing per 1M tokens (as of Dec 2024). Prompt cache writes cost 1.25x
+# input, cache reads 0.1x.
 ANTHROPIC_PRICING = {
-    "claude-opus-4-20250514": {"input": 15.0, "output": 75.0},
-    "claude-sonnet-4-20250514": {"input": 3.0, "output": 15.0},
-    "claude-3-5-sonnet-latest": {"input": 3.0, "output": 15.0},
-    "claude-3-5-haiku-latest": {"input": 0.80, "output": 4.0},
-    "claude-3-opus-latest": {"input": 15.0, "output": 75.0},
+    "claude-opus-4-20250514": {
+        "input": 15.0,
+        "output": 75.0,
+        "cache_write": 18.75,
+        "cache_read": 1.50,
+    },
+    "claude-sonnet-4-20250514": {
+        "input": 3.0,
+        "output": 15.0,
+        "cache_write": 3.75,
+        "cache_read": 0.30,
+    },
+    "claude-3-5-sonnet-latest": {
+        "input": 3.0,
+        "output": 15.0,
+        "cache_write": 3.75,
+        "cache_read": 0.30,
+    },
+    "claude-3-5-haiku-latest": {
+        "input": 0.80,
+        "output": 4.0,
+        "cache_write": 1.0,
+        "cache_read": 0.08,
+    },
+    "claude-3-opus-latest": {
+        "input": 15.0,
+        "output": 75.0,
+        "cache_write": 18.75,
+        "cache_read": 1.50,
+    },
 }
+DEFAULT_PRICING = {"input": 3.0, "output": 15.0, "cache_write": 3.75, "cache_read": 0.30}
+
+# Marks a stable prompt prefix for Anthropic's prompt cache
+CACHE_CONTROL = {"type": "ephemeral"}
+
+
+def anthropic_cost(
+    input_tokens: int,
+    output_tokens: int,
+    model: str,
+    cache_write_tokens: int = 0,
+    cache_read_tokens: int = 0,
+) -> float:
+    """Return the cost of a call, pricing prompt cache writes and reads separately.
+
+    Args:
+        input_tokens: Total input tokens, including cache writes and reads.
+        output_tokens: Output tokens.
+        model: Model name.
+        cache_write_tokens: Input tokens written to the prompt cache.
+        cache_read_tokens: Input tokens read from the prompt cache.
+
+    Returns:
+        Cost in USD.
+    """
+    pricing = ANTHROPIC_PRICING.get(model, DEFAULT_PRICING)
+    uncached = max(0, input_tokens - cache_write_tokens - cache_read_tokens)
+    return (
+        uncached * pricing["input"]
+        + cache_write_tokens * pricing["cache_write"]
+        + cache_read_tokens * pricing["cache_read"]
+        + output_tokens * pricing["output"]
+    ) / 1_000_000
+
+
+class PooledChatAnthropic(ChatAnthropic):
+    """ChatAnthropic whose async SDK client uses a connection pool we own.
+
+    Mirrors ChatOpenAI's ``http_async_client``: the pool is handed to the
+    SDK through ``AsyncAnthropic(http_client=...)``.
+    """
+
+    http_async_client: Any = Field(default=None, exclude=True)
+
+    @cached_property
+    def _async_client(self) -> anthropic.AsyncAnthropic:
+        return anthropic.AsyncAnthropic(**self._client_params, http_client=self.http_async_client)
 
 
 class AnthropicProvider(LLMProvider):
-    """Anthropic Claude provider using LangChain."""
+    """Anthropic Claude provider using LangChain.
+
+    Clients are cached per model in a bounded LRU and share one connection
+    pool; temperature is passed on each call.
+    """
+
+    def __init__(self, max_clients: int = 16) -> None:
+        """Initialize the Anthropic provider.
 
-    def __init__(self) -> None:
-        """Initialize the Anthropic provider."""
-        self._clients: dict[str, ChatAnthropic] = {}
+        Args:
+            max_clients: Number of per-model clients to keep.
+        """
+        self.max_clients = max_clients
+        self._clients: OrderedDict[str, ChatAnthropic] = OrderedDict()
+        self._http: anthropic.DefaultAsyncHttpxClient | None = None
 
     @property
     def name(self) -> str:
@@ -36,29 +130,48 @@ class AnthropicProvider(LLMProvider):
     def supported_models(self) -> list[str]:
         return list(ANTHROPIC_PRICING.keys())
 
-    def _get_client(self, model: str, temperature: float) -> ChatAnthropic:
+    def _http_client(self) -> anthropic.DefaultAsyncHttpxClient:
+        """Return the connection pool shared by every client of this provider."""
+        # Built by the SDK so it matches the httpx package the SDK accepts
+        if self._http is None or self._http.is_closed:
+            self._http = anthropic.DefaultAsyncHttpxClient()
+        return self._http
+
+    def _get_client(self, model: str) -> ChatAnthropic:
         """Get or create a cached client for the model."""
-        cache_key = f"{model}:{temperature}"
-        if cache_key not in self._clients:
-            self._clients[cache_key] = ChatAnthropic(
-                model=model,
-                temperature=temperature,
-            )
-        return self._clients[cache_key]
+        if model in self._clients:
+            self._clients.move_to_end(model)
+            return self._clients[model]
+
+        client = PooledChatAnthropic(model=model, http_async_client=self._http_client())
+        self._clients[model] = client
+        if len(self._clients) > self.max_clients:
+            self._clients.popitem(last=False)
+        return client
+
+    def pool_stats(self) -> dict[str, int]:
+        """Return open, idle and in-use connection counts for the shared pool."""
+        return pool_stats(self._http)
 
     def _convert_messages(
         self, messages: list[dict[str, str]], system: str | None = None
     ) -> tuple[list[BaseMessage], str | None]:
-        """Convert dict messages to LangChain format."""
+        """Convert dict messages to LangChain format.
+
+        Messages carrying a ``cache_control`` key become prompt cache
+        breakpoints.
+        """
         lc_messages: list[BaseMessage] = []
         sys_prompt = system
 
         for msg in messages:
             role = msg.get("role", "user")
-            content = msg.get("content", "")
+            content: str | list[str | dict[str, Any]] = msg.get("content", "")
+            if msg.get("cache_control"):
+                content = [{"type": "text", "text": content, "cache_control": CACHE_CONTROL}]
 
             if role == "system":
-                sys_prompt = content
+                sys_prompt = msg.get("content", "")
             elif role == "assistant":
                 lc_messages.append(AIMessage(content=content))
             else:  # user
@@ -66,6 +179,19 @@ class AnthropicProvider(LLMProvider):
 
         return lc_messages, sys_prompt
 
+    def _prepare_messages(
+        self, messages: list[dict[str, str]], system: str | None = None
+    ) -> list[BaseMessage]:
+        """Convert messages and prepend the system prompt as a cached block."""
+        lc_messages, sys_prompt = self._convert_messages(messages, system)
+
+        # The system prompt is identical on every turn: always cache it
+        if sys_prompt:
+            block = {"type": "text", "text": sys_prompt, "cache_control": CACHE_CONTROL}
+            lc_messages.insert(0, SystemMessage(content=[block]))
+
+        return lc_messages
+
     async def generate(
         self,
         messages: list[dict[str, str]],
@@ -78,15 +204,20 @@ class AnthropicProvider(LLMProvider):
         """Generate a response using Claude."""
         start_time = time.perf_counter()
 
-        client = self._get_client(model, temperature)
-        lc_messages, sys_prompt = self._convert_messages(messages, system)
+        client = self._get_client(model)
+        lc_messages = self._prepare_messages(messages, system)
 
-        # Add system message if present
-        if sys_prompt:
-            lc_messages.insert(0, SystemMessage(content=sys_prompt))
+        response = await client.ainvoke(lc_messages, max_tokens=max_tokens, temperature=temperature)
 
-        response = await client.ainvoke(lc_messages, max_tokens=max_tokens)
+        return self._build_response(response, model, start_time)
 
+    def _build_response(
+        self,
+        response: AIMessage,
+        model: str,
+        start_time: float,
+    ) -> ProviderResponse:
+        """Build a ProviderResponse from a LangChain message."""
         latency_ms = (time.perf_counter() - start_time) * 1000
 
         # Extract token usage
@@ -94,13 +225,21 @@ class AnthropicProvider(LLMProvider):
         input_tokens = usage.get("input_tokens", 0)
         output_tokens = usage.get("output_tokens", 0)
 
+        # LangChain folds prompt cache tokens into input_tokens
+        details = usage.get("input_token_details") or {}
+        cache_read = details.get("cache_read") or 0
+        cache_write = (details.get("ephemeral_5m_input_tokens") or 0) + (
+            details.get("ephemeral_1h_input_tokens") or 0
+        ) or (details.get("cache_creation") or 0)
+
         return ProviderResponse(
             content=str(response.content),
             input_tokens=input_tokens,
             output_tokens=output_tokens,
             model=model,
-            cost=self.estimate_cost(input_tokens, output_tokens, model),
+            cost=anthropic_cost(input_tokens, output_tokens, model, cache_write, cache_read),
             latency_ms=latency_ms,
+            metadata={"cache_read_tokens": cache_read, "cache_write_tokens": cache_write},
         )
 
     async def stream(
@@ -113,24 +252,50 @@ class AnthropicProvider(LLMProvider):
         **kwargs: object,
     ) -> AsyncIterator[str]:
         """Stream a response from Claude."""
-        client = self._get_client(model, temperature)
-        lc_messages, sys_prompt = self._convert_messages(messages, system)
+        client = self._get_client(model)
+        lc_messages = self._prepare_messages(messages, system)
 
-        if sys_prompt:
-            lc_messages.insert(0, SystemMessage(content=sys_prompt))
-
-        async for chunk in client.astream(lc_messages, max_tokens=max_tokens):
+        async for chunk in client.astream(
+            lc_messages, max_tokens=max_tokens, temperature=temperature
+        ):
             if chunk.content:
                 yield str(chunk.content)
 
+    async def generate_stream(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        on_token: TokenCallback,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        system: str | None = None,
+        **kwargs: object,
+    ) -> ProviderResponse:
+        """Stream a response from Claude, forwarding chunks, with exact usage."""
+        start_time = time.perf_counter()
+
+        client = self._get_client(model)
+        lc_messages = self._prepare_messages(messages, system)
+
+        aggregate: AIMessageChunk | None = None
+        async for chunk in client.astream(
+            lc_messages, max_tokens=max_tokens, temperature=temperature
+        ):
+            aggregate = chunk if aggregate is None else aggregate + chunk
+            if chunk.content:
+                on_token(str(chunk.content))
+
+        return self._build_response(
+            aggregate if aggregate is not None else AIMessageChunk(content=""),
+            model,
+            start_time,
+        )
+
     def estimate_cost(
         self,
         input_tokens: int,
         output_tokens: int,
         model: str,
     ) -> float:
-        """Estimate cost based on Anthropic pricing."""
-        pricing = ANTHROPIC_PRICING.get(model, {"input": 3.0, "output": 15.0})
-        input_cost = (input_tokens / 1_000_000) * pricing["input"]
-        output_cost = (output_tokens / 1_000_000) * pricing["output"]
-        return input_cost + output_cost
+        """Estimate cost based on Anthropic pricing (all input uncached)."""
+        return anthropic_cost(input_tokens, output_tokens, model)
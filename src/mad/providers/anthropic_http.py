@@ -0,0 +1,110 @@
+"""Anthropic (Claude) provider over native pooled HTTP."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from mad.providers.anthropic import ANTHROPIC_PRICING, anthropic_cost
+from mad.providers.http import HTTPProvider
+
+ANTHROPIC_VERSION = "2023-06-01"
+
+
+class AnthropicHTTPProvider(HTTPProvider):
+    """Anthropic Claude provider calling the Messages API directly.
+
+    Skips the LangChain message conversion of ``AnthropicProvider`` and
+    reuses the shared keep-alive connection pool.
+    """
+
+    api_key_env = "ANTHROPIC_API_KEY"
+    base_url_env = "ANTHROPIC_BASE_URL"
+    default_base_url = "https://api.anthropic.com"
+
+    @property
+    def name(self) -> str:
+        return "anthropic"
+
+    @property
+    def supported_models(self) -> list[str]:
+        return list(ANTHROPIC_PRICING.keys())
+
+    @property
+    def endpoint(self) -> str:
+        return "/v1/messages"
+
+    def _headers(self) -> dict[str, str]:
+        return {
+            "x-api-key": self.api_key,
+            "anthropic-version": ANTHROPIC_VERSION,
+            "content-type": "application/json",
+        }
+
+    def _build_payload(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        system: str | None,
+        stream: bool,
+    ) -> dict[str, Any]:
+        wire_messages = []
+        sys_prompt = system
+
+        for msg in messages:
+            role = msg.get("role", "user")
+            content = msg.get("content", "")
+
+            if role == "system":
+                sys_prompt = content
+            else:
+                wire_messages.append(
+                    {"role": "assistant" if role == "assistant" else "user", "content": content}
+                )
+
+        payload: dict[str, Any] = {
+            "model": model,
+            "messages": wire_messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
+        if sys_prompt:
+            payload["system"] = sys_prompt
+        if stream:
+            payload["stream"] = True
+        return payload
+
+    def _parse_response(self, data: dict[str, Any]) -> tuple[str, int, int]:
+        content = "".join(
+            block.get("text", "")
+            for block in data.get("content", [])
+            if block.get("type") == "text"
+        )
+        usage = data.get("usage", {})
+        return content, usage.get("input_tokens", 0), usage.get("output_tokens", 0)
+
+    def _parse_event(self, event: dict[str, Any], usage: dict[str, int]) -> str:
+        event_type = event.get("type")
+        if event_type == "message_start":
+            start_usage = event.get("message", {}).get("usage", {})
+            usage["input_tokens"] = start_usage.get("input_tokens", 0)
+            usage["output_tokens"] = start_usage.get("output_tokens", 0)
+        elif event_type == "message_delta":
+            usage["output_tokens"] = event.get("usage", {}).get(
+                "output_tokens", usage.get("output_tokens", 0)
+            )
+        elif event_type == "content_block_delta":
+            delta = event.get("delta", {})
+            if delta.get("type") == "text_delta":
+                return str(delta.get("text", ""))
+        return ""
+
+    def estimate_cost(
+        self,
+        input_tokens: int,
+        output_tokens: int,
+        model: str,
+    ) -> float:
+        """Estimate cost based on Anthropic pricing."""
+        return anthropic_cost(input_tokens, output_tokens, model)
@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+import time
 from abc import ABC, abstractmethod
-from collections.abc import AsyncIterator
-from typing import TYPE_CHECKING, TypedDict
+from collections.abc import AsyncIterator, Callable
+from typing import TYPE_CHECKING, Any, NotRequired, TypedDict
+
+from mad.tokens import estimate_prompt_tokens, get_tokenizer
 
 if TYPE_CHECKING:
     pass
 
+# Receives each streamed text chunk as it arrives
+TokenCallback = Callable[[str], None]
+
 
 class ProviderResponse(TypedDict):
     """Response from an LLM provider."""
@@ -20,6 +26,9 @@ class ProviderResponse(TypedDict):
     cost: float
     latency_ms: float
 
+    # Provider- or wrapper-specific details, copied into message metadata
+    metadata: NotRequired[dict[str, Any]]
+
 
 class LLMProvider(ABC):
     """Abstract base class for LLM providers."""
@@ -105,6 +114,61 @@ class LLMProvider(ABC):
         """
         ...
 
+    async def generate_stream(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        on_token: TokenCallback,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        system: str | None = None,
+        **kwargs: object,
+    ) -> ProviderResponse:
+        """Stream a response, forwarding chunks, and return the full response.
+
+        The default implementation is built on ``stream``. Providers that do
+        not report usage while streaming get estimated token counts;
+        override this to report exact usage.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'.
+            model: Model name to use.
+            on_token: Called with each text chunk as it arrives.
+            temperature: Sampling temperature.
+            max_tokens: Maximum tokens to generate.
+            system: Optional system prompt.
+            **kwargs: Additional provider-specific arguments.
+
+        Returns:
+            ProviderResponse with the assembled content and metadata.
+        """
+        start_time = time.perf_counter()
+        chunks: list[str] = []
+
+        async for chunk in self.stream(
+            messages,
+            model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            system=system,
+            **kwargs,
+        ):
+            chunks.append(chunk)
+            on_token(chunk)
+
+        content = "".join(chunks)
+        input_tokens = estimate_prompt_tokens(messages, system, self.name)
+        output_tokens = get_tokenizer(self.name).count(content)
+
+        return ProviderResponse(
+            content=content,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            model=model,
+            cost=self.estimate_cost(input_tokens, output_tokens, model),
+            latency_ms=(time.perf_counter() - start_time) * 1000,
+        )
+
     def validate_model(self, model: str) -> bool:
         """Check if a model is supported by this provider."""
         return model in self.supported_models
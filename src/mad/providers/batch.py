@@ -0,0 +1,397 @@
+"""Offline batch submission of provider requests."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from itertools import count
+from typing import Any
+
+from mad.providers.anthropic import anthropic_cost
+from mad.providers.anthropic_http import AnthropicHTTPProvider
+from mad.providers.base import LLMProvider, ProviderResponse
+
+# Message Batches are billed at half the synchronous price
+ANTHROPIC_BATCH_DISCOUNT = 0.5
+
+
+@dataclass
+class BatchRequest:
+    """One generation request inside a batch job."""
+
+    custom_id: str
+    provider: LLMProvider
+    model: str
+    messages: list[dict[str, str]]
+    system: str | None = None
+    temperature: float = 0.7
+    max_tokens: int = 4096
+
+
+BatchResults = dict[str, ProviderResponse | Exception]
+
+
+class BatchBackend(ABC):
+    """A provider batch API: submit many requests, poll until they finish."""
+
+    @abstractmethod
+    async def submit(self, requests: list[BatchRequest]) -> str:
+        """Submit requests as one batch job.
+
+        Args:
+            requests: Requests to run.
+
+        Returns:
+            The batch job id.
+        """
+        ...
+
+    @abstractmethod
+    async def results(self, job_id: str) -> BatchResults | None:
+        """Return results keyed by custom_id, or None while the job is running.
+
+        Args:
+            job_id: Id returned by submit.
+
+        Returns:
+            A response or exception per request once the job has ended.
+        """
+        ...
+
+
+class LocalBatchBackend(BatchBackend):
+    """Batch backend that runs each request through its provider directly.
+
+    Useful offline and for providers without a batch API; there is no
+    batch discount.
+    """
+
+    def __init__(self) -> None:
+        self._jobs: dict[str, asyncio.Task[BatchResults]] = {}
+        self._ids = count(1)
+
+    async def _run(self, requests: list[BatchRequest]) -> BatchResults:
+        async def one(request: BatchRequest) -> ProviderResponse | Exception:
+            try:
+                return await request.provider.generate(
+                    request.messages,
+                    request.model,
+                    temperature=request.temperature,
+                    max_tokens=request.max_tokens,
+                    system=request.system,
+                )
+            except Exception as e:
+                return e
+
+        responses = await asyncio.gather(*(one(request) for request in requests))
+        return {
+            request.custom_id: response
+            for request, response in zip(requests, responses, strict=True)
+        }
+
+    async def submit(self, requests: list[BatchRequest]) -> str:
+        job_id = f"local_{next(self._ids)}"
+        self._jobs[job_id] = asyncio.ensure_future(self._run(requests))
+        return job_id
+
+    async def results(self, job_id: str) -> BatchResults | None:
+        job = self._jobs[job_id]
+        if not job.done():
+            return None
+        del self._jobs[job_id]
+        return job.result()
+
+
+class AnthropicBatchBackend(BatchBackend):
+    """Anthropic Message Batches API backend.
+
+    Requests are encoded with the native HTTP provider's wire format and
+    sent over its pooled client. Costs reflect the batch discount. Requests
+    for other providers (a mixed debate) are run through ``fallback``.
+    """
+
+    def __init__(
+        self,
+        http: AnthropicHTTPProvider | None = None,
+        fallback: BatchBackend | None = None,
+    ) -> None:
+        """Initialize the backend.
+
+        Args:
+            http: Native provider supplying credentials, base URL and client.
+            fallback: Backend for non-Anthropic requests (defaults to
+                LocalBatchBackend).
+        """
+        self.http = http or AnthropicHTTPProvider()
+        self.fallback = fallback or LocalBatchBackend()
+        self._submitted: dict[str, tuple[float, dict[str, str]]] = {}
+        # Mixed jobs: job id -> unfinished (backend, part id) pairs and results so far
+        self._split: dict[str, tuple[list[tuple[BatchBackend, str]], BatchResults]] = {}
+        self._ids = count(1)
+
+    async def submit(self, requests: list[BatchRequest]) -> str:
+        native = [request for request in requests if request.provider.name == "anthropic"]
+        others = [request for request in requests if request.provider.name != "anthropic"]
+        if not others:
+            return await self._submit_native(native)
+
+        fallback_id = await self.fallback.submit(others)
+        parts: list[tuple[BatchBackend, str]] = [(self.fallback, fallback_id)]
+        if native:
+            parts.append((self, await self._submit_native(native)))
+        job_id = f"mixed_{next(self._ids)}"
+        self._split[job_id] = (parts, {})
+        return job_id
+
+    async def results(self, job_id: str) -> BatchResults | None:
+        if job_id not in self._split:
+            return await self._native_results(job_id)
+
+        parts, collected = self._split[job_id]
+        for part in list(parts):
+            backend, part_id = part
+            results = await backend.results(part_id)
+            if results is not None:
+                collected.update(results)
+                parts.remove(part)
+        if parts:
+            return None
+        del self._split[job_id]
+        return collected
+
+    async def _submit_native(self, requests: list[BatchRequest]) -> str:
+        body = {
+            "requests": [
+                {
+                    "custom_id": request.custom_id,
+                    "params": self.http._build_payload(
+                        request.messages,
+                        request.model,
+                        request.temperature,
+                        request.max_tokens,
+                        request.system,
+                        False,
+                    ),
+                }
+                for request in requests
+            ]
+        }
+        response = await self.http.client.post(
+            f"{self.http.base_url}/v1/messages/batches",
+            json=body,
+            headers=self.http._headers(),
+        )
+        response.raise_for_status()
+        job_id: str = response.json()["id"]
+        models = {request.custom_id: request.model for request in requests}
+        self._submitted[job_id] = (time.perf_counter(), models)
+        return job_id
+
+    async def _native_results(self, job_id: str) -> BatchResults | None:
+        client, headers = self.http.client, self.http._headers()
+        response = await client.get(
+            f"{self.http.base_url}/v1/messages/batches/{job_id}", headers=headers
+        )
+        response.raise_for_status()
+        job = response.json()
+        if job["processing_status"] != "ended":
+            return None
+
+        response = await client.get(job["results_url"], headers=headers)
+        response.raise_for_status()
+
+        start_time, models = self._submitted.pop(job_id)
+        latency_ms = (time.perf_counter() - start_time) * 1000
+        results: BatchResults = {}
+        for line in response.text.splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            results[entry["custom_id"]] = self._parse_result(
+                entry["result"], models[entry["custom_id"]], latency_ms, job_id
+            )
+        return results
+
+    def _parse_result(
+        self,
+        result: dict[str, Any],
+        model: str,
+        latency_ms: float,
+        job_id: str,
+    ) -> ProviderResponse | Exception:
+        if result["type"] != "succeeded":
+            return RuntimeError(f"Batch request {result['type']}: {result.get('error')}")
+
+        content, input_tokens, output_tokens = self.http._parse_response(result["message"])
+        cost = anthropic_cost(input_tokens, output_tokens, model) * ANTHROPIC_BATCH_DISCOUNT
+        return ProviderResponse(
+            content=content,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            model=model,
+            cost=cost,
+            latency_ms=latency_ms,
+            metadata={"batch_id": job_id},
+        )
+
+
+class BatchCollector:
+    """Groups concurrent requests into batch jobs and resolves them when done.
+
+    Requests arriving within ``window_s`` of each other go into the same
+    job, so debates advancing in lockstep submit each step as one batch.
+    """
+
+    def __init__(
+        self,
+        backend: BatchBackend,
+        window_s: float = 0.05,
+        poll_interval_s: float = 30.0,
+        max_size: int = 10_000,
+    ) -> None:
+        """Initialize the collector.
+
+        Args:
+            backend: Batch API to submit jobs to.
+            window_s: Quiet period after the last request before submitting.
+            poll_interval_s: Seconds between job status checks.
+            max_size: Requests that trigger an immediate submission.
+        """
+        self.backend = backend
+        self.window_s = window_s
+        self.poll_interval_s = poll_interval_s
+        self.max_size = max_size
+        self.jobs_submitted = 0
+        self._pending: list[tuple[BatchRequest, asyncio.Future[ProviderResponse]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._ids = count(1)
+        self._flushes: set[asyncio.Task[None]] = set()
+
+    def next_id(self) -> str:
+        """Return a fresh custom_id."""
+        return f"req_{next(self._ids)}"
+
+    async def submit(self, request: BatchRequest) -> ProviderResponse:
+        """Queue a request and wait for its batch to finish."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[ProviderResponse] = loop.create_future()
+        self._pending.append((request, future))
+
+        # Debounce: flush once no new request has arrived for window_s
+        if self._timer is not None:
+            self._timer.cancel()
+        if len(self._pending) >= self.max_size:
+            self._flush()
+        else:
+            self._timer = loop.call_later(self.window_s, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        self._timer = None
+        pending, self._pending = self._pending, []
+        if pending:
+            task = asyncio.ensure_future(self._run(pending))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+
+    async def _run(
+        self,
+        pending: list[tuple[BatchRequest, asyncio.Future[ProviderResponse]]],
+    ) -> None:
+        try:
+            job_id = await self.backend.submit([request for request, _ in pending])
+            self.jobs_submitted += 1
+            while (results := await self.backend.results(job_id)) is None:
+                await asyncio.sleep(self.poll_interval_s)
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for request, future in pending:
+            if future.done():
+                continue
+            result = results.get(request.custom_id)
+            if result is None:
+                result = RuntimeError(f"Batch {job_id} returned no result for {request.custom_id}")
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+class BatchingProvider(LLMProvider):
+    """Provider wrapper that sends every generate call through a BatchCollector."""
+
+    def __init__(self, primary: LLMProvider, collector: BatchCollector) -> None:
+        """Initialize the batching provider.
+
+        Args:
+            primary: Provider whose pricing and models to use.
+            collector: Collector shared by every provider in the batch run.
+        """
+        self.primary = primary
+        self.collector = collector
+
+    @property
+    def name(self) -> str:
+        return self.primary.name
+
+    @property
+    def supported_models(self) -> list[str]:
+        return self.primary.supported_models
+
+    async def generate(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        system: str | None = None,
+        **kwargs: object,
+    ) -> ProviderResponse:
+        """Queue the request for the next batch job and wait for its result."""
+        request = BatchRequest(
+            custom_id=self.collector.next_id(),
+            provider=self.primary,
+            model=model,
+            messages=messages,
+            system=system,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        return await self.collector.submit(request)
+
+    async def stream(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        system: str | None = None,
+        **kwargs: object,
+    ) -> AsyncIterator[str]:
+        """Yield the batched response as a single chunk."""
+        response = await self.generate(
+            messages,
+            model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            system=system,
+            **kwargs,
+        )
+        yield response["content"]
+
+    def estimate_cost(
+        self,
+        input_tokens: int,
+        output_tokens: int,
+        model: str,
+    ) -> float:
+        """Estimate cost using the wrapped provider's pricing."""
+        return self.primary.estimate_cost(input_tokens, output_tokens, model)
@@ -0,0 +1,342 @@
+"""Record provider traffic to a cassette file and replay it offline."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import IO, Any, cast
+
+from mad.providers.base import LLMProvider, ProviderResponse, TokenCallback
+from mad.providers.response_cache import response_cache_key
+from mad.tokens import estimate_prompt_tokens, get_tokenizer
+
+
+class CassetteMissError(LookupError):
+    """A replayed request was never recorded."""
+
+
+class Cassette:
+    """Append-only log of provider requests and responses.
+
+    Each entry is one compact JSON line holding the request, its key and
+    the response (content, token counts, cost and ``latency_ms``). Paths
+    ending in ``.gz`` are gzip-compressed. Identical requests recorded more
+    than once are replayed in recorded order, repeating the last response.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Open a cassette, loading any entries already on disk.
+
+        Args:
+            path: Cassette file (``.jsonl`` or ``.jsonl.gz``).
+        """
+        self.path = Path(path)
+        self._responses: dict[str, list[ProviderResponse]] = {}
+        self._cursors: dict[str, int] = {}
+        self._file: IO[str] | None = None
+        if self.path.exists():
+            with self._open("rt") as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._responses.setdefault(entry["key"], []).append(entry["response"])
+
+    def _open(self, mode: str) -> IO[str]:
+        if self.path.suffix == ".gz":
+            return cast(IO[str], gzip.open(self.path, mode, encoding="utf-8"))
+        return open(self.path, mode, encoding="utf-8")  # noqa: SIM115
+
+    def __len__(self) -> int:
+        return sum(len(responses) for responses in self._responses.values())
+
+    def record(self, key: str, request: dict[str, Any], response: ProviderResponse) -> None:
+        """Append a request and its response.
+
+        Args:
+            key: Request key from ``response_cache_key``.
+            request: Request fields (provider, model, messages, ...).
+            response: Provider response.
+        """
+        if self._file is None:
+            self._file = self._open("at")
+        entry = {"key": key, "request": request, "response": response}
+        self._file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        self._file.flush()
+        self._responses.setdefault(key, []).append(ProviderResponse(**response))
+
+    def next(self, key: str) -> ProviderResponse | None:
+        """Return the next recorded response for a key, or None if never recorded."""
+        responses = self._responses.get(key)
+        if not responses:
+            return None
+        cursor = self._cursors.get(key, 0)
+        self._cursors[key] = cursor + 1
+        return responses[min(cursor, len(responses) - 1)]
+
+    def rewind(self) -> None:
+        """Replay every key from its first recorded response again."""
+        self._cursors.clear()
+
+    def close(self) -> None:
+        """Close the file opened for recording."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _request(
+    provider: str,
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    system: str | None,
+    messages: list[dict[str, str]],
+) -> tuple[str, dict[str, Any]]:
+    key = response_cache_key(provider, model, temperature, system, messages, max_tokens)
+    request = {
+        "provider": provider,
+        "model": model,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+        "system": system,
+        "messages": messages,
+    }
+    return key, request
+
+
+class RecordingProvider(LLMProvider):
+    """Provider wrapper that records every request and response to a cassette."""
+
+    def __init__(self, primary: LLMProvider, cassette: Cassette) -> None:
+        """Initialize the recording provider.
+
+        Args:
+            primary: Provider to call and record.
+            cassette: Cassette to append to.
+        """
+        self.primary = primary
+        self.cassette = cassette
+
+    @property
+    def name(self) -> str:
+        return self.primary.name
+
+    @property
+    def supported_models(self) -> list[str]:
+        return self.primary.supported_models
+
+    def validate_model(self, model: str) -> bool:
+        return self.primary.validate_model(model)
+
+    async def generate(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        system: str | None = None,
+        **kwargs: object,
+    ) -> ProviderResponse:
+        """Generate with the wrapped provider and record the exchange."""
+        response = await self.primary.generate(
+            messages,
+            model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            system=system,
+            **kwargs,
+        )
+        self.cassette.record(
+            *_request(self.name, model, temperature, max_tokens, system, messages), response
+        )
+        return response
+
+    async def generate_stream(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        on_token: TokenCallback,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        system: str | None = None,
+        **kwargs: object,
+    ) -> ProviderResponse:
+        """Stream with the wrapped provider and record the assembled response."""
+        response = await self.primary.generate_stream(
+            messages,
+            model,
+            on_token,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            system=system,
+            **kwargs,
+        )
+        self.cassette.record(
+            *_request(self.name, model, temperature, max_tokens, system, messages), response
+        )
+        return response
+
+    async def stream(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        system: str | None = None,
+        **kwargs: object,
+    ) -> AsyncIterator[str]:
+        """Stream with the wrapped provider, recording once the stream completes.
+
+        Raw streams report no usage, so token counts are estimated.
+        """
+        start_time = time.perf_counter()
+        chunks: list[str] = []
+        async for chunk in self.primary.stream(
+            messages,
+            model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            system=system,
+            **kwargs,
+        ):
+            chunks.append(chunk)
+            yield chunk
+
+        content = "".join(chunks)
+        input_tokens = estimate_prompt_tokens(messages, system, self.name)
+        output_tokens = get_tokenizer(self.name).count(content)
+        response = ProviderResponse(
+            content=content,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            model=model,
+            cost=self.estimate_cost(input_tokens, output_tokens, model),
+            latency_ms=(time.perf_counter() - start_time) * 1000,
+        )
+        self.cassette.record(
+            *_request(self.name, model, temperature, max_tokens, system, messages), response
+        )
+
+    def estimate_cost(
+        self,
+        input_tokens: int,
+        output_tokens: int,
+        model: str,
+    ) -> float:
+        """Estimate cost using the wrapped provider's pricing."""
+        return self.primary.estimate_cost(input_tokens, output_tokens, model)
+
+
+class ReplayProvider(LLMProvider):
+    """Provider that serves recorded responses from a cassette, offline.
+
+    Responses are returned after their recorded ``latency_ms`` multiplied by
+    ``latency_scale`` (0 replays instantly). The wrapped provider is used
+    only for its name, models and pricing; it is never called.
+    """
+
+    def __init__(
+        self,
+        primary: LLMProvider,
+        cassette: Cassette,
+        latency_scale: float = 1.0,
+    ) -> None:
+        """Initialize the replay provider.
+
+        Args:
+            primary: Provider whose traffic was recorded.
+            cassette: Cassette to replay.
+            latency_scale: Multiplier applied to recorded latencies.
+        """
+        self.primary = primary
+        self.cassette = cassette
+        self.latency_scale = latency_scale
+
+    @property
+    def name(self) -> str:
+        return self.primary.name
+
+    @property
+    def supported_models(self) -> list[str]:
+        return self.primary.supported_models
+
+    def validate_model(self, model: str) -> bool:
+        return self.primary.validate_model(model)
+
+    async def _replay(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        system: str | None,
+    ) -> ProviderResponse:
+        key, _ = _request(self.name, model, temperature, max_tokens, system, messages)
+        recorded = self.cassette.next(key)
+        if recorded is None:
+            msg = f"No recorded response for {self.name}:{model} request {key[:12]}"
+            raise CassetteMissError(msg)
+
+        latency_ms = recorded["latency_ms"] * self.latency_scale
+        if latency_ms > 0:
+            await asyncio.sleep(latency_ms / 1000)
+        response = ProviderResponse(**recorded)
+        response["latency_ms"] = latency_ms
+        return response
+
+    async def generate(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        system: str | None = None,
+        **kwargs: object,
+    ) -> ProviderResponse:
+        """Return the recorded response for this request.
+
+        Raises:
+            CassetteMissError: If the request was never recorded.
+        """
+        return await self._replay(messages, model, temperature, max_tokens, system)
+
+    async def generate_stream(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        on_token: TokenCallback,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        system: str | None = None,
+        **kwargs: object,
+    ) -> ProviderResponse:
+        """Replay the recorded response as one chunk."""
+        response = await self._replay(messages, model, temperature, max_tokens, system)
+        on_token(response["content"])
+        return response
+
+    async def stream(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        system: str | None = None,
+        **kwargs: object,
+    ) -> AsyncIterator[str]:
+        """Yield the recorded response as one chunk."""
+        response = await self._replay(messages, model, temperature, max_tokens, system)
+        yield response["content"]
+
+    def estimate_cost(
+        self,
+        input_tokens: int,
+        output_tokens: int,
+        model: str,
+    ) -> float:
+        """Estimate cost using the recorded provider's pricing."""
+        return self.primary.estimate_cost(input_tokens, output_tokens, model)
@@ -0,0 +1,257 @@
+"""Hedged requests for LLM providers."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from typing import Any
+
+from mad.providers.base import LLMProvider, ProviderResponse, TokenCallback
+from mad.tokens import estimate_prompt_tokens
+
+
+class HedgedProvider(LLMProvider):
+    """Provider wrapper that hedges slow requests with a duplicate.
+
+    Latencies of recent calls are tracked per model. Once a call has been
+    running longer than the configured latency percentile, a duplicate
+    request is sent (to the same or an alternate provider/model); whichever
+    finishes first wins and the other is cancelled. The returned cost covers
+    both calls: the loser's own cost if it finished, otherwise the estimated
+    input cost of its prompt.
+
+    Example:
+        ```python
+        from mad.providers import get_provider
+        from mad.providers.hedging import HedgedProvider
+
+        provider = HedgedProvider(get_provider("anthropic"), percentile=0.95)
+        ```
+    """
+
+    def __init__(
+        self,
+        primary: LLMProvider,
+        alternate: LLMProvider | None = None,
+        alternate_model: str | None = None,
+        percentile: float = 0.95,
+        window: int = 100,
+        min_samples: int = 20,
+    ) -> None:
+        """Initialize the hedged provider.
+
+        Args:
+            primary: Provider that receives every request.
+            alternate: Provider for hedge requests (defaults to primary).
+            alternate_model: Model for hedge requests (defaults to the
+                requested model).
+            percentile: Latency percentile (0-1) after which to hedge.
+            window: Number of recent latencies kept per model.
+            min_samples: Latencies needed before hedging starts.
+        """
+        if not 0.0 < percentile < 1.0:
+            msg = f"percentile must be between 0 and 1, got {percentile}"
+            raise ValueError(msg)
+
+        self.primary = primary
+        self.alternate = alternate or primary
+        self.alternate_model = alternate_model
+        self.percentile = percentile
+        self.window = window
+        self.min_samples = min_samples
+        self._latencies: dict[str, deque[float]] = {}
+        self.hedges_sent = 0
+        self.hedges_won = 0
+
+    @property
+    def name(self) -> str:
+        return self.primary.name
+
+    @property
+    def supported_models(self) -> list[str]:
+        return self.primary.supported_models
+
+    def record_latency(self, model: str, latency_ms: float) -> None:
+        """Record an observed latency for a model."""
+        samples = self._latencies.setdefault(model, deque(maxlen=self.window))
+        samples.append(latency_ms)
+
+    def hedge_delay_ms(self, model: str) -> float | None:
+        """Return how long to wait before hedging, or None if not yet known.
+
+        Args:
+            model: Model name.
+
+        Returns:
+            The configured latency percentile of recent calls, in ms.
+        """
+        samples = self._latencies.get(model)
+        if not samples or len(samples) < self.min_samples:
+            return None
+        ordered = sorted(samples)
+        rank = max(0, math.ceil(self.percentile * len(ordered)) - 1)
+        return ordered[rank]
+
+    async def generate(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        system: str | None = None,
+        **kwargs: object,
+    ) -> ProviderResponse:
+        """Generate a response, hedging if the primary call runs long."""
+        request: dict[str, Any] = {
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "system": system,
+            **kwargs,
+        }
+        start_time = time.perf_counter()
+        primary = asyncio.ensure_future(self.primary.generate(model=model, **request))
+
+        delay_ms = self.hedge_delay_ms(model)
+        if delay_ms is not None:
+            await asyncio.wait({primary}, timeout=delay_ms / 1000)
+        if delay_ms is None or primary.done():
+            response = await primary
+            self.record_latency(model, response["latency_ms"])
+            return response
+
+        # Primary is past the latency percentile: send a duplicate
+        self.hedges_sent += 1
+        hedge_model = self.alternate_model or model
+        hedge = asyncio.ensure_future(self.alternate.generate(model=hedge_model, **request))
+
+        try:
+            done, pending = await asyncio.wait(
+                {primary, hedge}, return_when=asyncio.FIRST_COMPLETED
+            )
+            winner = next(
+                (t for t in (primary, hedge) if t in done and t.exception() is None), None
+            )
+            if winner is None:
+                # The first finisher failed; fall back to the other call
+                if pending:
+                    await asyncio.wait(pending)
+                winner = next((t for t in (primary, hedge) if t.exception() is None), primary)
+            response = winner.result()
+        except BaseException:
+            for task in (primary, hedge):
+                task.cancel()
+            raise
+
+        loser = hedge if winner is primary else primary
+        if loser.done() and not loser.cancelled() and loser.exception() is None:
+            loser_cost = loser.result()["cost"]
+        else:
+            loser.cancel()
+            # A cancelled call reports no usage; assume its input was billed
+            loser_provider = self.alternate if loser is hedge else self.primary
+            loser_model = hedge_model if loser is hedge else model
+            loser_cost = loser_provider.estimate_cost(
+                estimate_prompt_tokens(messages, system, loser_provider.name), 0, loser_model
+            )
+
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        if winner is primary:
+            self.record_latency(model, response["latency_ms"])
+        else:
+            self.hedges_won += 1
+            # The primary took at least this long
+            self.record_latency(model, elapsed_ms)
+
+        metadata = dict(response.get("metadata", {}))
+        metadata.update(
+            hedged=True,
+            hedge_winner="primary" if winner is primary else "hedge",
+            hedge_cost=loser_cost,
+        )
+        return ProviderResponse(
+            content=response["content"],
+            input_tokens=response["input_tokens"],
+            output_tokens=response["output_tokens"],
+            model=response["model"],
+            cost=response["cost"] + loser_cost,
+            latency_ms=elapsed_ms,
+            metadata=metadata,
+        )
+
+    def stream(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        system: str | None = None,
+        **kwargs: object,
+    ) -> AsyncIterator[str]:
+        """Stream from the primary provider (streams are not hedged)."""
+        return self.primary.stream(
+            messages,
+            model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            system=system,
+            **kwargs,
+        )
+
+    async def generate_stream(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        on_token: TokenCallback,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        system: str | None = None,
+        **kwargs: object,
+    ) -> ProviderResponse:
+        """Stream from the primary provider (streams are not hedged)."""
+        return await self.primary.generate_stream(
+            messages,
+            model,
+            on_token,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            system=system,
+            **kwargs,
+        )
+
+    def estimate_cost(
+        self,
+        input_tokens: int,
+        output_tokens: int,
+        model: str,
+    ) -> float:
+        """Estimate cost using the primary provider's pricing."""
+        return self.primary.estimate_cost(input_tokens, output_tokens, model)
+
+
+# Shared wrappers so latency history is pooled across orchestrators
+_shared: dict[tuple[int, float], HedgedProvider] = {}
+
+
+def hedged(provider: LLMProvider, percentile: float = 0.95) -> HedgedProvider:
+    """Return the process-wide hedged wrapper for a provider instance.
+
+    Args:
+        provider: Provider to wrap.
+        percentile: Latency percentile after which to hedge.
+
+    Returns:
+        A HedgedProvider shared by every caller with the same arguments.
+    """
+    key = (id(provider), percentile)
+    if key not in _shared:
+        _shared[key] = HedgedProvider(provider, percentile=percentile)
+    return _shared[key]
+
+
+def clear_shared() -> None:
+    """Forget the shared hedged wrappers."""
+    _shared.clear()
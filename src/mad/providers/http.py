@@ -0,0 +1,262 @@
+"""Shared HTTP plumbing for native (non-LangChain) providers."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+import time
+from abc import abstractmethod
+from collections.abc import AsyncIterator
+from typing import Any
+
+import httpx
+
+from mad.providers.base import LLMProvider, ProviderResponse, TokenCallback
+
+# Keep-alive pool shared by every native provider in the process
+POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+DEFAULT_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+_client: httpx.AsyncClient | None = None
+
+
+def http2_available() -> bool:
+    """Return True if the optional ``h2`` package is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def shared_client() -> httpx.AsyncClient:
+    """Return the process-wide pooled HTTP client, creating it if needed.
+
+    HTTP/2 is used when ``h2`` is installed (``pip install mad-framework[http2]``),
+    otherwise connections fall back to HTTP/1.1 keep-alive.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=http2_available(),
+            limits=POOL_LIMITS,
+            timeout=DEFAULT_TIMEOUT,
+        )
+    return _client
+
+
+def pool_stats(client: Any) -> dict[str, int]:
+    """Return connection counts for an httpx client's connection pool.
+
+    Clients whose transport has no connection pool (e.g. ``MockTransport``)
+    report zeros.
+
+    Args:
+        client: An ``httpx.AsyncClient`` (or API-compatible client).
+
+    Returns:
+        Dict with ``open``, ``idle`` and ``in_use`` connection counts.
+    """
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    connections = [c for c in getattr(pool, "connections", []) if not c.is_closed()]
+    idle = sum(1 for c in connections if c.is_idle())
+    return {"open": len(connections), "idle": idle, "in_use": len(connections) - idle}
+
+
+async def close_shared_client() -> None:
+    """Close the shared HTTP client and its pooled connections."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+class HTTPProvider(LLMProvider):
+    """Base class for providers that call a JSON/SSE API over httpx.
+
+    Subclasses translate between the MAD message format and the vendor wire
+    format; this class owns the request plumbing so every call shares one
+    connection pool.
+    """
+
+    #: Environment variable holding the API key.
+    api_key_env: str = ""
+    #: Environment variable that may override the base URL.
+    base_url_env: str = ""
+    #: Default API base URL.
+    default_base_url: str = ""
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        base_url: str | None = None,
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
+        """Initialize the provider.
+
+        Args:
+            api_key: API key (defaults to the provider's environment variable).
+            base_url: API base URL (defaults to the environment or vendor URL).
+            client: HTTP client to use instead of the shared pool.
+        """
+        self.api_key = api_key or os.environ.get(self.api_key_env, "")
+        self.base_url = (
+            base_url or os.environ.get(self.base_url_env) or self.default_base_url
+        ).rstrip("/")
+        self._client = client
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """HTTP client used for requests."""
+        return self._client if self._client is not None else shared_client()
+
+    def pool_stats(self) -> dict[str, int]:
+        """Return open, idle and in-use connection counts for this provider's pool."""
+        return pool_stats(self.client)
+
+    @property
+    @abstractmethod
+    def endpoint(self) -> str:
+        """Path of the generation endpoint, relative to the base URL."""
+        ...
+
+    @abstractmethod
+    def _headers(self) -> dict[str, str]:
+        """Return request headers, including authentication."""
+        ...
+
+    @abstractmethod
+    def _build_payload(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        system: str | None,
+        stream: bool,
+    ) -> dict[str, Any]:
+        """Build the JSON request body."""
+        ...
+
+    @abstractmethod
+    def _parse_response(self, data: dict[str, Any]) -> tuple[str, int, int]:
+        """Extract (content, input_tokens, output_tokens) from a response body."""
+        ...
+
+    @abstractmethod
+    def _parse_event(self, event: dict[str, Any], usage: dict[str, int]) -> str:
+        """Extract text from a stream event, updating usage in place."""
+        ...
+
+    async def _post(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """POST a request and return the decoded JSON body."""
+        response = await self.client.post(
+            f"{self.base_url}{self.endpoint}",
+            json=payload,
+            headers=self._headers(),
+        )
+        response.raise_for_status()
+        data: dict[str, Any] = response.json()
+        return data
+
+    async def _events(self, payload: dict[str, Any]) -> AsyncIterator[dict[str, Any]]:
+        """POST a streaming request and yield decoded server-sent events."""
+        async with self.client.stream(
+            "POST",
+            f"{self.base_url}{self.endpoint}",
+            json=payload,
+            headers=self._headers(),
+        ) as response:
+            if response.is_error:
+                await response.aread()
+                response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if not data or data == "[DONE]":
+                    continue
+                yield json.loads(data)
+
+    async def generate(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        system: str | None = None,
+        **kwargs: object,
+    ) -> ProviderResponse:
+        """Generate a response with a single HTTP request."""
+        start_time = time.perf_counter()
+
+        payload = self._build_payload(messages, model, temperature, max_tokens, system, False)
+        content, input_tokens, output_tokens = self._parse_response(await self._post(payload))
+
+        return self._build_response(content, input_tokens, output_tokens, model, start_time)
+
+    def _build_response(
+        self,
+        content: str,
+        input_tokens: int,
+        output_tokens: int,
+        model: str,
+        start_time: float,
+    ) -> ProviderResponse:
+        """Build a ProviderResponse from parsed output."""
+        return ProviderResponse(
+            content=content,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            model=model,
+            cost=self.estimate_cost(input_tokens, output_tokens, model),
+            latency_ms=(time.perf_counter() - start_time) * 1000,
+        )
+
+    async def stream(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        system: str | None = None,
+        **kwargs: object,
+    ) -> AsyncIterator[str]:
+        """Stream response text over server-sent events."""
+        payload = self._build_payload(messages, model, temperature, max_tokens, system, True)
+        usage: dict[str, int] = {}
+        async for event in self._events(payload):
+            text = self._parse_event(event, usage)
+            if text:
+                yield text
+
+    async def generate_stream(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        on_token: TokenCallback,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        system: str | None = None,
+        **kwargs: object,
+    ) -> ProviderResponse:
+        """Stream a response, forwarding chunks, with exact usage."""
+        start_time = time.perf_counter()
+
+        payload = self._build_payload(messages, model, temperature, max_tokens, system, True)
+        usage: dict[str, int] = {}
+        chunks: list[str] = []
+        async for event in self._events(payload):
+            text = self._parse_event(event, usage)
+            if text:
+                chunks.append(text)
+                on_token(text)
+
+        return self._build_response(
+            "".join(chunks),
+            usage.get("input_tokens", 0),
+            usage.get("output_tokens", 0),
+            model,
+            start_time,
+        )
@@ -3,13 +3,22 @@
 from __future__ import annotations
 
 import time
+from collections import OrderedDict
 from collections.abc import AsyncIterator
 from typing import Any
 
-from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+import httpx
+from langchain_core.messages import (
+    AIMessage,
+    AIMessageChunk,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+)
 from langchain_openai import ChatOpenAI
 
-from mad.providers.base import LLMProvider, ProviderResponse
+from mad.providers.base import LLMProvider, ProviderResponse, TokenCallback
+from mad.providers.http import DEFAULT_TIMEOUT, POOL_LIMITS, http2_available, pool_stats
 
 # Pricing per 1M tokens (as of Dec 2024)
 OPENAI_PRICING = {
@@ -24,11 +33,21 @@ OPENAI_PRICING = {
 
 
 class OpenAIProvider(LLMProvider):
-    """OpenAI GPT provider using LangChain."""
+    """OpenAI GPT provider using LangChain.
 
-    def __init__(self) -> None:
-        """Initialize the OpenAI provider."""
-        self._clients: dict[str, ChatOpenAI] = {}
+    Clients are cached per model in a bounded LRU and share one connection
+    pool; temperature is passed on each call.
+    """
+
+    def __init__(self, max_clients: int = 16) -> None:
+        """Initialize the OpenAI provider.
+
+        Args:
+            max_clients: Number of per-model clients to keep.
+        """
+        self.max_clients = max_clients
+        self._clients: OrderedDict[str, ChatOpenAI] = OrderedDict()
+        self._http: httpx.AsyncClient | None = None
 
     @property
     def name(self) -> str:
@@ -38,15 +57,31 @@ class OpenAIProvider(LLMProvider):
     def supported_models(self) -> list[str]:
         return list(OPENAI_PRICING.keys())
 
-    def _get_client(self, model: str, temperature: float) -> ChatOpenAI:
-        """Get or create a cached client for the model."""
-        cache_key = f"{model}:{temperature}"
-        if cache_key not in self._clients:
-            self._clients[cache_key] = ChatOpenAI(
-                model=model,
-                temperature=temperature,
+    def _http_client(self) -> httpx.AsyncClient:
+        """Return the connection pool shared by every client of this provider."""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                http2=http2_available(),
+                limits=POOL_LIMITS,
+                timeout=DEFAULT_TIMEOUT,
             )
-        return self._clients[cache_key]
+        return self._http
+
+    def _get_client(self, model: str) -> ChatOpenAI:
+        """Get or create a cached client for the model."""
+        if model in self._clients:
+            self._clients.move_to_end(model)
+            return self._clients[model]
+
+        client = ChatOpenAI(model=model, http_async_client=self._http_client())
+        self._clients[model] = client
+        if len(self._clients) > self.max_clients:
+            self._clients.popitem(last=False)
+        return client
+
+    def pool_stats(self) -> dict[str, int]:
+        """Return open, idle and in-use connection counts for the shared pool."""
+        return pool_stats(self._http)
 
     def _convert_messages(
         self, messages: list[dict[str, str]], system: str | None = None
@@ -82,11 +117,20 @@ class OpenAIProvider(LLMProvider):
         """Generate a response using GPT."""
         start_time = time.perf_counter()
 
-        client = self._get_client(model, temperature)
+        client = self._get_client(model)
         lc_messages = self._convert_messages(messages, system)
 
-        response = await client.ainvoke(lc_messages, max_tokens=max_tokens)
+        response = await client.ainvoke(lc_messages, max_tokens=max_tokens, temperature=temperature)
 
+        return self._build_response(response, model, start_time)
+
+    def _build_response(
+        self,
+        response: AIMessage,
+        model: str,
+        start_time: float,
+    ) -> ProviderResponse:
+        """Build a ProviderResponse from a LangChain message."""
         latency_ms = (time.perf_counter() - start_time) * 1000
 
         # Extract token usage
@@ -113,13 +157,45 @@ class OpenAIProvider(LLMProvider):
         **kwargs: object,
     ) -> AsyncIterator[str]:
         """Stream a response from GPT."""
-        client = self._get_client(model, temperature)
+        client = self._get_client(model)
         lc_messages = self._convert_messages(messages, system)
 
-        async for chunk in client.astream(lc_messages, max_tokens=max_tokens):
+        async for chunk in client.astream(
+            lc_messages, max_tokens=max_tokens, temperature=temperature
+        ):
             if chunk.content:
                 yield str(chunk.content)
 
+    async def generate_stream(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        on_token: TokenCallback,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        system: str | None = None,
+        **kwargs: object,
+    ) -> ProviderResponse:
+        """Stream a response from GPT, forwarding chunks, with exact usage."""
+        start_time = time.perf_counter()
+
+        client = self._get_client(model)
+        lc_messages = self._convert_messages(messages, system)
+
+        aggregate: AIMessageChunk | None = None
+        async for chunk in client.astream(
+            lc_messages, max_tokens=max_tokens, temperature=temperature, stream_usage=True
+        ):
+            aggregate = chunk if aggregate is None else aggregate + chunk
+            if chunk.content:
+                on_token(str(chunk.content))
+
+        return self._build_response(
+            aggregate if aggregate is not None else AIMessageChunk(content=""),
+            model,
+            start_time,
+        )
+
     def estimate_cost(
         self,
         input_tokens: int,
@@ -0,0 +1,84 @@
+"""Provider for self-hosted OpenAI-compatible inference servers."""
+
+from __future__ import annotations
+
+import httpx
+
+from mad.providers.openai_http import OpenAIHTTPProvider
+
+
+class OpenAICompatibleProvider(OpenAIHTTPProvider):
+    """Provider for OpenAI-compatible servers such as vLLM or llama.cpp.
+
+    Speaks the Chat Completions API to any ``base_url``. Pricing defaults to
+    zero; pass a table to account for hardware or hosting costs.
+
+    Example:
+        ```python
+        from mad.providers.registry import ProviderRegistry
+
+        ProviderRegistry.register_endpoint(
+            "http://gpu-box:8000/v1",
+            models=["llama-3.1-8b-instruct"],
+        )
+        ```
+    """
+
+    api_key_env = "OPENAI_COMPATIBLE_API_KEY"
+    base_url_env = "OPENAI_COMPATIBLE_BASE_URL"
+    default_base_url = "http://localhost:8000/v1"
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        models: list[str] | None = None,
+        pricing: dict[str, dict[str, float]] | None = None,
+        api_key: str | None = None,
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
+        """Initialize the provider.
+
+        Args:
+            base_url: Server URL including the API prefix (e.g. '.../v1').
+            models: Models the server serves (empty accepts any model).
+            pricing: Per-1M-token prices by model, e.g.
+                ``{"*": {"input": 0.05, "output": 0.1}}``; '*' is the
+                fallback. Defaults to free.
+            api_key: API key, if the server requires one.
+            client: HTTP client to use instead of the shared pool.
+        """
+        super().__init__(api_key=api_key, base_url=base_url, client=client)
+        self.models = list(models or [])
+        self.pricing = dict(pricing or {})
+
+    @property
+    def name(self) -> str:
+        return "openai_compatible"
+
+    @property
+    def supported_models(self) -> list[str]:
+        return self.models
+
+    def validate_model(self, model: str) -> bool:
+        """Accept any model when no model list was given."""
+        return not self.models or model in self.models
+
+    def _headers(self) -> dict[str, str]:
+        headers = {"content-type": "application/json"}
+        if self.api_key:
+            headers["authorization"] = f"Bearer {self.api_key}"
+        return headers
+
+    def estimate_cost(
+        self,
+        input_tokens: int,
+        output_tokens: int,
+        model: str,
+    ) -> float:
+        """Estimate cost from the configured pricing table (free by default)."""
+        pricing = self.pricing.get(model) or self.pricing.get("*")
+        if pricing is None:
+            return 0.0
+        input_cost = (input_tokens / 1_000_000) * pricing.get("input", 0.0)
+        output_cost = (output_tokens / 1_000_000) * pricing.get("output", 0.0)
+        return input_cost + output_cost
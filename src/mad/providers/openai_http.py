@@ -0,0 +1,102 @@
+"""OpenAI (GPT) provider over native pooled HTTP."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from mad.providers.http import HTTPProvider
+from mad.providers.openai import OPENAI_PRICING
+
+
+class OpenAIHTTPProvider(HTTPProvider):
+    """OpenAI GPT provider calling the Chat Completions API directly.
+
+    Skips the LangChain message conversion of ``OpenAIProvider`` and
+    reuses the shared keep-alive connection pool.
+    """
+
+    api_key_env = "OPENAI_API_KEY"
+    base_url_env = "OPENAI_BASE_URL"
+    default_base_url = "https://api.openai.com/v1"
+
+    @property
+    def name(self) -> str:
+        return "openai"
+
+    @property
+    def supported_models(self) -> list[str]:
+        return list(OPENAI_PRICING.keys())
+
+    @property
+    def endpoint(self) -> str:
+        return "/chat/completions"
+
+    def _headers(self) -> dict[str, str]:
+        return {
+            "authorization": f"Bearer {self.api_key}",
+            "content-type": "application/json",
+        }
+
+    def _build_payload(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        system: str | None,
+        stream: bool,
+    ) -> dict[str, Any]:
+        wire_messages = []
+        sys_prompt = system
+
+        for msg in messages:
+            role = msg.get("role", "user")
+            content = msg.get("content", "")
+
+            if role == "system":
+                sys_prompt = content
+            else:
+                wire_messages.append(
+                    {"role": "assistant" if role == "assistant" else "user", "content": content}
+                )
+
+        if sys_prompt:
+            wire_messages.insert(0, {"role": "system", "content": sys_prompt})
+
+        payload: dict[str, Any] = {
+            "model": model,
+            "messages": wire_messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
+        if stream:
+            payload["stream"] = True
+            payload["stream_options"] = {"include_usage": True}
+        return payload
+
+    def _parse_response(self, data: dict[str, Any]) -> tuple[str, int, int]:
+        choices = data.get("choices") or [{}]
+        content = choices[0].get("message", {}).get("content") or ""
+        usage = data.get("usage") or {}
+        return content, usage.get("prompt_tokens", 0), usage.get("completion_tokens", 0)
+
+    def _parse_event(self, event: dict[str, Any], usage: dict[str, int]) -> str:
+        if event.get("usage"):
+            usage["input_tokens"] = event["usage"].get("prompt_tokens", 0)
+            usage["output_tokens"] = event["usage"].get("completion_tokens", 0)
+        choices = event.get("choices") or []
+        if choices:
+            return str(choices[0].get("delta", {}).get("content") or "")
+        return ""
+
+    def estimate_cost(
+        self,
+        input_tokens: int,
+        output_tokens: int,
+        model: str,
+    ) -> float:
+        """Estimate cost based on OpenAI pricing."""
+        pricing = OPENAI_PRICING.get(model, {"input": 2.50, "output": 10.0})
+        input_cost = (input_tokens / 1_000_000) * pricing["input"]
+        output_cost = (output_tokens / 1_000_000) * pricing["output"]
+        return input_cost + output_cost
@@ -0,0 +1,248 @@
+"""Client-side request and token rate limiting for LLM providers."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+
+from mad.providers.base import LLMProvider, ProviderResponse, TokenCallback
+from mad.tokens import estimate_prompt_tokens
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Requests-per-minute and tokens-per-minute limits (None = unlimited)."""
+
+    rpm: int | None = None
+    tpm: int | None = None
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at ``per_minute / 60`` per second.
+
+    The level may go negative when a reservation is corrected upwards; later
+    callers then wait until the debt is refilled.
+    """
+
+    def __init__(self, per_minute: int) -> None:
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.level = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def time_until(self, amount: float) -> float:
+        """Return seconds until ``amount`` can be taken (0 if available now)."""
+        self._refill()
+        amount = min(amount, self.capacity)
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) / self.rate
+
+    def take(self, amount: float) -> None:
+        """Remove ``amount`` from the bucket."""
+        self._refill()
+        self.level -= min(amount, self.capacity)
+
+    def adjust(self, delta: float) -> None:
+        """Add ``delta`` (negative to charge more) to the bucket."""
+        self._refill()
+        self.level = min(self.capacity, self.level + delta)
+
+
+class RateLimiter:
+    """Async RPM/TPM limiter with first-come, first-served queueing.
+
+    Callers wait in arrival order instead of being rejected: the head of the
+    queue holds the lock until both buckets can cover its request, so a
+    large request is never starved by a stream of small ones.
+    """
+
+    def __init__(self, limit: RateLimit) -> None:
+        self.limit = limit
+        self.requests = TokenBucket(limit.rpm) if limit.rpm else None
+        self.tokens = TokenBucket(limit.tpm) if limit.tpm else None
+        self.waited_s = 0.0
+        self._lock: asyncio.Lock | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _get_lock(self) -> asyncio.Lock:
+        # Locks bind to one event loop; recreate when used from another
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._loop is not loop:
+            self._lock = asyncio.Lock()
+            self._loop = loop
+        return self._lock
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until one request and ``tokens`` tokens are available, then take them."""
+        async with self._get_lock():
+            while True:
+                wait = max(
+                    self.requests.time_until(1) if self.requests else 0.0,
+                    self.tokens.time_until(tokens) if self.tokens else 0.0,
+                )
+                if wait <= 0:
+                    break
+                self.waited_s += wait
+                await asyncio.sleep(wait)
+            if self.requests:
+                self.requests.take(1)
+            if self.tokens:
+                self.tokens.take(tokens)
+
+    def reconcile(self, reserved: int, actual: int) -> None:
+        """Correct a token reservation once actual usage is known."""
+        if self.tokens:
+            self.tokens.adjust(reserved - actual)
+
+
+class RateLimitedProvider(LLMProvider):
+    """Provider wrapper that waits on a shared RPM/TPM limiter before each call.
+
+    Tokens are reserved up front from a prompt-size estimate, corrected
+    from the usage the provider reports, and refunded if the call fails.
+    """
+
+    def __init__(
+        self,
+        primary: LLMProvider,
+        limiter_for: Callable[[str], RateLimiter | None],
+    ) -> None:
+        """Initialize the rate-limited provider.
+
+        Args:
+            primary: Provider to wrap.
+            limiter_for: Returns the limiter for a model, or None if unlimited.
+        """
+        self.primary = primary
+        self.limiter_for = limiter_for
+
+    @property
+    def name(self) -> str:
+        return self.primary.name
+
+    @property
+    def supported_models(self) -> list[str]:
+        return self.primary.supported_models
+
+    async def _reserve(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        system: str | None,
+    ) -> tuple[RateLimiter | None, int]:
+        limiter = self.limiter_for(model)
+        if limiter is None:
+            return None, 0
+        reserved = estimate_prompt_tokens(messages, system, self.primary.name)
+        await limiter.acquire(reserved)
+        return limiter, reserved
+
+    @staticmethod
+    def _settle(limiter: RateLimiter | None, reserved: int, response: ProviderResponse) -> None:
+        if limiter is not None:
+            limiter.reconcile(reserved, response["input_tokens"] + response["output_tokens"])
+
+    @staticmethod
+    def _release(limiter: RateLimiter | None, reserved: int) -> None:
+        # A failed or cancelled call reports no usage: refund its reservation
+        if limiter is not None:
+            limiter.reconcile(reserved, 0)
+
+    async def generate(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        system: str | None = None,
+        **kwargs: object,
+    ) -> ProviderResponse:
+        """Generate a response once the rate limiter admits the call."""
+        limiter, reserved = await self._reserve(messages, model, system)
+        try:
+            response = await self.primary.generate(
+                messages,
+                model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                system=system,
+                **kwargs,
+            )
+        except BaseException:
+            self._release(limiter, reserved)
+            raise
+        self._settle(limiter, reserved, response)
+        return response
+
+    async def generate_stream(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        on_token: TokenCallback,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        system: str | None = None,
+        **kwargs: object,
+    ) -> ProviderResponse:
+        """Stream a response once the rate limiter admits the call."""
+        limiter, reserved = await self._reserve(messages, model, system)
+        try:
+            response = await self.primary.generate_stream(
+                messages,
+                model,
+                on_token,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                system=system,
+                **kwargs,
+            )
+        except BaseException:
+            self._release(limiter, reserved)
+            raise
+        self._settle(limiter, reserved, response)
+        return response
+
+    async def stream(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        system: str | None = None,
+        **kwargs: object,
+    ) -> AsyncIterator[str]:
+        """Stream once the rate limiter admits the call (usage is not corrected)."""
+        limiter, reserved = await self._reserve(messages, model, system)
+        started = False
+        try:
+            async for chunk in self.primary.stream(
+                messages,
+                model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                system=system,
+                **kwargs,
+            ):
+                started = True
+                yield chunk
+        except BaseException:
+            if not started:
+                self._release(limiter, reserved)
+            raise
+
+    def estimate_cost(
+        self,
+        input_tokens: int,
+        output_tokens: int,
+        model: str,
+    ) -> float:
+        """Estimate cost using the wrapped provider's pricing."""
+        return self.primary.estimate_cost(input_tokens, output_tokens, model)
@@ -4,13 +4,24 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Literal
 
+from mad.providers import hedging, resilience, response_cache, router
 from mad.providers.anthropic import AnthropicProvider
+from mad.providers.anthropic_http import AnthropicHTTPProvider
+from mad.providers.cassette import Cassette, RecordingProvider, ReplayProvider
+from mad.providers.http import HTTPProvider
 from mad.providers.openai import OpenAIProvider
+from mad.providers.openai_compatible import OpenAICompatibleProvider
+from mad.providers.openai_http import OpenAIHTTPProvider
+from mad.providers.ratelimit import RateLimit, RateLimitedProvider, RateLimiter
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from mad.providers.base import LLMProvider
 
-ProviderType = Literal["anthropic", "openai", "google"]
+ProviderType = Literal[
+    "anthropic", "openai", "google", "anthropic_http", "openai_http", "openai_compatible"
+]
 
 
 class ProviderRegistry:
@@ -19,10 +30,26 @@ class ProviderRegistry:
     _providers: dict[str, type[LLMProvider]] = {
         "anthropic": AnthropicProvider,
         "openai": OpenAIProvider,
+        # Native httpx implementations sharing one keep-alive pool
+        "anthropic_http": AnthropicHTTPProvider,
+        "openai_http": OpenAIHTTPProvider,
+        # Self-hosted OpenAI-compatible servers (vLLM, llama.cpp, ...)
+        "openai_compatible": OpenAICompatibleProvider,
     }
 
     _instances: dict[str, LLMProvider] = {}
 
+    # Cassette that get() records to or replays from, and its wrapped instances
+    _cassette: Cassette | None = None
+    _cassette_mode: Literal["record", "replay"] | None = None
+    _latency_scale: float = 1.0
+    _cassette_instances: dict[str, LLMProvider] = {}
+
+    # Rate limits keyed by (provider, model); model "*" applies to every model
+    _rate_limits: dict[tuple[str, str], RateLimit] = {}
+    _limiters: dict[tuple[str, str], RateLimiter] = {}
+    _rate_limited: dict[tuple[int, str], RateLimitedProvider] = {}
+
     @classmethod
     def register(cls, name: str, provider_class: type[LLMProvider]) -> None:
         """Register a new provider class."""
@@ -32,28 +59,76 @@ class ProviderRegistry:
     def get(
         cls,
         name: ProviderType,
+        base_url: str | None = None,
     ) -> LLMProvider:
         """Get or create a provider instance.
 
         Args:
-            name: Provider name ('anthropic', 'openai', 'google').
+            name: Provider name ('anthropic', 'openai', 'google', ...).
+            base_url: Optional API base URL for HTTP providers; each URL gets
+                its own instance.
 
         Returns:
             LLMProvider instance.
 
         Raises:
-            ValueError: If provider not found.
+            ValueError: If provider not found, or it does not take a base URL.
         """
         if name not in cls._providers:
             available = ", ".join(cls._providers.keys())
             msg = f"Unknown provider '{name}'. Available: {available}"
             raise ValueError(msg)
 
-        if name not in cls._instances:
+        key = name if base_url is None else f"{name}@{base_url}"
+        if key not in cls._instances:
             provider_class = cls._providers[name]
-            cls._instances[name] = provider_class()
+            if base_url is None:
+                cls._instances[key] = provider_class()
+            elif issubclass(provider_class, HTTPProvider):
+                cls._instances[key] = provider_class(base_url=base_url)
+            else:
+                msg = f"Provider '{name}' does not accept a base_url"
+                raise ValueError(msg)
+
+        if cls._cassette is None:
+            return cls._instances[key]
+        if key not in cls._cassette_instances:
+            instance = cls._instances[key]
+            cls._cassette_instances[key] = (
+                RecordingProvider(instance, cls._cassette)
+                if cls._cassette_mode == "record"
+                else ReplayProvider(instance, cls._cassette, cls._latency_scale)
+            )
+        return cls._cassette_instances[key]
+
+    @classmethod
+    def register_endpoint(
+        cls,
+        base_url: str,
+        models: list[str] | None = None,
+        pricing: dict[str, dict[str, float]] | None = None,
+        api_key: str | None = None,
+    ) -> OpenAICompatibleProvider:
+        """Register a self-hosted OpenAI-compatible endpoint.
+
+        Later ``get("openai_compatible", base_url=...)`` calls return this
+        instance, so agents configured with the same ``base_url`` use its
+        model list and pricing.
+
+        Args:
+            base_url: Server URL including the API prefix (e.g. '.../v1').
+            models: Models the server serves (empty accepts any model).
+            pricing: Per-1M-token prices by model ('*' as fallback).
+            api_key: API key, if the server requires one.
 
-        return cls._instances[name]
+        Returns:
+            The registered provider.
+        """
+        provider = OpenAICompatibleProvider(
+            base_url=base_url, models=models, pricing=pricing, api_key=api_key
+        )
+        cls._instances[f"openai_compatible@{base_url}"] = provider
+        return provider
 
     @classmethod
     def available_providers(cls) -> list[str]:
@@ -62,19 +137,137 @@ class ProviderRegistry:
 
     @classmethod
     def clear_cache(cls) -> None:
-        """Clear all cached provider instances."""
+        """Clear all cached provider instances and the wrappers built around them."""
         cls._instances.clear()
+        cls._cassette_instances.clear()
+        # Wrappers are keyed by id(provider), so drop them with their providers
+        cls._rate_limited.clear()
+        hedging.clear_shared()
+        resilience.clear_shared()
+        response_cache.clear_shared()
+        router.clear_shared()
+
+    @classmethod
+    def record(cls, path: str | Path) -> Cassette:
+        """Record every request and response of providers from ``get()``.
+
+        Args:
+            path: Cassette file to append to (``.gz`` for gzip).
+
+        Returns:
+            The cassette being recorded.
+        """
+        cls.eject_cassette()
+        cls._cassette = Cassette(path)
+        cls._cassette_mode = "record"
+        return cls._cassette
+
+    @classmethod
+    def replay(cls, path: str | Path, latency_scale: float = 1.0) -> Cassette:
+        """Serve providers from ``get()`` out of a recorded cassette, offline.
+
+        Args:
+            path: Cassette file recorded with ``record()``.
+            latency_scale: Multiplier for recorded latencies (0 for instant).
+
+        Returns:
+            The cassette being replayed.
+
+        Raises:
+            FileNotFoundError: If the cassette does not exist.
+        """
+        cassette = Cassette(path)
+        if not cassette.path.exists():
+            msg = f"No cassette at {cassette.path}"
+            raise FileNotFoundError(msg)
+        cls.eject_cassette()
+        cls._cassette = cassette
+        cls._cassette_mode = "replay"
+        cls._latency_scale = latency_scale
+        return cls._cassette
+
+    @classmethod
+    def eject_cassette(cls) -> None:
+        """Stop recording or replaying; ``get()`` returns live providers again."""
+        if cls._cassette is not None:
+            cls._cassette.close()
+        cls._cassette = None
+        cls._cassette_mode = None
+        cls._latency_scale = 1.0
+        cls._cassette_instances.clear()
+
+    @classmethod
+    def set_rate_limit(
+        cls,
+        provider: str,
+        model: str = "*",
+        rpm: int | None = None,
+        tpm: int | None = None,
+    ) -> None:
+        """Set client-side request and token limits for a provider.
+
+        Each model gets its own buckets; ``model="*"`` sets the default for
+        models without a specific limit. Limits are shared by every debate in
+        the process.
+
+        Args:
+            provider: Provider name (e.g. 'anthropic').
+            model: Model name, or '*' for all models.
+            rpm: Requests per minute (None for unlimited).
+            tpm: Tokens per minute, input plus output (None for unlimited).
+        """
+        cls._rate_limits[(provider, model)] = RateLimit(rpm=rpm, tpm=tpm)
+        # Rebuild buckets on next use so the new limits take effect
+        for key in [key for key in cls._limiters if key[0] == provider]:
+            if model in ("*", key[1]):
+                del cls._limiters[key]
+
+    @classmethod
+    def clear_rate_limits(cls) -> None:
+        """Remove all rate limits and their buckets."""
+        cls._rate_limits.clear()
+        cls._limiters.clear()
+
+    @classmethod
+    def limiter(cls, provider: str, model: str) -> RateLimiter | None:
+        """Return the shared limiter for a provider and model, if limited."""
+        key = (provider, model)
+        if key not in cls._limiters:
+            limit = cls._rate_limits.get(key) or cls._rate_limits.get((provider, "*"))
+            if limit is None or (limit.rpm is None and limit.tpm is None):
+                return None
+            cls._limiters[key] = RateLimiter(limit)
+        return cls._limiters[key]
+
+    @classmethod
+    def rate_limited(cls, provider: LLMProvider, name: str | None = None) -> RateLimitedProvider:
+        """Wrap a provider so its calls wait on the registry's shared limiters.
+
+        Args:
+            provider: Provider to wrap.
+            name: Registry name the limits were set under (e.g.
+                'anthropic_http'); defaults to ``provider.name``.
+        """
+        limit_name = name or provider.name
+        key = (id(provider), limit_name)
+        if key not in cls._rate_limited:
+            cls._rate_limited[key] = RateLimitedProvider(
+                provider, lambda model: cls.limiter(limit_name, model)
+            )
+        return cls._rate_limited[key]
 
 
 def get_provider(
     name: ProviderType,
+    base_url: str | None = None,
 ) -> LLMProvider:
     """Convenience function to get a provider from the registry.
 
     Args:
-        name: Provider name ('anthropic', 'openai', 'google').
+        name: Provider name ('anthropic', 'openai', 'google', ...).
+        base_url: Optional API base URL for HTTP providers.
 
     Returns:
         LLMProvider instance.
     """
-    return ProviderRegistry.get(name)
+    return ProviderRegistry.get(name, base_url)
@@ -0,0 +1,445 @@
+"""Retries, backoff and circuit breaking for LLM providers."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import Counter
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Any, Literal
+
+import httpx
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+from mad.providers.base import LLMProvider, ProviderResponse, TokenCallback
+from mad.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# 529 is Anthropic's "overloaded"
+RETRYABLE_STATUS = frozenset({408, 409, 429, 500, 502, 503, 504, 529})
+
+BreakerState = Literal["closed", "open", "half_open"]
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a call is rejected because its circuit breaker is open."""
+
+    def __init__(self, key: str, retry_in: float) -> None:
+        super().__init__(f"Circuit open for {key}; retry in {retry_in:.1f}s")
+        self.key = key
+        self.retry_in = retry_in
+
+
+def status_code(exc: BaseException) -> int | None:
+    """Return the HTTP status carried by a provider error, if any.
+
+    Works for ``httpx.HTTPStatusError`` and the vendor SDK errors raised
+    through LangChain, which expose ``status_code`` and/or ``response``.
+    """
+    code = getattr(exc, "status_code", None)
+    if isinstance(code, int):
+        return code
+    response = getattr(exc, "response", None)
+    code = getattr(response, "status_code", None)
+    return code if isinstance(code, int) else None
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Return True for rate limits, overloads, server errors and timeouts."""
+    if isinstance(exc, httpx.TransportError | asyncio.TimeoutError):
+        return True
+    code = status_code(exc)
+    return code is not None and code in RETRYABLE_STATUS
+
+
+def retry_after(exc: BaseException) -> float | None:
+    """Return the server-requested delay in seconds from a Retry-After header."""
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    value = headers.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class RetryPolicy:
+    """Jittered exponential backoff settings."""
+
+    max_attempts: int = 4
+    initial_delay: float = 0.5
+    max_delay: float = 30.0
+
+    def wait(self, retry_state: RetryCallState) -> float:
+        """Return the delay before the next attempt, honouring Retry-After."""
+        outcome = retry_state.outcome
+        exc = outcome.exception() if outcome is not None else None
+        if exc is not None:
+            requested = retry_after(exc)
+            if requested is not None:
+                return min(requested, self.max_delay)
+        backoff = wait_random_exponential(multiplier=self.initial_delay, max=self.max_delay)
+        return float(backoff(retry_state))
+
+
+class CircuitBreaker:
+    """Circuit breaker that opens after consecutive failures.
+
+    After ``reset_timeout`` seconds an open breaker lets a single trial call
+    through (half-open); its success closes the breaker, its failure
+    re-opens it.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> BreakerState:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def retry_in(self) -> float:
+        """Seconds until an open breaker allows a trial call."""
+        if self.opened_at is None:
+            return 0.0
+        return max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+
+    def allow(self) -> bool:
+        """Return True if a call may proceed."""
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def release_trial(self) -> None:
+        """Free the half-open trial slot without changing the breaker's state.
+
+        Called when a trial ends without a verdict (cancelled, or failed with
+        a non-retryable error), so the next call can run the trial instead.
+        """
+        self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> bool:
+        """Record a failure; return True if this opened the breaker."""
+        self.failures += 1
+        was_open = self.opened_at is not None
+        if was_open or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+            self._trial_in_flight = False
+            return not was_open
+        return False
+
+
+@dataclass
+class ResilienceMetrics:
+    """Counters for retries and breaker activity, keyed by ``provider:model``."""
+
+    attempts: Counter[str] = field(default_factory=Counter)
+    retries: Counter[str] = field(default_factory=Counter)
+    failures: Counter[str] = field(default_factory=Counter)
+    rejections: Counter[str] = field(default_factory=Counter)
+    breaker_opens: Counter[str] = field(default_factory=Counter)
+    breakers: dict[str, CircuitBreaker] = field(default_factory=dict)
+
+    def breaker(self, key: str, failure_threshold: int, reset_timeout: float) -> CircuitBreaker:
+        """Return the breaker for a key, creating it if needed."""
+        if key not in self.breakers:
+            self.breakers[key] = CircuitBreaker(failure_threshold, reset_timeout)
+        return self.breakers[key]
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return per-key counters and breaker state."""
+        keys = set(self.attempts) | set(self.breakers)
+        return {
+            key: {
+                "attempts": self.attempts[key],
+                "retries": self.retries[key],
+                "failures": self.failures[key],
+                "rejections": self.rejections[key],
+                "breaker_opens": self.breaker_opens[key],
+                "breaker_state": self.breakers[key].state if key in self.breakers else "closed",
+            }
+            for key in sorted(keys)
+        }
+
+    def reset(self) -> None:
+        """Clear all counters and breakers."""
+        for counter in (
+            self.attempts,
+            self.retries,
+            self.failures,
+            self.rejections,
+            self.breaker_opens,
+        ):
+            counter.clear()
+        self.breakers.clear()
+
+
+# Process-wide metrics and breakers, shared by every wrapped provider
+provider_metrics = ResilienceMetrics()
+
+
+class ResilientProvider(LLMProvider):
+    """Provider wrapper adding retries with backoff and circuit breaking.
+
+    Retryable failures (429/529, 5xx, timeouts, connection errors) are
+    retried with jittered exponential backoff, waiting for ``Retry-After``
+    when the server sends it. Each provider/model pair has a circuit
+    breaker that rejects calls with ``CircuitOpenError`` after repeated
+    failures instead of hammering a struggling endpoint. Streaming calls
+    are only retried until the first chunk has been forwarded.
+
+    Example:
+        ```python
+        from mad.providers import get_provider
+        from mad.providers.resilience import ResilientProvider
+
+        provider = ResilientProvider(get_provider("anthropic"))
+        ```
+    """
+
+    def __init__(
+        self,
+        primary: LLMProvider,
+        policy: RetryPolicy | None = None,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        metrics: ResilienceMetrics | None = None,
+    ) -> None:
+        """Initialize the resilient provider.
+
+        Args:
+            primary: Provider to wrap.
+            policy: Backoff settings (defaults to RetryPolicy()).
+            failure_threshold: Consecutive failures that open a breaker.
+            reset_timeout: Seconds an open breaker waits before a trial call.
+            metrics: Metrics sink (defaults to the process-wide one).
+        """
+        self.primary = primary
+        self.policy = policy or RetryPolicy()
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.metrics = metrics if metrics is not None else provider_metrics
+
+    @property
+    def name(self) -> str:
+        return self.primary.name
+
+    @property
+    def supported_models(self) -> list[str]:
+        return self.primary.supported_models
+
+    def _key(self, model: str) -> str:
+        return f"{self.primary.name}:{model}"
+
+    async def _call(
+        self,
+        model: str,
+        attempt: Callable[[], Awaitable[ProviderResponse]],
+        retryable: Callable[[BaseException], bool] = is_retryable,
+    ) -> ProviderResponse:
+        """Run ``attempt()`` under the retry policy and the model's breaker."""
+        key = self._key(model)
+        breaker = self.metrics.breaker(key, self.failure_threshold, self.reset_timeout)
+
+        async for retrying in AsyncRetrying(
+            stop=stop_after_attempt(self.policy.max_attempts),
+            wait=self.policy.wait,
+            retry=retry_if_exception(lambda exc: retryable(exc) and breaker.state == "closed"),
+            before_sleep=lambda state: self._before_sleep(key, state),
+            reraise=True,
+        ):
+            with retrying:
+                trial = breaker.state == "half_open"
+                if not breaker.allow():
+                    self.metrics.rejections[key] += 1
+                    raise CircuitOpenError(key, breaker.retry_in())
+                self.metrics.attempts[key] += 1
+                try:
+                    result = await attempt()
+                except Exception as exc:
+                    self._record_failure(key, breaker, exc)
+                    raise
+                finally:
+                    if trial:
+                        breaker.release_trial()
+                breaker.record_success()
+                return result
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def _record_failure(self, key: str, breaker: CircuitBreaker, exc: Exception) -> None:
+        """Count a retryable failure against the breaker."""
+        if not is_retryable(exc):
+            return
+        self.metrics.failures[key] += 1
+        if breaker.record_failure():
+            self.metrics.breaker_opens[key] += 1
+            logger.warning("circuit_opened", key=key, failures=breaker.failures)
+
+    def _before_sleep(self, key: str, retry_state: RetryCallState) -> None:
+        self.metrics.retries[key] += 1
+        outcome = retry_state.outcome
+        logger.info(
+            "provider_retry",
+            key=key,
+            attempt=retry_state.attempt_number,
+            error=repr(outcome.exception()) if outcome is not None else None,
+        )
+
+    async def generate(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        system: str | None = None,
+        **kwargs: object,
+    ) -> ProviderResponse:
+        """Generate a response, retrying transient failures."""
+
+        async def attempt() -> ProviderResponse:
+            return await self.primary.generate(
+                messages,
+                model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                system=system,
+                **kwargs,
+            )
+
+        return await self._call(model, attempt)
+
+    async def generate_stream(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        on_token: TokenCallback,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        system: str | None = None,
+        **kwargs: object,
+    ) -> ProviderResponse:
+        """Stream a response, retrying only failures before the first chunk."""
+        forwarded = False
+
+        def forward(chunk: str) -> None:
+            nonlocal forwarded
+            forwarded = True
+            on_token(chunk)
+
+        async def attempt() -> ProviderResponse:
+            return await self.primary.generate_stream(
+                messages,
+                model,
+                forward,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                system=system,
+                **kwargs,
+            )
+
+        return await self._call(
+            model, attempt, retryable=lambda exc: not forwarded and is_retryable(exc)
+        )
+
+    async def stream(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        system: str | None = None,
+        **kwargs: object,
+    ) -> AsyncIterator[str]:
+        """Stream from the wrapped provider, rejecting calls on open breakers."""
+        key = self._key(model)
+        breaker = self.metrics.breaker(key, self.failure_threshold, self.reset_timeout)
+        trial = breaker.state == "half_open"
+        if not breaker.allow():
+            self.metrics.rejections[key] += 1
+            raise CircuitOpenError(key, breaker.retry_in())
+        self.metrics.attempts[key] += 1
+        try:
+            async for chunk in self.primary.stream(
+                messages,
+                model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                system=system,
+                **kwargs,
+            ):
+                yield chunk
+        except Exception as exc:
+            self._record_failure(key, breaker, exc)
+            raise
+        finally:
+            if trial:
+                breaker.release_trial()
+        breaker.record_success()
+
+    def estimate_cost(
+        self,
+        input_tokens: int,
+        output_tokens: int,
+        model: str,
+    ) -> float:
+        """Estimate cost using the wrapped provider's pricing."""
+        return self.primary.estimate_cost(input_tokens, output_tokens, model)
+
+
+# Shared wrappers so every orchestrator retries through the same breakers
+_shared: dict[tuple[int, int], ResilientProvider] = {}
+
+
+def resilient(provider: LLMProvider, max_attempts: int = 4) -> ResilientProvider:
+    """Return the process-wide resilient wrapper for a provider instance.
+
+    Args:
+        provider: Provider to wrap.
+        max_attempts: Total attempts per call, including the first.
+
+    Returns:
+        A ResilientProvider shared by every caller with the same arguments.
+    """
+    key = (id(provider), max_attempts)
+    if key not in _shared:
+        _shared[key] = ResilientProvider(provider, RetryPolicy(max_attempts=max_attempts))
+    return _shared[key]
+
+
+def clear_shared() -> None:
+    """Forget the shared resilient wrappers."""
+    _shared.clear()
@@ -0,0 +1,350 @@
+"""Two-tier (memory + SQLite) cache of provider responses."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
+from mad.providers.base import LLMProvider, ProviderResponse, TokenCallback
+
+
+@dataclass
+class ResponseCacheStats:
+    """Hit/miss and size statistics for a ResponseCache."""
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    bytes_stored: int = 0
+    bytes_served: int = 0
+
+    @property
+    def hits(self) -> int:
+        """Return hits from either tier."""
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def response_cache_key(
+    provider: str,
+    model: str,
+    temperature: float,
+    system: str | None,
+    messages: list[dict[str, str]],
+    max_tokens: int,
+    base_url: str | None = None,
+) -> str:
+    """Return a hash identifying a provider request.
+
+    Args:
+        provider: Provider name.
+        model: Model name.
+        temperature: Sampling temperature.
+        system: System prompt.
+        messages: Prompt messages.
+        max_tokens: Output token limit.
+        base_url: Endpoint of HTTP providers, so servers sharing a provider
+            name (e.g. several openai_compatible hosts) never share entries.
+
+    Returns:
+        Hex digest of the canonical request.
+    """
+    payload: list[object] = [provider, model, temperature, system, messages, max_tokens]
+    if base_url is not None:
+        payload.append(base_url)
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class ResponseCache:
+    """LRU in-memory cache with TTL, backed by an optional SQLite file.
+
+    Lookups check memory first, then disk; disk hits are promoted to memory.
+    Entries older than ``ttl_s`` are treated as misses in both tiers.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        ttl_s: float = 86400.0,
+        path: str | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum entries held in memory.
+            ttl_s: Seconds an entry stays valid.
+            path: SQLite file for the disk tier (None for memory only).
+        """
+        self.maxsize = maxsize
+        self.ttl_s = ttl_s
+        self.path = path
+        self.stats = ResponseCacheStats()
+        self._memory: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, created REAL NOT NULL, value TEXT NOT NULL)"
+            )
+            self._db.commit()
+
+    def _remember(self, key: str, created: float, value: str) -> None:
+        self._memory[key] = (created, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def _get(self, key: str) -> ProviderResponse | None:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and now - entry[0] <= self.ttl_s:
+                self._memory.move_to_end(key)
+                self.stats.memory_hits += 1
+            elif self._db is not None:
+                row = self._db.execute(
+                    "SELECT created, value FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                entry = (row[0], row[1]) if row and now - row[0] <= self.ttl_s else None
+                if entry is None:
+                    self.stats.misses += 1
+                    return None
+                self._remember(key, *entry)
+                self.stats.disk_hits += 1
+            else:
+                self.stats.misses += 1
+                return None
+            self.stats.bytes_served += len(entry[1])
+        response: ProviderResponse = json.loads(entry[1])
+        return response
+
+    def _set(self, key: str, response: ProviderResponse) -> None:
+        value = json.dumps(response)
+        created = time.time()
+        with self._lock:
+            self._remember(key, created, value)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses (key, created, value) VALUES (?, ?, ?)",
+                    (key, created, value),
+                )
+                self._db.commit()
+            self.stats.bytes_stored += len(value)
+
+    async def get(self, key: str) -> ProviderResponse | None:
+        """Return the cached response for a key, or None."""
+        if self._db is None:
+            return self._get(key)
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, response: ProviderResponse) -> None:
+        """Store a response under a key."""
+        if self._db is None:
+            self._set(key, response)
+        else:
+            await asyncio.to_thread(self._set, key, response)
+
+    def clear(self) -> None:
+        """Remove all entries from both tiers and reset statistics."""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM responses")
+                self._db.commit()
+            self.stats = ResponseCacheStats()
+
+    def close(self) -> None:
+        """Close the disk tier."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+def endpoint_of(provider: LLMProvider) -> str | None:
+    """Return the base URL of the HTTP provider under any wrappers, if any."""
+    current: object = provider
+    while isinstance(current, LLMProvider):
+        base_url = getattr(current, "base_url", None)
+        if isinstance(base_url, str):
+            return base_url
+        current = getattr(current, "primary", None)
+    return None
+
+
+class CachedProvider(LLMProvider):
+    """Provider wrapper that serves repeated requests from a ResponseCache.
+
+    Cache hits cost nothing: they are returned with ``cost=0.0`` and
+    ``metadata["cache_hit"] = True``. Token counts are those of the
+    original response.
+    """
+
+    def __init__(self, primary: LLMProvider, cache: ResponseCache) -> None:
+        """Initialize the cached provider.
+
+        Args:
+            primary: Provider to wrap.
+            cache: Cache to read and populate.
+        """
+        self.primary = primary
+        self.cache = cache
+        self.endpoint = endpoint_of(primary)
+
+    @property
+    def name(self) -> str:
+        return self.primary.name
+
+    @property
+    def supported_models(self) -> list[str]:
+        return self.primary.supported_models
+
+    async def _lookup(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        system: str | None,
+    ) -> tuple[str, ProviderResponse | None]:
+        key = response_cache_key(
+            self.name, model, temperature, system, messages, max_tokens, self.endpoint
+        )
+        start_time = time.perf_counter()
+        cached = await self.cache.get(key)
+        if cached is None:
+            return key, None
+
+        metadata = dict(cached.get("metadata", {}))
+        metadata["cache_hit"] = True
+        return key, ProviderResponse(
+            content=cached["content"],
+            input_tokens=cached["input_tokens"],
+            output_tokens=cached["output_tokens"],
+            model=cached["model"],
+            cost=0.0,
+            latency_ms=(time.perf_counter() - start_time) * 1000,
+            metadata=metadata,
+        )
+
+    async def generate(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        system: str | None = None,
+        **kwargs: object,
+    ) -> ProviderResponse:
+        """Return a cached response, or generate and cache one."""
+        key, cached = await self._lookup(messages, model, temperature, max_tokens, system)
+        if cached is not None:
+            return cached
+
+        response = await self.primary.generate(
+            messages,
+            model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            system=system,
+            **kwargs,
+        )
+        await self.cache.set(key, response)
+        return response
+
+    async def generate_stream(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        on_token: TokenCallback,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        system: str | None = None,
+        **kwargs: object,
+    ) -> ProviderResponse:
+        """Replay a cached response as one chunk, or stream and cache one."""
+        key, cached = await self._lookup(messages, model, temperature, max_tokens, system)
+        if cached is not None:
+            on_token(cached["content"])
+            return cached
+
+        response = await self.primary.generate_stream(
+            messages,
+            model,
+            on_token,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            system=system,
+            **kwargs,
+        )
+        await self.cache.set(key, response)
+        return response
+
+    def stream(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        system: str | None = None,
+        **kwargs: object,
+    ) -> AsyncIterator[str]:
+        """Stream from the wrapped provider (raw streams are not cached)."""
+        return self.primary.stream(
+            messages,
+            model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            system=system,
+            **kwargs,
+        )
+
+    def estimate_cost(
+        self,
+        input_tokens: int,
+        output_tokens: int,
+        model: str,
+    ) -> float:
+        """Estimate cost using the wrapped provider's pricing."""
+        return self.primary.estimate_cost(input_tokens, output_tokens, model)
+
+
+# Shared caches and wrappers so every orchestrator hits the same entries
+_caches: dict[tuple[str | None, float], ResponseCache] = {}
+_wrappers: dict[tuple[int, int], CachedProvider] = {}
+
+
+def shared_response_cache(path: str | None = None, ttl_s: float = 86400.0) -> ResponseCache:
+    """Return the process-wide response cache for a disk path and TTL."""
+    key = (path, ttl_s)
+    if key not in _caches:
+        _caches[key] = ResponseCache(ttl_s=ttl_s, path=path)
+    return _caches[key]
+
+
+def cached(provider: LLMProvider, cache: ResponseCache) -> CachedProvider:
+    """Return the process-wide caching wrapper for a provider and cache."""
+    key = (id(provider), id(cache))
+    if key not in _wrappers:
+        _wrappers[key] = CachedProvider(provider, cache)
+    return _wrappers[key]
+
+
+def clear_shared() -> None:
+    """Forget the shared caching wrappers (cached responses are kept)."""
+    _wrappers.clear()
@@ -0,0 +1,373 @@
+"""Latency- and cost-aware routing across candidate models."""
+
+from __future__ import annotations
+
+import math
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+from mad.providers.base import LLMProvider, ProviderResponse, TokenCallback
+from mad.tokens import estimate_prompt_tokens
+from mad.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+RoutingPolicy = Literal["fastest", "cheapest", "cheapest_under_p95"]
+
+
+@dataclass
+class Route:
+    """A candidate (provider, model) pair and its live statistics."""
+
+    provider: LLMProvider
+    model: str
+    latency_ms: float | None = None  # EWMA of successful calls
+    error_rate: float = 0.0  # EWMA of failures (1) and successes (0)
+    last_failure: float | None = None
+    calls: int = 0
+    latencies: deque[float] = field(default_factory=lambda: deque(maxlen=100))
+
+    @property
+    def label(self) -> str:
+        """Return 'provider:model'."""
+        return f"{self.provider.name}:{self.model}"
+
+    @property
+    def p95_ms(self) -> float | None:
+        """Return the nearest-rank p95 of recent latencies, if any."""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[max(0, math.ceil(0.95 * len(ordered)) - 1)]
+
+
+class RouterProvider(LLMProvider):
+    """Provider that routes each call to one of several candidate models.
+
+    Candidates are ranked on every call from their EWMA latency, EWMA error
+    rate and ``estimate_cost`` under one of three policies:
+
+    - ``fastest``: lowest EWMA latency.
+    - ``cheapest``: lowest estimated cost.
+    - ``cheapest_under_p95``: cheapest candidate whose p95 latency is within
+      ``p95_target_ms``, falling back to the lowest p95.
+
+    Candidates whose error rate reaches ``error_threshold`` are ranked last
+    until ``recovery_s`` has passed since their last failure. A failed call
+    fails over to the next candidate, so traffic moves away from a degraded
+    vendor automatically. The chosen route is reported in response metadata.
+
+    Example:
+        ```python
+        from mad.providers import get_provider
+        from mad.providers.router import RouterProvider
+
+        router = RouterProvider(
+            [
+                (get_provider("anthropic"), "claude-3-5-haiku-latest"),
+                (get_provider("openai"), "gpt-4o-mini"),
+            ],
+            policy="cheapest_under_p95",
+            p95_target_ms=4000,
+        )
+        ```
+    """
+
+    def __init__(
+        self,
+        candidates: list[tuple[LLMProvider, str]],
+        policy: RoutingPolicy = "fastest",
+        p95_target_ms: float | None = None,
+        alpha: float = 0.2,
+        error_threshold: float = 0.5,
+        recovery_s: float = 30.0,
+    ) -> None:
+        """Initialize the router.
+
+        Args:
+            candidates: (provider, model) pairs to route between.
+            policy: How to rank candidates.
+            p95_target_ms: Latency target for ``cheapest_under_p95``.
+            alpha: EWMA smoothing factor for latency and error rate.
+            error_threshold: Error rate at which a candidate is degraded.
+            recovery_s: Seconds after its last failure before a degraded
+                candidate is ranked normally again.
+        """
+        if not candidates:
+            msg = "RouterProvider needs at least one candidate"
+            raise ValueError(msg)
+
+        self.routes = [Route(provider, model) for provider, model in candidates]
+        self.policy = policy
+        self.p95_target_ms = p95_target_ms
+        self.alpha = alpha
+        self.error_threshold = error_threshold
+        self.recovery_s = recovery_s
+        self._output_tokens: float | None = None  # EWMA across all routes
+
+    @property
+    def name(self) -> str:
+        return "router"
+
+    @property
+    def supported_models(self) -> list[str]:
+        return [route.model for route in self.routes]
+
+    def validate_model(self, model: str) -> bool:
+        """Accept any model; the router chooses the model itself."""
+        return True
+
+    def _ewma(self, current: float | None, sample: float) -> float:
+        if current is None:
+            return sample
+        return self.alpha * sample + (1 - self.alpha) * current
+
+    def record_success(self, route: Route, response: ProviderResponse) -> None:
+        """Update a route's statistics after a successful call."""
+        route.calls += 1
+        route.latency_ms = self._ewma(route.latency_ms, response["latency_ms"])
+        route.latencies.append(response["latency_ms"])
+        route.error_rate = self._ewma(route.error_rate, 0.0)
+        self._output_tokens = self._ewma(self._output_tokens, response["output_tokens"])
+
+    def record_failure(self, route: Route) -> None:
+        """Update a route's statistics after a failed call."""
+        route.calls += 1
+        route.error_rate = self._ewma(route.error_rate, 1.0)
+        route.last_failure = time.monotonic()
+
+    def degraded(self, route: Route) -> bool:
+        """Return True if the route has failed too often, too recently."""
+        if route.error_rate < self.error_threshold or route.last_failure is None:
+            return False
+        return time.monotonic() - route.last_failure < self.recovery_s
+
+    def _cost(self, route: Route, input_tokens: int | dict[str, int], output_tokens: int) -> float:
+        if isinstance(input_tokens, dict):
+            input_tokens = input_tokens[route.provider.name]
+        return route.provider.estimate_cost(input_tokens, output_tokens, route.model)
+
+    def rank(self, input_tokens: int | dict[str, int], output_tokens: int) -> list[Route]:
+        """Order candidates by the routing policy, best first.
+
+        Args:
+            input_tokens: Estimated prompt tokens, or a count per provider
+                name when candidates use different tokenizers.
+            output_tokens: Expected completion tokens.
+
+        Returns:
+            All routes, healthy ones first.
+        """
+
+        def key(route: Route) -> tuple[Any, ...]:
+            cost = self._cost(route, input_tokens, output_tokens)
+            # Unmeasured routes sort first under 'fastest' so each gets tried
+            latency = route.latency_ms if route.latency_ms is not None else 0.0
+            if self.policy == "fastest":
+                return (self.degraded(route), latency, cost)
+            if self.policy == "cheapest":
+                return (self.degraded(route), cost, latency)
+            p95 = route.p95_ms
+            within = self.p95_target_ms is None or p95 is None or p95 <= self.p95_target_ms
+            return (self.degraded(route), not within, cost if within else p95)
+
+        return sorted(self.routes, key=key)
+
+    def _plan(
+        self,
+        messages: list[dict[str, str]],
+        system: str | None,
+        max_tokens: int,
+    ) -> list[Route]:
+        output_tokens = (
+            round(self._output_tokens) if self._output_tokens is not None else max_tokens
+        )
+        input_tokens = {
+            route.provider.name: estimate_prompt_tokens(messages, system, route.provider.name)
+            for route in self.routes
+        }
+        return self.rank(input_tokens, output_tokens)
+
+    def _metadata(self, route: Route, failovers: int) -> dict[str, Any]:
+        return {"route": route.label, "route_policy": self.policy, "route_failovers": failovers}
+
+    def _failed(self, route: Route, error: Exception) -> None:
+        self.record_failure(route)
+        logger.warning(
+            "route_failed",
+            route=route.label,
+            error_rate=round(route.error_rate, 3),
+            error=str(error),
+        )
+
+    async def generate(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        system: str | None = None,
+        **kwargs: object,
+    ) -> ProviderResponse:
+        """Generate with the best-ranked candidate, failing over on errors.
+
+        The ``model`` argument is ignored; the router picks the model.
+        """
+        last_error: Exception | None = None
+        for failovers, route in enumerate(self._plan(messages, system, max_tokens)):
+            try:
+                response = await route.provider.generate(
+                    messages,
+                    route.model,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    system=system,
+                    **kwargs,
+                )
+            except Exception as e:
+                self._failed(route, e)
+                last_error = e
+                continue
+
+            self.record_success(route, response)
+            response["metadata"] = {
+                **response.get("metadata", {}),
+                **self._metadata(route, failovers),
+            }
+            return response
+
+        assert last_error is not None
+        raise last_error
+
+    async def generate_stream(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        on_token: TokenCallback,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        system: str | None = None,
+        **kwargs: object,
+    ) -> ProviderResponse:
+        """Stream from the best-ranked candidate.
+
+        Fails over only while no token has been forwarded yet.
+        """
+        last_error: Exception | None = None
+        for failovers, route in enumerate(self._plan(messages, system, max_tokens)):
+            started = False
+
+            def forward(token: str) -> None:
+                nonlocal started
+                started = True
+                on_token(token)
+
+            try:
+                response = await route.provider.generate_stream(
+                    messages,
+                    route.model,
+                    forward,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    system=system,
+                    **kwargs,
+                )
+            except Exception as e:
+                self._failed(route, e)
+                if started:
+                    raise
+                last_error = e
+                continue
+
+            self.record_success(route, response)
+            response["metadata"] = {
+                **response.get("metadata", {}),
+                **self._metadata(route, failovers),
+            }
+            return response
+
+        assert last_error is not None
+        raise last_error
+
+    async def stream(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        system: str | None = None,
+        **kwargs: object,
+    ) -> AsyncIterator[str]:
+        """Stream from the best-ranked candidate, failing over before the first chunk."""
+        last_error: Exception | None = None
+        for route in self._plan(messages, system, max_tokens):
+            started = False
+            try:
+                async for chunk in route.provider.stream(
+                    messages,
+                    route.model,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    system=system,
+                    **kwargs,
+                ):
+                    started = True
+                    yield chunk
+            except Exception as e:
+                self._failed(route, e)
+                if started:
+                    raise
+                last_error = e
+                continue
+            return
+
+        assert last_error is not None
+        raise last_error
+
+    def estimate_cost(
+        self,
+        input_tokens: int,
+        output_tokens: int,
+        model: str,
+    ) -> float:
+        """Estimate cost on the candidate the router would pick now."""
+        route = self.rank(input_tokens, output_tokens)[0]
+        return self._cost(route, input_tokens, output_tokens)
+
+
+_shared: dict[tuple[Any, ...], RouterProvider] = {}
+
+
+def routed(
+    candidates: list[tuple[LLMProvider, str]],
+    policy: RoutingPolicy = "fastest",
+    p95_target_ms: float | None = None,
+) -> RouterProvider:
+    """Return the process-wide router for a set of candidates.
+
+    Sharing the router keeps its latency and error statistics across debates.
+
+    Args:
+        candidates: (provider, model) pairs to route between.
+        policy: How to rank candidates.
+        p95_target_ms: Latency target for ``cheapest_under_p95``.
+
+    Returns:
+        A RouterProvider shared by every caller with the same arguments.
+    """
+    key = (
+        tuple((id(provider), model) for provider, model in candidates),
+        policy,
+        p95_target_ms,
+    )
+    if key not in _shared:
+        _shared[key] = RouterProvider(candidates, policy=policy, p95_target_ms=p95_target_ms)
+    return _shared[key]
+
+
+def clear_shared() -> None:
+    """Forget the shared routers."""
+    _shared.clear()
@@ -0,0 +1,208 @@
+"""Offline token counting for pre-flight prompt sizing.
+
+Counts are produced locally, before any provider call, by a tokenizer
+registered per provider. Every provider has a calibrated heuristic by
+default; exact tokenizers can be plugged in with ``register_tokenizer``.
+Counts are memoized per text, so re-estimating a growing transcript only
+tokenizes the messages that are new.
+
+Example:
+    ```python
+    from mad import tokens
+
+    tokens.register_tokenizer("openai", tokens.TiktokenTokenizer("o200k_base"))
+    tokens.estimate_prompt_tokens(messages, system="You are a debater", provider="openai")
+    ```
+"""
+
+from __future__ import annotations
+
+import math
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any
+
+from mad.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Role markers and separators added around each message
+MESSAGE_OVERHEAD = 4
+
+
+class Tokenizer(ABC):
+    """Counts the tokens a provider would bill for a piece of text."""
+
+    #: Short identifier, used in logs.
+    name: str = "tokenizer"
+
+    @abstractmethod
+    def count(self, text: str) -> int:
+        """Return the number of tokens in text."""
+        ...
+
+
+class HeuristicTokenizer(Tokenizer):
+    """Character-ratio estimate calibrated per provider.
+
+    ASCII text is counted at ``chars_per_token`` characters per token.
+    Non-ASCII text (accents, CJK, Hangul) tokenizes far less efficiently and
+    is counted at ``non_ascii_chars_per_token``.
+    """
+
+    name = "heuristic"
+
+    def __init__(
+        self,
+        chars_per_token: float = 4.0,
+        non_ascii_chars_per_token: float = 1.0,
+    ) -> None:
+        """Initialize the tokenizer.
+
+        Args:
+            chars_per_token: Average ASCII characters per token.
+            non_ascii_chars_per_token: Average non-ASCII characters per token.
+        """
+        self.chars_per_token = chars_per_token
+        self.non_ascii_chars_per_token = non_ascii_chars_per_token
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        if text.isascii():
+            return max(1, math.ceil(len(text) / self.chars_per_token))
+
+        # Non-ASCII code points take 2-4 UTF-8 bytes; most are 3 (CJK, Hangul)
+        non_ascii = (len(text.encode("utf-8")) - len(text)) // 2
+        ascii_chars = len(text) - non_ascii
+        tokens = ascii_chars / self.chars_per_token + non_ascii / self.non_ascii_chars_per_token
+        return max(1, math.ceil(tokens))
+
+
+class TiktokenTokenizer(Tokenizer):
+    """Exact OpenAI tokenizer backed by ``tiktoken``.
+
+    ``tiktoken`` downloads encodings on first use; offline, the encoding must
+    already be in its cache (``TIKTOKEN_CACHE_DIR``). If the encoding cannot
+    be loaded, counts fall back to ``fallback``.
+    """
+
+    name = "tiktoken"
+
+    def __init__(self, encoding: str = "o200k_base", fallback: Tokenizer | None = None) -> None:
+        """Initialize the tokenizer.
+
+        Args:
+            encoding: tiktoken encoding name.
+            fallback: Tokenizer used when the encoding is unavailable.
+        """
+        self.encoding_name = encoding
+        self.fallback = fallback or HeuristicTokenizer(chars_per_token=4.0)
+        self._encoding: Any = None
+        self._loaded = False
+
+    def _load(self) -> Any:
+        if not self._loaded:
+            self._loaded = True
+            try:
+                import tiktoken
+
+                self._encoding = tiktoken.get_encoding(self.encoding_name)
+            except Exception as e:
+                logger.warning(
+                    "tokenizer_unavailable",
+                    tokenizer=self.name,
+                    encoding=self.encoding_name,
+                    error=str(e),
+                )
+        return self._encoding
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        encoding = self._load()
+        if encoding is None:
+            return self.fallback.count(text)
+        return len(encoding.encode(text, disallowed_special=()))
+
+
+# Claude's tokenizer averages fewer characters per English token than OpenAI's
+_DEFAULT = HeuristicTokenizer(chars_per_token=4.0)
+_tokenizers: dict[str, Tokenizer] = {
+    "anthropic": HeuristicTokenizer(chars_per_token=3.5),
+    "anthropic_http": HeuristicTokenizer(chars_per_token=3.5),
+    "openai": HeuristicTokenizer(chars_per_token=4.0),
+    "openai_http": HeuristicTokenizer(chars_per_token=4.0),
+    "google": HeuristicTokenizer(chars_per_token=4.0),
+}
+
+
+def register_tokenizer(provider: str, tokenizer: Tokenizer) -> None:
+    """Use a tokenizer for a provider's prompts.
+
+    Args:
+        provider: Provider name (as in ``LLMProvider.name``).
+        tokenizer: Tokenizer to use.
+    """
+    _tokenizers[provider] = tokenizer
+
+
+def get_tokenizer(provider: str | None = None) -> Tokenizer:
+    """Return the tokenizer for a provider (the default heuristic if unknown)."""
+    if provider is None:
+        return _DEFAULT
+    return _tokenizers.get(provider, _DEFAULT)
+
+
+@lru_cache(maxsize=16_384)
+def _count(tokenizer: Tokenizer, text: str) -> int:
+    return tokenizer.count(text)
+
+
+def count_tokens(text: str, provider: str | None = None) -> int:
+    """Count the tokens in text, memoized per tokenizer and text.
+
+    Args:
+        text: Text to count.
+        provider: Provider whose tokenizer to use.
+
+    Returns:
+        Token count.
+    """
+    if not text:
+        return 0
+    return _count(get_tokenizer(provider), text)
+
+
+def estimate_prompt_tokens(
+    messages: list[dict[str, str]],
+    system: str | None = None,
+    provider: str | None = None,
+) -> int:
+    """Estimate the input tokens of a prompt before sending it.
+
+    Args:
+        messages: List of message dicts with 'role' and 'content'.
+        system: Optional system prompt.
+        provider: Provider whose tokenizer to use.
+
+    Returns:
+        Estimated input token count.
+    """
+    tokenizer = get_tokenizer(provider)
+    total = _count(tokenizer, system) if system else 0
+    for message in messages:
+        content = message.get("content", "")
+        total += (_count(tokenizer, content) if content else 0) + MESSAGE_OVERHEAD
+    return total
+
+
+def cache_info() -> dict[str, int]:
+    """Return memoization statistics (hits, misses, size)."""
+    info = _count.cache_info()
+    return {"hits": info.hits, "misses": info.misses, "size": info.currsize}
+
+
+def clear_cache() -> None:
+    """Forget memoized token counts."""
+    _count.cache_clear()
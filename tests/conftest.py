@@ -1,7 +1,102 @@
 """Pytest configuration and fixtures for MAD Framework tests."""
 
+import asyncio
+from collections import Counter, defaultdict
+
 import pytest
 
+from mad.providers.base import LLMProvider, ProviderResponse
+from mad.providers.registry import ProviderRegistry
+
+DEFAULT_REPLIES = {
+    "summary": "Short summary",
+    "judge": '{"verdict": "Scripted verdict", "confidence": 0.8}',
+    "moderator": '{"consensus_score": 0.2, "should_continue": true}',
+    "debater": "An argument",
+}
+
+
+class ScriptedProvider(LLMProvider):
+    """Provider answering each agent role with scripted content.
+
+    Roles are told apart by the system prompt (compaction summaries, judge,
+    moderator, otherwise debater). A reply is a string, or a callable taking
+    the number of earlier calls for that role.
+    """
+
+    def __init__(
+        self,
+        replies=None,
+        latency_ms=1.0,
+        delay_s=0.0,
+        cost=0.001,
+        input_tokens=100,
+        output_tokens=10,
+    ):
+        self.replies = {**DEFAULT_REPLIES, **(replies or {})}
+        self.latency_ms = latency_ms
+        self.delay_s = delay_s
+        self.cost = cost
+        self.input_tokens = input_tokens
+        self.output_tokens = output_tokens
+        self.calls = Counter()
+        self.prompts = defaultdict(list)
+
+    @property
+    def name(self):
+        return "anthropic"
+
+    @property
+    def supported_models(self):
+        return []
+
+    @property
+    def total_calls(self):
+        """Return the number of calls across all roles."""
+        return sum(self.calls.values())
+
+    @staticmethod
+    def role(system):
+        """Return the agent role a system prompt belongs to."""
+        system = (system or "").lower()
+        if "condense" in system:
+            return "summary"
+        for role in ("judge", "moderator"):
+            if role in system:
+                return role
+        return "debater"
+
+    async def generate(self, messages, model, **kwargs):
+        role = self.role(kwargs.get("system"))
+        reply = self.replies[role]
+        content = reply(self.calls[role]) if callable(reply) else reply
+        self.calls[role] += 1
+        self.prompts[role].append(messages[0]["content"] if messages else "")
+        await asyncio.sleep(self.delay_s)
+        return ProviderResponse(
+            content=content,
+            input_tokens=self.input_tokens,
+            output_tokens=self.output_tokens,
+            model=model,
+            cost=self.cost,
+            latency_ms=self.latency_ms,
+        )
+
+    async def stream(self, messages, model, **kwargs):
+        yield "streamed"
+
+    def estimate_cost(self, input_tokens, output_tokens, model):
+        return 0.0
+
+
+@pytest.fixture
+def registry():
+    """Reset registry instances and cassettes around a test."""
+    ProviderRegistry.clear_cache()
+    yield ProviderRegistry
+    ProviderRegistry.eject_cassette()
+    ProviderRegistry.clear_cache()
+
 
 @pytest.fixture
 def sample_topic() -> str:
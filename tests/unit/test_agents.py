@@ -9,6 +9,7 @@ from mad.agents.base import BaseAgent
 from mad.agents.debater import DebaterAgent
 from mad.agents.judge import JudgeAgent
 from mad.agents.moderator import ModeratorAgent
+from mad.core.state import create_initial_state, create_message
 
 
 # Mock provider for testing
@@ -185,6 +186,82 @@ class TestBaseAgent:
         assert message["metadata"]["custom_field"] == "value"
 
 
+def render_history(agent_id, messages, include_own_messages=True):
+    """Render history from scratch, as agents did before caching."""
+    return [
+        {
+            "role": "assistant" if msg["agent_id"] == agent_id else "user",
+            "content": f"[{msg['agent_role'].upper()} - {msg['agent_id']}]\n{msg['content']}",
+        }
+        for msg in messages
+        if include_own_messages or msg["agent_id"] != agent_id
+    ]
+
+
+def transcript(rounds, debaters):
+    """Create a transcript of debater messages."""
+    return [
+        create_message(f"debater_{d}", "debater", "p", "m", f"Argument {r}.{d}", r)
+        for r in range(1, rounds + 1)
+        for d in range(1, debaters + 1)
+    ]
+
+
+class TestIncrementalHistory:
+    """Tests for the per-debate rendered history cache."""
+
+    @pytest.mark.parametrize("include_own", [True, False])
+    def test_matches_full_render_as_transcript_grows(self, include_own):
+        """Incremental history should equal a full re-render after every turn."""
+        agent = DebaterAgent("debater_1", None, "model")
+        state = create_initial_state(topic="Topic", debate_id="d1")
+        full = transcript(rounds=4, debaters=3)
+
+        for n in range(len(full) + 1):
+            state["messages"] = full[:n]
+            history = agent._build_conversation_history(state, include_own)
+            assert history == render_history("debater_1", full[:n], include_own)
+
+    def test_only_new_messages_are_rendered(self):
+        """Already-rendered message dicts should be reused."""
+        agent = DebaterAgent("debater_1", None, "model")
+        state = create_initial_state(topic="Topic", debate_id="d1")
+        full = transcript(rounds=2, debaters=2)
+
+        state["messages"] = full[:2]
+        first = agent._build_conversation_history(state)
+        state["messages"] = full
+        second = agent._build_conversation_history(state)
+
+        assert second[0] is first[0]
+        assert second is not first
+
+    def test_rewritten_transcript_is_rebuilt(self):
+        """A transcript that no longer extends the cached one should be re-rendered."""
+        agent = DebaterAgent("debater_1", None, "model")
+        state = create_initial_state(topic="Topic", debate_id="d1")
+        state["messages"] = transcript(rounds=2, debaters=2)
+        agent._build_conversation_history(state)
+
+        state["messages"] = transcript(rounds=3, debaters=1)
+
+        assert agent._build_conversation_history(state) == render_history(
+            "debater_1", state["messages"]
+        )
+
+    def test_debates_are_cached_separately(self):
+        """Concurrent debates sharing an agent should not see each other's history."""
+        agent = DebaterAgent("debater_1", None, "model")
+        a = create_initial_state(topic="A", debate_id="a")
+        b = create_initial_state(topic="B", debate_id="b")
+        a["messages"] = transcript(rounds=2, debaters=2)
+        b["messages"] = transcript(rounds=1, debaters=2)[:1]
+
+        agent._build_conversation_history(a)
+
+        assert agent._build_conversation_history(b) == render_history("debater_1", b["messages"])
+
+
 class TestDebaterAgent:
     """Tests for DebaterAgent."""
 
@@ -246,6 +323,38 @@ class TestDebaterAgent:
         assert message["metadata"]["output_tokens"] == 50
         assert message["metadata"]["cost"] == 0.001
 
+    @pytest.mark.asyncio
+    async def test_act_streams_when_on_token_given(self):
+        """act should use provider.generate_stream when a callback is given."""
+        provider = create_mock_provider()
+        provider.generate_stream = AsyncMock(
+            return_value=provider.generate.return_value
+        )
+        agent = DebaterAgent("debater1", provider, "test-model")
+        on_token = MagicMock()
+
+        message = await agent.act(create_test_state(), on_token=on_token)
+
+        provider.generate.assert_not_called()
+        provider.generate_stream.assert_awaited_once()
+        assert provider.generate_stream.call_args.kwargs["on_token"] is on_token
+        assert message["metadata"]["input_tokens"] == 100
+
+    def test_estimate_input_cost(self):
+        """estimate_input_cost should price the prompt's estimated input tokens."""
+        provider = create_mock_provider()
+        provider.estimate_cost = MagicMock(return_value=0.002)
+        agent = DebaterAgent("debater1", provider, "test-model")
+
+        cost = agent.estimate_input_cost(create_test_state())
+
+        assert cost == 0.002
+        input_tokens, output_tokens, model = provider.estimate_cost.call_args.args
+        assert input_tokens > 0
+        assert output_tokens == 0
+        assert model == "test-model"
+        provider.generate.assert_not_called()
+
     def test_build_prompt_includes_topic(self):
         """_build_prompt should include the debate topic."""
         provider = create_mock_provider()
@@ -267,6 +376,17 @@ class TestDebaterAgent:
 
         assert "Test context" in messages[0]["content"]
 
+    def test_build_prompt_marks_topic_for_caching(self):
+        """Only the stable topic/context message should be a cache breakpoint."""
+        provider = create_mock_provider()
+        agent = DebaterAgent("debater1", provider, "test-model")
+        state = create_test_state()
+
+        messages = agent._build_prompt(state)
+
+        assert messages[0]["cache_control"] == "ephemeral"
+        assert all("cache_control" not in msg for msg in messages[1:])
+
     def test_build_prompt_round_1_instruction(self):
         """_build_prompt should have initial position instruction for round 1."""
         provider = create_mock_provider()
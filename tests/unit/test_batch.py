@@ -0,0 +1,220 @@
+"""Tests for offline batch submission."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from mad.core.config import DebateConfig, DebaterConfig
+from mad.core.orchestrator import MAD
+from mad.providers.anthropic import anthropic_cost
+from mad.providers.anthropic_http import AnthropicHTTPProvider
+from mad.providers.base import ProviderResponse
+from mad.providers.batch import (
+    ANTHROPIC_BATCH_DISCOUNT,
+    AnthropicBatchBackend,
+    BatchCollector,
+    BatchingProvider,
+    LocalBatchBackend,
+)
+
+MODEL = "claude-sonnet-4-20250514"
+
+
+def answer(params):
+    """Answer a request the way each agent expects."""
+    system = (params.get("system") or "").lower()
+    if "judge" in system:
+        return '{"verdict": "Use it carefully", "confidence": 0.8}'
+    if "moderator" in system:
+        return '{"consensus_score": 0.2, "should_continue": true}'
+    return "An argument"
+
+
+class FakeBatchEndpoint:
+    """In-process fake of the Anthropic Message Batches API."""
+
+    def __init__(self, polls_until_done=1):
+        self.polls_until_done = polls_until_done
+        self.jobs = {}
+        self.client = httpx.AsyncClient(transport=httpx.MockTransport(self.handle))
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if request.method == "POST" and path == "/v1/messages/batches":
+            job_id = f"msgbatch_{len(self.jobs) + 1}"
+            self.jobs[job_id] = {"requests": json.loads(request.content)["requests"], "polls": 0}
+            return httpx.Response(200, json={"id": job_id, "processing_status": "in_progress"})
+
+        if path.endswith("/results"):
+            job = self.jobs[path.split("/")[-2]]
+            lines = [
+                json.dumps(
+                    {
+                        "custom_id": item["custom_id"],
+                        "result": {
+                            "type": "succeeded",
+                            "message": {
+                                "content": [{"type": "text", "text": answer(item["params"])}],
+                                "usage": {"input_tokens": 100, "output_tokens": 50},
+                            },
+                        },
+                    }
+                )
+                for item in job["requests"]
+            ]
+            return httpx.Response(200, text="\n".join(lines))
+
+        job_id = path.split("/")[-1]
+        job = self.jobs[job_id]
+        job["polls"] += 1
+        status = "ended" if job["polls"] >= self.polls_until_done else "in_progress"
+        return httpx.Response(
+            200,
+            json={
+                "id": job_id,
+                "processing_status": status,
+                "results_url": f"http://fake/v1/messages/batches/{job_id}/results",
+            },
+        )
+
+    def backend(self):
+        http = AnthropicHTTPProvider(api_key="key", base_url="http://fake", client=self.client)
+        return AnthropicBatchBackend(http)
+
+
+def create_mock_provider():
+    """Create a mock provider that must never be called directly."""
+    provider = MagicMock()
+    provider.name = "anthropic"
+    provider.generate = AsyncMock(side_effect=AssertionError("called outside a batch"))
+    provider.estimate_cost = MagicMock(return_value=0.0)
+    return provider
+
+
+class TestAnthropicBatchBackend:
+    """Tests for AnthropicBatchBackend."""
+
+    @pytest.mark.asyncio
+    async def test_collects_requests_into_one_job(self):
+        """Concurrent calls should share one batch job at the batch price."""
+        endpoint = FakeBatchEndpoint(polls_until_done=2)
+        collector = BatchCollector(endpoint.backend(), window_s=0.01, poll_interval_s=0.01)
+        provider = BatchingProvider(create_mock_provider(), collector)
+
+        responses = await asyncio.gather(
+            *(provider.generate([{"role": "user", "content": f"Q{i}"}], MODEL) for i in range(3))
+        )
+
+        assert len(endpoint.jobs) == 1
+        assert len(endpoint.jobs["msgbatch_1"]["requests"]) == 3
+        assert endpoint.jobs["msgbatch_1"]["polls"] == 2
+        assert all(r["content"] == "An argument" for r in responses)
+        assert responses[0]["cost"] == pytest.approx(
+            anthropic_cost(100, 50, MODEL) * ANTHROPIC_BATCH_DISCOUNT
+        )
+        assert responses[0]["metadata"] == {"batch_id": "msgbatch_1"}
+
+    @pytest.mark.asyncio
+    async def test_other_providers_run_locally(self):
+        """Only Anthropic requests should reach the batch endpoint in a mixed job."""
+        endpoint = FakeBatchEndpoint()
+        collector = BatchCollector(endpoint.backend(), window_s=0.01, poll_interval_s=0.01)
+        openai = MagicMock()
+        openai.name = "openai"
+        openai.generate = AsyncMock(
+            return_value=ProviderResponse(
+                content="From OpenAI",
+                input_tokens=1,
+                output_tokens=1,
+                model="gpt-4o",
+                cost=0.01,
+                latency_ms=1.0,
+            )
+        )
+        anthropic = BatchingProvider(create_mock_provider(), collector)
+        other = BatchingProvider(openai, collector)
+
+        responses = await asyncio.gather(
+            anthropic.generate([{"role": "user", "content": "Q1"}], MODEL),
+            other.generate([{"role": "user", "content": "Q2"}], "gpt-4o"),
+        )
+
+        assert collector.jobs_submitted == 1
+        assert [item["params"]["model"] for item in endpoint.jobs["msgbatch_1"]["requests"]] == [
+            MODEL
+        ]
+        openai.generate.assert_awaited_once()
+        assert [r["content"] for r in responses] == ["An argument", "From OpenAI"]
+
+    @pytest.mark.asyncio
+    async def test_failed_request_raises(self):
+        """An errored batch entry should raise for its caller only."""
+        backend = AnthropicBatchBackend(AnthropicHTTPProvider(api_key="key"))
+
+        result = backend._parse_result({"type": "errored", "error": "boom"}, MODEL, 1.0, "b")
+
+        assert isinstance(result, RuntimeError)
+
+
+class TestLocalBatchBackend:
+    """Tests for LocalBatchBackend."""
+
+    @pytest.mark.asyncio
+    async def test_runs_requests_through_provider(self):
+        """The local backend should call each request's provider."""
+        primary = MagicMock()
+        primary.name = "mock"
+        primary.generate = AsyncMock(
+            return_value=ProviderResponse(
+                content="ok",
+                input_tokens=1,
+                output_tokens=1,
+                model="m",
+                cost=0.01,
+                latency_ms=1.0,
+            )
+        )
+        collector = BatchCollector(LocalBatchBackend(), window_s=0.01, poll_interval_s=0.001)
+        provider = BatchingProvider(primary, collector)
+
+        response = await provider.generate([{"role": "user", "content": "Hi"}], "m")
+
+        assert response["content"] == "ok"
+        assert collector.jobs_submitted == 1
+
+
+class TestDebateBatch:
+    """Tests for MAD.debate_batch."""
+
+    @pytest.mark.asyncio
+    async def test_debates_advance_in_lockstep(self):
+        """Every step of every debate should be submitted as one shared job."""
+        endpoint = FakeBatchEndpoint()
+        config = DebateConfig(
+            debaters=[DebaterConfig(perspective="pro"), DebaterConfig(perspective="con")],
+            max_rounds=2,
+        )
+
+        with patch("mad.core.orchestrator.get_provider", return_value=create_mock_provider()):
+            mad = MAD(config)
+            outcomes = [
+                outcome
+                async for outcome in mad.debate_batch(
+                    [("Topic A", None), ("Topic B", None), ("Topic C", None)],
+                    endpoint.backend(),
+                    poll_interval_s=0.001,
+                    window_s=0.02,
+                )
+            ]
+
+        assert all(outcome.ok for outcome in outcomes)
+        assert {outcome.result.verdict for outcome in outcomes} == {"Use it carefully"}
+        # 2 rounds x (2 debaters + moderator) + judge, each shared by 3 debates
+        assert len(endpoint.jobs) == 7
+        assert all(len(job["requests"]) == 3 for job in endpoint.jobs.values())
+        assert outcomes[0].result.total_cost == pytest.approx(
+            7 * anthropic_cost(100, 50, MODEL) * ANTHROPIC_BATCH_DISCOUNT
+        )
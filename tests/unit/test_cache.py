@@ -0,0 +1,113 @@
+"""Tests for the compiled graph cache."""
+
+from unittest.mock import MagicMock, patch
+
+from mad.core.cache import GraphCache, config_cache_key, graph_cache
+from mad.core.config import DebateConfig, DebaterConfig, MADConfig
+from mad.core.orchestrator import MAD
+from mad.presets import CodeReviewPreset
+
+
+def create_entry():
+    """Create a placeholder cache entry."""
+    return MagicMock()
+
+
+class TestConfigCacheKey:
+    """Tests for config_cache_key."""
+
+    def test_equal_configs_hash_equally(self):
+        """Configs built differently but equal should share a key."""
+        first = DebateConfig(debaters=[DebaterConfig(perspective="a")], max_rounds=2)
+        second = DebateConfig(max_rounds=2, debaters=[{"perspective": "a"}])
+
+        assert config_cache_key(first, MADConfig()) == config_cache_key(second, MADConfig())
+
+    def test_different_configs_hash_differently(self):
+        """Any config change should change the key."""
+        first = DebateConfig(max_rounds=2)
+        second = DebateConfig(max_rounds=3)
+
+        assert config_cache_key(first, MADConfig()) != config_cache_key(second, MADConfig())
+
+    def test_extra_changes_key(self):
+        """Extra data should be part of the key."""
+        config = DebateConfig()
+
+        assert config_cache_key(config, MADConfig(), extra=1) != config_cache_key(
+            config, MADConfig(), extra=2
+        )
+
+
+class TestGraphCache:
+    """Tests for GraphCache."""
+
+    def test_counts_hits_and_misses(self):
+        """Repeated lookups should be served from the cache."""
+        cache = GraphCache()
+        factory = MagicMock(side_effect=create_entry)
+
+        first = cache.get_or_create("a", factory)
+        second = cache.get_or_create("a", factory)
+
+        assert first is second
+        assert factory.call_count == 1
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+        assert stats.hit_rate == 0.5
+
+    def test_evicts_least_recently_used(self):
+        """The least recently used entry should be evicted past maxsize."""
+        cache = GraphCache(maxsize=2)
+        a = cache.get_or_create("a", create_entry)
+        cache.get_or_create("b", create_entry)
+        cache.get_or_create("a", create_entry)  # "a" is now most recent
+        cache.get_or_create("c", create_entry)  # evicts "b"
+
+        assert cache.get_or_create("a", create_entry) is a
+        assert cache.stats().size == 2
+        misses = cache.stats().misses
+        cache.get_or_create("b", create_entry)
+        assert cache.stats().misses == misses + 1
+
+    def test_clear_resets(self):
+        """clear should drop entries and statistics."""
+        cache = GraphCache()
+        cache.get_or_create("a", create_entry)
+
+        cache.clear()
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.size) == (0, 0, 0)
+
+
+class TestMADGraphSharing:
+    """Tests for graph sharing between MAD instances."""
+
+    def test_equal_configs_share_agents_and_graph(self):
+        """Two MAD instances from the same preset should reuse one graph."""
+        provider = MagicMock()
+        provider.name = "mock"
+        graph_cache.clear()
+
+        with patch("mad.core.orchestrator.get_provider", return_value=provider):
+            first = MAD(CodeReviewPreset().to_config())
+            second = MAD(CodeReviewPreset().to_config())
+
+        assert first._graph is second._graph
+        assert first._debaters is second._debaters
+        stats = graph_cache.stats()
+        assert (stats.hits, stats.misses) == (1, 1)
+
+    def test_new_provider_instance_misses(self):
+        """Replacing the provider instance should not reuse stale agents."""
+        graph_cache.clear()
+        config = CodeReviewPreset().to_config()
+
+        with patch("mad.core.orchestrator.get_provider", return_value=MagicMock()):
+            first = MAD(config)
+        with patch("mad.core.orchestrator.get_provider", return_value=MagicMock()):
+            second = MAD(config)
+
+        assert first._graph is not second._graph
+        assert graph_cache.stats().misses == 2
@@ -0,0 +1,138 @@
+"""Tests for recording and replaying provider traffic."""
+
+import gzip
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from mad.core.config import DebateConfig, DebaterConfig
+from mad.core.orchestrator import MAD
+from mad.providers.cassette import (
+    Cassette,
+    CassetteMissError,
+    RecordingProvider,
+    ReplayProvider,
+)
+from tests.conftest import ScriptedProvider
+
+MESSAGES = [{"role": "user", "content": "Question"}]
+
+
+def scripted(latency_ms=40.0):
+    """Build a provider whose debater replies are numbered."""
+    return ScriptedProvider(
+        {
+            "debater": lambda n: f"Argument {n + 1}",
+            "judge": '{"verdict": "Recorded verdict", "confidence": 0.7}',
+        },
+        latency_ms=latency_ms,
+        cost=0.002,
+        input_tokens=120,
+        output_tokens=30,
+    )
+
+
+class TestCassette:
+    """Tests for Cassette, RecordingProvider and ReplayProvider."""
+
+    @pytest.mark.asyncio
+    async def test_record_then_replay(self, tmp_path):
+        """A replayed response should match the recorded one."""
+        path = tmp_path / "traffic.jsonl"
+        cassette = Cassette(path)
+        recorder = RecordingProvider(scripted(), cassette)
+
+        recorded = await recorder.generate(MESSAGES, "m", system="Be brief")
+        cassette.close()
+
+        entry = json.loads(path.read_text().splitlines()[0])
+        assert entry["request"]["messages"] == MESSAGES
+        assert entry["response"]["latency_ms"] == 40.0
+
+        primary = scripted()
+        primary.generate = AsyncMock(side_effect=AssertionError("called live"))
+        replay = ReplayProvider(primary, Cassette(path), latency_scale=0.0)
+        replayed = await replay.generate(MESSAGES, "m", system="Be brief")
+
+        assert replayed["content"] == recorded["content"]
+        assert replayed["input_tokens"] == 120
+        assert replayed["cost"] == 0.002
+        assert replayed["latency_ms"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_latencies_are_scaled(self, tmp_path):
+        """Replayed latency should be the recorded latency times the scale."""
+        cassette = Cassette(tmp_path / "traffic.jsonl")
+        await RecordingProvider(scripted(latency_ms=20.0), cassette).generate(MESSAGES, "m")
+
+        replayed = await ReplayProvider(scripted(), cassette, 0.5).generate(MESSAGES, "m")
+
+        assert replayed["latency_ms"] == 10.0
+
+    @pytest.mark.asyncio
+    async def test_repeated_requests_replay_in_order(self, tmp_path):
+        """Identical requests should replay in recorded order, then repeat the last."""
+        cassette = Cassette(tmp_path / "traffic.jsonl")
+        recorder = RecordingProvider(scripted(latency_ms=0.0), cassette)
+        await recorder.generate(MESSAGES, "m")
+        await recorder.generate(MESSAGES, "m")
+
+        replay = ReplayProvider(scripted(), cassette, latency_scale=0.0)
+        contents = [(await replay.generate(MESSAGES, "m"))["content"] for _ in range(3)]
+
+        assert contents == ["Argument 1", "Argument 2", "Argument 2"]
+
+    @pytest.mark.asyncio
+    async def test_gzip_cassette(self, tmp_path):
+        """Cassettes ending in .gz should be compressed and readable."""
+        path = tmp_path / "traffic.jsonl.gz"
+        cassette = Cassette(path)
+        await RecordingProvider(scripted(), cassette).generate(MESSAGES, "m")
+        cassette.close()
+
+        with gzip.open(path, "rt") as f:
+            assert len(f.readlines()) == 1
+        assert len(Cassette(path)) == 1
+
+    @pytest.mark.asyncio
+    async def test_unrecorded_request_raises(self, tmp_path):
+        """Replaying a request that was never recorded should fail loudly."""
+        replay = ReplayProvider(scripted(), Cassette(tmp_path / "empty.jsonl"))
+
+        with pytest.raises(CassetteMissError):
+            await replay.generate(MESSAGES, "m")
+
+
+class TestRegistryCassettes:
+    """Tests for recording and replaying through ProviderRegistry."""
+
+    @pytest.mark.asyncio
+    async def test_replay_debate_offline(self, registry, tmp_path):
+        """A recorded debate should replay without calling the live provider."""
+        path = tmp_path / "debate.jsonl"
+        config = DebateConfig(
+            debaters=[DebaterConfig(perspective="pro"), DebaterConfig(perspective="con")],
+            max_rounds=2,
+        )
+
+        live = scripted(latency_ms=1.0)
+        registry._instances["anthropic"] = live
+        registry.record(path)
+        recorded = await MAD(config).debate(topic="Test topic")
+        registry.eject_cassette()
+
+        offline = scripted()
+        registry._instances["anthropic"] = offline
+        cassette = registry.replay(path, latency_scale=0.0)
+        replayed = await MAD(config).debate(topic="Test topic")
+
+        assert live.total_calls == len(cassette) == 7
+        assert offline.total_calls == 0
+        assert replayed.verdict == recorded.verdict == "Recorded verdict"
+        assert replayed.total_cost == pytest.approx(recorded.total_cost)
+
+    def test_replay_requires_cassette(self, registry, tmp_path):
+        """Replaying a missing cassette should raise."""
+        with pytest.raises(FileNotFoundError):
+            registry.replay(tmp_path / "missing.jsonl")
@@ -0,0 +1,251 @@
+"""Tests for rolling transcript compaction."""
+
+import asyncio
+
+import pytest
+from pydantic import ValidationError
+
+from mad.agents.compaction import TranscriptCompactor
+from mad.agents.debater import DebaterAgent
+from mad.agents.retrieval import ContextRetriever
+from mad.core.config import CompactionConfig, DebateConfig, DebaterConfig
+from mad.core.orchestrator import MAD
+from mad.core.state import create_initial_state, create_message
+from tests.conftest import ScriptedProvider
+
+ARGUMENT = "A long argument about trade-offs and evidence. " * 50
+
+
+def scripted(delay_s=0.0):
+    """Build a provider whose debaters give long arguments."""
+    return ScriptedProvider(
+        {"debater": ARGUMENT, "judge": '{"verdict": "Compacted", "confidence": 0.8}'},
+        delay_s=delay_s,
+    )
+
+
+def debate_state(rounds, debaters=2):
+    """Build the state a debater sees in the round after ``rounds`` completed ones."""
+    state = create_initial_state(topic="Topic", debate_id="d1")
+    state["messages"] = [
+        create_message(f"debater_{i}", "debater", "anthropic", "m", ARGUMENT, r)
+        for r in range(1, rounds + 1)
+        for i in range(1, debaters + 1)
+    ]
+    state["current_round"] = rounds + 1
+    return state
+
+
+class TestTranscriptCompactor:
+    """Tests for TranscriptCompactor."""
+
+    @pytest.mark.asyncio
+    async def test_under_budget_unchanged(self):
+        """A prompt within budget should be left alone."""
+        provider = scripted()
+        compactor = TranscriptCompactor(provider, "cheap", budget_tokens=100_000)
+        state = debate_state(rounds=2)
+
+        compacted, metadata = await compactor.compact(
+            state, DebaterAgent("debater_1", provider, "m")
+        )
+
+        assert compacted is state
+        assert metadata == {}
+        assert provider.total_calls == 0
+
+    @pytest.mark.asyncio
+    async def test_old_rounds_summarized(self):
+        """Rounds older than keep_rounds should be replaced by summaries."""
+        provider = scripted()
+        compactor = TranscriptCompactor(provider, "cheap", budget_tokens=500, keep_rounds=1)
+        state = debate_state(rounds=3)
+
+        compacted, metadata = await compactor.compact(
+            state, DebaterAgent("debater_1", provider, "m")
+        )
+
+        contents = [m["content"] for m in compacted["messages"]]
+        assert contents[:4] == [
+            "(Summary of round 1) Short summary",
+            "(Summary of round 1) Short summary",
+            "(Summary of round 2) Short summary",
+            "(Summary of round 2) Short summary",
+        ]
+        assert contents[4:] == [ARGUMENT, ARGUMENT]
+        assert compacted["messages"][0]["metadata"]["summary"] is True
+        assert state["messages"][0]["content"] == ARGUMENT
+        assert metadata == {
+            "compacted_through_round": 2,
+            "compaction_cost": pytest.approx(0.004),
+            "compaction_tokens": 440,
+        }
+
+    @pytest.mark.asyncio
+    async def test_previous_round_kept_verbatim(self):
+        """A debater in round N should still see round N-1 verbatim to rebut it."""
+        provider = scripted()
+        compactor = TranscriptCompactor(provider, "cheap", budget_tokens=500, keep_rounds=1)
+        state = debate_state(rounds=2)
+
+        compacted, metadata = await compactor.compact(
+            state, DebaterAgent("debater_1", provider, "m")
+        )
+
+        previous = [m["content"] for m in compacted["messages"] if m["round"] == 2]
+        assert previous == [ARGUMENT, ARGUMENT]
+        assert metadata["compacted_through_round"] == 1
+
+    @pytest.mark.asyncio
+    async def test_estimate_uses_retrieved_context(self):
+        """A debater seeing retrieved excerpts should be sized by those, not the full context."""
+        provider = scripted()
+        compactor = TranscriptCompactor(provider, "cheap", budget_tokens=4000)
+        state = debate_state(rounds=2)
+        state["context"] = "def handler(request):  # route the request\n" * 1000
+        full = DebaterAgent("debater_1", provider, "m")
+        narrowed = DebaterAgent("debater_1", provider, "m")
+        narrowed.retriever = ContextRetriever(budget_tokens=200)
+
+        assert compactor.estimate_tokens(state, full) > 4000
+        assert compactor.estimate_tokens(state, narrowed) < 4000
+        compacted, _ = await compactor.compact(state, narrowed)
+        assert compacted is state
+
+    @pytest.mark.asyncio
+    async def test_summaries_reused_across_agents(self):
+        """Each (debate, round, debater) summary should be generated once."""
+        provider = scripted()
+        compactor = TranscriptCompactor(provider, "cheap", budget_tokens=500)
+        state = debate_state(rounds=3)
+
+        await compactor.compact(state, DebaterAgent("debater_1", provider, "m"))
+        _, metadata = await compactor.compact(state, DebaterAgent("debater_2", provider, "m"))
+
+        assert len(provider.prompts["summary"]) == 4
+        assert metadata["compaction_cost"] == 0.0
+        assert metadata["compaction_tokens"] == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_agents_share_requests(self):
+        """Agents compacting at the same time should share in-flight summaries."""
+        provider = scripted(delay_s=0.01)
+        compactor = TranscriptCompactor(provider, "cheap", budget_tokens=500)
+        state = debate_state(rounds=3)
+        agents = [DebaterAgent(f"debater_{i}", provider, "m") for i in range(1, 4)]
+
+        results = await asyncio.gather(*(compactor.compact(state, agent) for agent in agents))
+
+        assert len(provider.prompts["summary"]) == 4
+        assert sum(metadata["compaction_cost"] for _, metadata in results) == pytest.approx(0.004)
+
+    @pytest.mark.asyncio
+    async def test_failed_summary_keeps_original(self):
+        """A failing summarizer should leave the transcript as it was, not raise."""
+
+        def fail(_):
+            raise ConnectionError("summarizer down")
+
+        provider = ScriptedProvider({"debater": ARGUMENT, "summary": fail})
+        compactor = TranscriptCompactor(provider, "cheap", budget_tokens=500)
+        state = debate_state(rounds=3)
+
+        compacted, metadata = await compactor.compact(
+            state, DebaterAgent("debater_1", provider, "m")
+        )
+
+        assert [m["content"] for m in compacted["messages"]] == [ARGUMENT] * 6
+        assert metadata["compaction_cost"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_keeps_summaries(self):
+        """Summaries finished after their first caller was cancelled should be reused and billed."""
+        provider = scripted(delay_s=0.02)
+        compactor = TranscriptCompactor(provider, "cheap", budget_tokens=500)
+        state = debate_state(rounds=3)
+
+        task = asyncio.create_task(
+            compactor.compact(state, DebaterAgent("debater_1", provider, "m"))
+        )
+        await asyncio.sleep(0.005)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0.05)
+        _, metadata = await compactor.compact(state, DebaterAgent("debater_2", provider, "m"))
+
+        assert len(provider.prompts["summary"]) == 4
+        assert metadata["compaction_cost"] == pytest.approx(0.004)
+
+    @pytest.mark.asyncio
+    async def test_summaries_scoped_to_debate(self):
+        """Summaries should not leak between debates."""
+        provider = scripted()
+        compactor = TranscriptCompactor(provider, "cheap", budget_tokens=500)
+        agent = DebaterAgent("debater_1", provider, "m")
+        other = debate_state(rounds=3)
+        other["debate_id"] = "d2"
+
+        await compactor.compact(debate_state(rounds=3), agent)
+        await compactor.compact(other, agent)
+
+        assert len(provider.prompts["summary"]) == 8
+
+    @pytest.mark.asyncio
+    async def test_history_rebuilt_after_compaction(self):
+        """An agent's cached history should pick up compacted messages."""
+        provider = scripted()
+        compactor = TranscriptCompactor(provider, "cheap", budget_tokens=500)
+        agent = DebaterAgent("debater_1", provider, "m")
+        state = debate_state(rounds=2)
+        agent._build_conversation_history(state)
+
+        compacted, _ = await compactor.compact(state, agent)
+        history = agent._build_conversation_history(compacted)
+
+        assert history[0]["content"].endswith("(Summary of round 1) Short summary")
+        assert history[-1]["content"].endswith(ARGUMENT)
+
+    @pytest.mark.asyncio
+    async def test_compacted_view_cached_separately(self):
+        """Raw and compacted transcripts should keep their own rendered histories."""
+        provider = scripted()
+        compactor = TranscriptCompactor(provider, "cheap", budget_tokens=500)
+        agent = DebaterAgent("debater_1", provider, "m")
+        state = debate_state(rounds=2)
+
+        raw = agent._build_conversation_history(state)
+        compacted, _ = await compactor.compact(state, agent)
+        agent._build_conversation_history(compacted)
+
+        assert compacted["compacted_through_round"] == 1
+        assert len(agent._history) == 2
+        assert agent._build_conversation_history(state) == raw
+
+
+class TestDebateCompaction:
+    """Tests for compaction in full debates."""
+
+    @pytest.mark.asyncio
+    async def test_debate_compacts_and_counts_cost(self, registry):
+        """A debate over budget should summarize each old turn once and bill it."""
+        provider = scripted()
+        registry._instances["anthropic"] = provider
+        config = DebateConfig(
+            debaters=[DebaterConfig(perspective="pro"), DebaterConfig(perspective="con")],
+            max_rounds=3,
+            early_stop_on_consensus=False,
+            compaction=CompactionConfig(budget_tokens=500),
+        )
+
+        result = await MAD(config).debate(topic="Test topic")
+
+        assert result.verdict == "Compacted"
+        assert provider.prompts["summary"]
+        assert len(set(provider.prompts["summary"])) == len(provider.prompts["summary"])
+        assert result.total_cost == pytest.approx(0.001 * provider.total_calls)
+
+    def test_budget_required(self):
+        """Compaction config should require a token budget."""
+        with pytest.raises(ValidationError):
+            CompactionConfig()
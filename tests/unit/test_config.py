@@ -64,6 +64,8 @@ class TestDebateConfig:
         assert config.early_stop_on_consensus is True
         assert config.consensus_threshold == 0.8
         assert config.debaters == []
+        assert config.parallel_debaters is False
+        assert config.max_concurrency is None
 
     def test_with_debaters(self):
         """Should accept debater configurations."""
@@ -0,0 +1,173 @@
+"""Tests for the local lexical consensus pre-check."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pydantic import ValidationError
+
+from mad.agents.consensus import LexicalConsensus
+from mad.agents.moderator import ModeratorAgent
+from mad.core.config import ConsensusPrecheckConfig, DebateConfig, DebaterConfig
+from mad.core.orchestrator import MAD
+from mad.core.state import create_initial_state, create_message
+from mad.providers.base import ProviderResponse
+from tests.conftest import ScriptedProvider
+
+AGREEING = [
+    "I agree with debater_2: adopting static typing in the payment service is correct, "
+    "and the migration plan is valid.",
+    "I agree with debater_1: adopting static typing in the payment service is correct; "
+    "the migration plan is valid.",
+]
+OPPOSED = [
+    "Static typing is flawed here. I disagree and reject the migration; it overlooks "
+    "delivery speed.",
+    "Wrong. Dynamic code ships faster, I dispute the cost estimate and oppose any rewrite "
+    "of legacy modules.",
+]
+MIXED = [
+    "Static typing helps the payment service, though the migration has real costs.",
+    "The payment service migration costs matter; typing helps but needs a phased plan.",
+]
+
+
+def round_messages(contents, round_num=1):
+    """Build one round of debater messages."""
+    return [
+        create_message(f"debater_{i}", "debater", "anthropic", "m", content, round_num)
+        for i, content in enumerate(contents, start=1)
+    ]
+
+
+def round_state(contents):
+    """Build a state whose current round holds the given arguments."""
+    state = create_initial_state(topic="Adopt static typing?", debate_id="d1")
+    state["messages"] = round_messages(contents)
+    state["current_round"] = 1
+    return state
+
+
+def moderator(score=0.5):
+    """Build a moderator whose LLM returns a fixed consensus score."""
+    provider = MagicMock()
+    provider.name = "anthropic"
+    provider.generate = AsyncMock(
+        return_value=ProviderResponse(
+            content=f'{{"consensus_score": {score}, "should_continue": true}}',
+            input_tokens=200,
+            output_tokens=20,
+            model="m",
+            cost=0.01,
+            latency_ms=5.0,
+        )
+    )
+    return ModeratorAgent(provider=provider)
+
+
+class TestLexicalConsensus:
+    """Tests for LexicalConsensus scoring and calibration."""
+
+    def test_scores_track_agreement(self):
+        """Agreeing rounds should score high, opposed rounds low, mixed in between."""
+        consensus = LexicalConsensus()
+
+        agreeing = consensus.score(round_messages(AGREEING))
+        opposed = consensus.score(round_messages(OPPOSED))
+        mixed = consensus.score(round_messages(MIXED))
+
+        assert agreeing > 0.85
+        assert opposed < 0.2
+        assert 0.2 < mixed < 0.85
+
+    def test_negation_flips_stance(self):
+        """Negated cues should count for the other side."""
+        consensus = LexicalConsensus(similarity_weight=0.0)
+
+        negated = round_messages(["I am not convinced.", "I don't agree."])
+        assert consensus.score(negated) == 0.0
+
+    def test_needs_two_messages(self):
+        """A round with one message has no consensus to estimate."""
+        assert LexicalConsensus().score(round_messages(AGREEING[:1])) is None
+
+    def test_calibration_stats(self):
+        """Recorded pairs should produce mean absolute error and bias."""
+        consensus = LexicalConsensus()
+
+        consensus.record(0.6, 0.4)
+        consensus.record(0.3, 0.5)
+
+        assert consensus.calibration() == {"samples": 2, "mae": 0.2, "bias": 0.0}
+
+    def test_invalid_band(self):
+        """The lower bound of the band must not exceed the upper bound."""
+        with pytest.raises(ValueError, match="decide_below"):
+            LexicalConsensus(decide_below=0.9, decide_above=0.1)
+
+
+class TestModeratorPrecheck:
+    """Tests for the moderator's local pre-check."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("contents", [AGREEING, OPPOSED])
+    async def test_clear_rounds_skip_llm(self, contents):
+        """Clear-cut rounds should be moderated locally at zero cost."""
+        agent = moderator()
+        agent.precheck = LexicalConsensus()
+
+        message = await agent.act(round_state(contents))
+
+        agent.provider.generate.assert_not_called()
+        assert message["metadata"]["consensus_source"] == "local"
+        assert message["metadata"]["cost"] == 0.0
+        score = agent.parse_moderation(message["content"])["consensus_score"]
+        assert score == pytest.approx(agent.precheck.score(round_messages(contents)), abs=1e-3)
+
+    @pytest.mark.asyncio
+    async def test_ambiguous_rounds_use_llm_and_calibrate(self):
+        """Ambiguous rounds should go to the LLM and update calibration stats."""
+        agent = moderator(score=0.5)
+        agent.precheck = LexicalConsensus()
+
+        message = await agent.act(round_state(MIXED))
+
+        agent.provider.generate.assert_awaited_once()
+        assert "local_consensus_score" in message["metadata"]
+        assert agent.precheck.calibration()["samples"] == 1
+
+    @pytest.mark.asyncio
+    async def test_calibration_rate_samples_clear_rounds(self):
+        """With calibration_rate=1 every round should still reach the LLM."""
+        agent = moderator(score=0.9)
+        agent.precheck = LexicalConsensus(calibration_rate=1.0)
+
+        await agent.act(round_state(AGREEING))
+
+        agent.provider.generate.assert_awaited_once()
+        assert agent.precheck.calibration()["samples"] == 1
+
+
+class TestDebatePrecheck:
+    """Tests for the pre-check in full debates."""
+
+    @pytest.mark.asyncio
+    async def test_consensus_reached_without_moderator_call(self, registry):
+        """A clearly agreeing round should stop the debate without the LLM moderator."""
+        provider = ScriptedProvider({"debater": lambda n: AGREEING[n % 2]})
+        registry._instances["anthropic"] = provider
+        config = DebateConfig(
+            debaters=[DebaterConfig(perspective="pro"), DebaterConfig(perspective="con")],
+            max_rounds=3,
+            consensus_precheck=ConsensusPrecheckConfig(),
+        )
+
+        result = await MAD(config).debate(topic="Adopt static typing?")
+
+        assert result.early_consensus
+        assert result.total_rounds == 1
+        assert provider.calls["moderator"] == 0
+
+    def test_invalid_band_rejected_by_config(self):
+        """A reversed band should fail config validation, before MAD is built."""
+        with pytest.raises(ValidationError, match="decide_below"):
+            ConsensusPrecheckConfig(decide_below=0.9, decide_above=0.1)
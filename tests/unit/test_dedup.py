@@ -0,0 +1,154 @@
+"""Tests for near-duplicate transcript compression."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from mad.agents.dedup import MinHasher, TranscriptDeduplicator
+from mad.agents.judge import JudgeAgent
+from mad.core.state import create_initial_state, create_message
+from mad.providers.base import ProviderResponse
+from mad.tokens import estimate_prompt_tokens
+
+CLAIM = (
+    "Static typing catches a large class of defects before the code ever runs, "
+    "which shortens review cycles and makes large refactors far less risky for the team."
+)
+RESTATED = (
+    "Static typing catches a large class of defects before the code ever runs, "
+    "which shortens review cycles and makes big refactors far less risky for the team."
+)
+REBUTTAL = (
+    "Dynamic languages let small teams prototype quickly, and a strong test suite "
+    "recovers most of the safety that type annotations would otherwise provide."
+)
+EVIDENCE = (
+    "Our incident log shows that most production outages last year came from "
+    "configuration mistakes and network partitions rather than type errors in code."
+)
+
+
+def message(agent_id, round_num, *paragraphs):
+    """Build a debater message from paragraphs."""
+    return create_message(agent_id, "debater", "anthropic", "m", "\n\n".join(paragraphs), round_num)
+
+
+def transcript():
+    """Build a transcript where arguments are restated in later rounds."""
+    return [
+        message("debater_1", 1, CLAIM),
+        message("debater_2", 1, REBUTTAL),
+        message("debater_1", 2, RESTATED, EVIDENCE),
+        message("debater_2", 2, REBUTTAL, "I agree."),
+    ]
+
+
+class TestMinHasher:
+    """Tests for MinHash signatures."""
+
+    def test_similarity_tracks_overlap(self):
+        """Near-duplicates should score high and unrelated text low."""
+        hasher = MinHasher()
+
+        claim = hasher.signature(CLAIM)
+
+        assert hasher.similarity(claim, hasher.signature(CLAIM)) == 1.0
+        assert hasher.similarity(claim, hasher.signature(RESTATED)) >= 0.6
+        assert hasher.similarity(claim, hasher.signature(REBUTTAL)) < 0.2
+
+    def test_signatures_stable_across_instances(self):
+        """Signatures should not depend on process hash seeds or instances."""
+        assert MinHasher().signature(CLAIM) == MinHasher().signature(CLAIM)
+
+
+class TestTranscriptDeduplicator:
+    """Tests for TranscriptDeduplicator."""
+
+    def test_restatements_collapsed_with_attribution(self):
+        """Restated paragraphs should become references to one attributed copy."""
+        contents = TranscriptDeduplicator(threshold=0.6).compress(transcript())
+
+        assert contents[0] == f"[P1] {CLAIM}\n(Also argued by: debater_1 R2)"
+        assert contents[1] == f"[P2] {REBUTTAL}\n(Also argued by: debater_2 R2)"
+        assert contents[2] == f"[Restates P1]\n\n{EVIDENCE}"
+        assert contents[3] == "[Restates P2]\n\nI agree."
+
+    def test_distinct_paragraphs_unchanged(self):
+        """Transcripts without restatements should be left as they are."""
+        messages = [message("debater_1", 1, CLAIM), message("debater_2", 1, REBUTTAL, EVIDENCE)]
+
+        contents = TranscriptDeduplicator().compress(messages)
+
+        assert contents == [CLAIM, f"{REBUTTAL}\n\n{EVIDENCE}"]
+
+    def test_short_paragraphs_kept(self):
+        """Paragraphs below min_words should never be collapsed."""
+        messages = [message("debater_1", 1, "I agree."), message("debater_2", 1, "I agree.")]
+
+        assert TranscriptDeduplicator().compress(messages) == ["I agree.", "I agree."]
+
+    def test_compression_cached(self):
+        """Compressing the same transcript again should reuse the result."""
+        deduplicator = TranscriptDeduplicator()
+        messages = transcript()
+
+        assert deduplicator.compress(messages) is deduplicator.compress(list(messages))
+
+
+class TestJudgeDeduplication:
+    """Tests for deduplication in judge prompts."""
+
+    def judge_state(self):
+        """Build a state ready for the judge."""
+        state = create_initial_state(topic="Should we adopt static typing?", debate_id="d1")
+        state["messages"] = transcript() * 3
+        state["current_round"] = 2
+        return state
+
+    def judge(self):
+        """Build a judge with a mocked provider."""
+        provider = MagicMock()
+        provider.name = "anthropic"
+        provider.generate = AsyncMock(
+            return_value=ProviderResponse(
+                content='{"verdict": "Adopt", "confidence": 0.8}',
+                input_tokens=100,
+                output_tokens=20,
+                model="m",
+                cost=0.01,
+                latency_ms=5.0,
+            )
+        )
+        return JudgeAgent(provider=provider, model="m")
+
+    def test_prompt_shrinks(self):
+        """The judge prompt should shrink when restatements are collapsed."""
+        state = self.judge_state()
+        verbatim, compressed = self.judge(), self.judge()
+        compressed.deduplicator = TranscriptDeduplicator(threshold=0.6)
+
+        verbatim_tokens = estimate_prompt_tokens(verbatim._build_prompt(state))
+        compressed_tokens = estimate_prompt_tokens(compressed._build_prompt(state))
+
+        assert compressed_tokens < verbatim_tokens * 0.6
+        assert "[Restates P1]" in compressed._build_prompt(state)[0]["content"]
+
+    @pytest.mark.asyncio
+    async def test_tokens_saved_reported(self):
+        """The verdict message should report the measured token reduction."""
+        judge = self.judge()
+        judge.deduplicator = TranscriptDeduplicator(threshold=0.6)
+
+        verdict = await judge.act(self.judge_state())
+
+        assert verdict["metadata"]["transcript_tokens_saved"] > 0
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self):
+        """Judges without a deduplicator should see the verbatim transcript."""
+        judge = self.judge()
+
+        verdict = await judge.act(self.judge_state())
+
+        assert "transcript_tokens_saved" not in verdict["metadata"]
+        assert CLAIM in judge._build_prompt(self.judge_state())[0]["content"]
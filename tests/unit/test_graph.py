@@ -1,10 +1,12 @@
 """Tests for debate graph creation."""
 
-from unittest.mock import MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from mad.core.graph import create_debate_graph
+from mad.core.graph import create_debate_graph, run_debaters
+from mad.core.state import create_initial_state, create_message
 
 
 def create_mock_debater(agent_id: str):
@@ -148,3 +150,349 @@ class TestGraphStructure:
         moderator = create_mock_moderator()
         graph2 = create_debate_graph(debaters, judge, moderator=moderator)
         assert graph2 is not None
+
+
+def create_acting_debater(agent_id: str, delay: float = 0.0, tracker: dict | None = None):
+    """Create a mock debater whose act() returns a real message."""
+    debater = create_mock_debater(agent_id)
+
+    async def act(state):
+        if tracker is not None:
+            tracker["active"] += 1
+            tracker["peak"] = max(tracker["peak"], tracker["active"])
+        await asyncio.sleep(delay)
+        if tracker is not None:
+            tracker["active"] -= 1
+        return create_message(
+            agent_id=agent_id,
+            agent_role="debater",
+            provider="mock",
+            model="mock-model",
+            content=f"Argument from {agent_id}",
+            current_round=state["current_round"],
+            input_tokens=100,
+            output_tokens=50,
+            cost=0.01,
+        )
+
+    debater.act = AsyncMock(side_effect=act)
+    return debater
+
+
+def create_acting_judge():
+    """Create a mock judge that renders a fixed verdict."""
+    judge = create_mock_judge()
+    judge.act = AsyncMock(
+        side_effect=lambda state: create_message(
+            agent_id="judge",
+            agent_role="judge",
+            provider="mock",
+            model="mock-model",
+            content='{"verdict": "A", "confidence": 0.9}',
+            current_round=state["current_round"],
+            input_tokens=200,
+            output_tokens=100,
+            cost=0.02,
+        )
+    )
+    judge.parse_verdict = MagicMock(return_value={"verdict": "A", "confidence": 0.9})
+    return judge
+
+
+class TestParallelRounds:
+    """Tests for concurrent debater execution."""
+
+    @pytest.mark.asyncio
+    async def test_parallel_preserves_debater_order(self):
+        """Messages should be in debater order even if later debaters finish first."""
+        debaters = [
+            create_acting_debater("debater_1", delay=0.03),
+            create_acting_debater("debater_2", delay=0.01),
+            create_acting_debater("debater_3", delay=0.0),
+        ]
+
+        messages = await run_debaters(debaters, create_initial_state(topic="Test"), parallel=True)
+
+        assert [m["agent_id"] for m in messages] == ["debater_1", "debater_2", "debater_3"]
+
+    @pytest.mark.asyncio
+    async def test_parallel_respects_concurrency_limit(self):
+        """No more than max_concurrency debaters should be in flight."""
+        tracker = {"active": 0, "peak": 0}
+        debaters = [
+            create_acting_debater(f"debater_{i}", delay=0.01, tracker=tracker) for i in range(5)
+        ]
+
+        await run_debaters(
+            debaters, create_initial_state(topic="Test"), parallel=True, max_concurrency=2
+        )
+
+        assert tracker["peak"] == 2
+
+    @pytest.mark.asyncio
+    async def test_parallel_failure_cancels_siblings(self):
+        """A failing debater should cancel the other debaters' in-flight calls."""
+        failing = create_mock_debater("debater_1")
+        failing.act = AsyncMock(side_effect=RuntimeError("boom"))
+        slow = create_mock_debater("debater_2")
+        cancelled = asyncio.Event()
+
+        async def act(state):
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        slow.act = AsyncMock(side_effect=act)
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await run_debaters([failing, slow], create_initial_state(topic="Test"), parallel=True)
+
+        assert cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_sequential_runs_one_at_a_time(self):
+        """Sequential mode should never overlap debater calls."""
+        tracker = {"active": 0, "peak": 0}
+        debaters = [
+            create_acting_debater(f"debater_{i}", delay=0.0, tracker=tracker) for i in range(3)
+        ]
+
+        await run_debaters(debaters, create_initial_state(topic="Test"))
+
+        assert tracker["peak"] == 1
+
+    @pytest.mark.asyncio
+    async def test_parallel_graph_accumulates_usage(self):
+        """A parallel debate should order messages and total usage like a sequential one."""
+        results = []
+        for parallel in (False, True):
+            debaters = [create_acting_debater(f"debater_{i}") for i in range(1, 4)]
+            graph = create_debate_graph(debaters, create_acting_judge(), parallel=parallel)
+            results.append(await graph.ainvoke(create_initial_state(topic="Test", max_rounds=2)))
+
+        sequential, parallel_result = results
+        assert [m["agent_id"] for m in parallel_result["messages"]] == [
+            m["agent_id"] for m in sequential["messages"]
+        ]
+        # 2 rounds x 3 debaters + judge
+        assert parallel_result["total_tokens"] == 6 * 150 + 300
+        assert parallel_result["total_cost"] == pytest.approx(6 * 0.01 + 0.02)
+        assert parallel_result["total_cost"] == pytest.approx(sequential["total_cost"])
+
+
+def create_acting_moderator(decisions: list[bool], delay: float = 0.0):
+    """Create a mock moderator that stops when the next decision is True."""
+    moderator = create_mock_moderator()
+    remaining = list(decisions)
+
+    async def act(state):
+        await asyncio.sleep(delay)
+        stop = remaining.pop(0)
+        return create_message(
+            agent_id="moderator",
+            agent_role="moderator",
+            provider="mock",
+            model="mock-model",
+            content="stop" if stop else "continue",
+            current_round=state["current_round"],
+            input_tokens=10,
+            output_tokens=10,
+            cost=0.005,
+        )
+
+    moderator.act = AsyncMock(side_effect=act)
+    moderator.parse_moderation = MagicMock(
+        side_effect=lambda content: {"consensus_score": 1.0 if content == "stop" else 0.0}
+    )
+    moderator.should_stop_early = MagicMock(
+        side_effect=lambda moderation: moderation["consensus_score"] >= 0.8
+    )
+    return moderator
+
+
+class TestSpeculativeRounds:
+    """Tests for speculative next-round execution."""
+
+    @pytest.mark.asyncio
+    async def test_commits_speculative_round_on_continue(self):
+        """When the moderator continues, the speculative round should be kept."""
+        debaters = [create_acting_debater(f"debater_{i}") for i in range(1, 3)]
+        moderator = create_acting_moderator([False, False], delay=0.01)
+        graph = create_debate_graph(
+            debaters, create_acting_judge(), moderator=moderator, speculative=True
+        )
+
+        result = await graph.ainvoke(create_initial_state(topic="Test", max_rounds=2))
+
+        # Round 2 ran once (speculatively), not twice
+        assert debaters[0].act.await_count == 2
+        assert [(m["agent_id"], m["round"]) for m in result["messages"]] == [
+            ("debater_1", 1),
+            ("debater_2", 1),
+            ("moderator", 1),
+            ("debater_1", 2),
+            ("debater_2", 2),
+            ("moderator", 2),
+            ("judge", 2),
+        ]
+        assert result["current_round"] == 2
+        assert result["speculative_wasted_cost"] == 0.0
+        assert result["total_cost"] == pytest.approx(4 * 0.01 + 2 * 0.005 + 0.02)
+
+    @pytest.mark.asyncio
+    async def test_discards_speculative_round_on_stop(self):
+        """When the moderator stops, speculative work should be cancelled and recorded."""
+        debaters = [
+            create_acting_debater("debater_1", delay=0.0),
+            create_acting_debater("debater_2", delay=0.2),
+        ]
+        moderator = create_acting_moderator([True], delay=0.05)
+        graph = create_debate_graph(
+            debaters,
+            create_acting_judge(),
+            moderator=moderator,
+            parallel=True,
+            speculative=True,
+        )
+
+        result = await graph.ainvoke(create_initial_state(topic="Test", max_rounds=3))
+
+        assert result["early_consensus"] is True
+        assert result["current_round"] == 1
+        assert all(m["round"] == 1 for m in result["messages"])
+        # debater_1 finished its speculative turn, debater_2 was cancelled
+        assert result["speculative_wasted_cost"] == pytest.approx(0.01)
+        assert result["speculative_wasted_tokens"] == 150
+        assert result["speculative_cancelled_calls"] == 1
+        assert result["total_cost"] == pytest.approx(2 * 0.01 + 0.005 + 0.02 + 0.01)
+
+    @pytest.mark.asyncio
+    async def test_no_speculation_on_final_round(self):
+        """Nothing should be speculated after the last round."""
+        debaters = [create_acting_debater("debater_1")]
+        moderator = create_acting_moderator([False])
+        graph = create_debate_graph(
+            debaters, create_acting_judge(), moderator=moderator, speculative=True
+        )
+
+        result = await graph.ainvoke(create_initial_state(topic="Test", max_rounds=1))
+
+        assert debaters[0].act.await_count == 1
+        assert result["speculative_cancelled_calls"] == 0
+
+
+class TestDeadline:
+    """Tests for the per-debate latency deadline."""
+
+    @pytest.mark.asyncio
+    async def test_cancels_slow_debaters_and_goes_to_judge(self):
+        """Debaters that would overrun should be cancelled and the judge should still run."""
+        debaters = [
+            create_acting_debater("debater_1", delay=0.0),
+            create_acting_debater("debater_2", delay=5.0),
+        ]
+        judge = create_acting_judge()
+        graph = create_debate_graph(debaters, judge, parallel=True, deadline_ms=100)
+
+        result = await graph.ainvoke(create_initial_state(topic="Test", max_rounds=3))
+
+        assert result["deadline_truncated"] is True
+        assert [m["agent_id"] for m in result["messages"]] == ["debater_1", "judge"]
+        assert result["phase"] == "complete"
+        assert result["total_cost"] == pytest.approx(0.01 + 0.02)
+        judge.act.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_slow_moderator_short_circuits_to_judge(self):
+        """A moderator call that would overrun should be cancelled."""
+        debaters = [create_acting_debater("debater_1")]
+        moderator = create_acting_moderator([False], delay=5.0)
+        graph = create_debate_graph(
+            debaters, create_acting_judge(), moderator=moderator, deadline_ms=100
+        )
+
+        result = await graph.ainvoke(create_initial_state(topic="Test", max_rounds=3))
+
+        assert result["deadline_truncated"] is True
+        assert [m["agent_id"] for m in result["messages"]] == ["debater_1", "judge"]
+
+    @pytest.mark.asyncio
+    async def test_generous_deadline_runs_all_rounds(self):
+        """A deadline that is not reached should not change the debate."""
+        debaters = [create_acting_debater("debater_1")]
+        graph = create_debate_graph(debaters, create_acting_judge(), deadline_ms=60_000)
+
+        result = await graph.ainvoke(create_initial_state(topic="Test", max_rounds=2))
+
+        assert result["deadline_truncated"] is False
+        assert debaters[0].act.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_debater_error_propagates(self):
+        """A failing debater should fail the round rather than be treated as a timeout."""
+        failing = create_mock_debater("debater_1")
+        failing.act = AsyncMock(side_effect=RuntimeError("boom"))
+        debaters = [failing, create_acting_debater("debater_2", delay=5.0)]
+        graph = create_debate_graph(
+            debaters, create_acting_judge(), parallel=True, deadline_ms=60_000
+        )
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await graph.ainvoke(create_initial_state(topic="Test"))
+
+
+class TestCostBudget:
+    """Tests for the hard per-debate cost budget."""
+
+    @staticmethod
+    def with_estimate(agent, cost: float):
+        """Give a mock agent a fixed pre-flight cost estimate."""
+        agent.estimate_input_cost = MagicMock(return_value=cost)
+        return agent
+
+    @pytest.mark.asyncio
+    async def test_skips_to_judge_when_next_round_would_overspend(self):
+        """The debate should go to the judge once another round no longer fits."""
+        debaters = [self.with_estimate(create_acting_debater(f"debater_{i}"), 0.01) for i in (1, 2)]
+        judge = self.with_estimate(create_acting_judge(), 0.02)
+        graph = create_debate_graph(debaters, judge, max_cost_usd=0.05)
+
+        result = await graph.ainvoke(create_initial_state(topic="Test", max_rounds=3))
+
+        # Round 1 fits (0.02 + judge 0.02); round 2 would not (0.02 + 0.02 + 0.02)
+        assert debaters[0].act.await_count == 1
+        assert result["budget_exhausted"] is True
+        assert result["judge_verdict"] == {"verdict": "A", "confidence": 0.9}
+        assert result["total_cost"] == pytest.approx(0.04)
+
+    @pytest.mark.asyncio
+    async def test_aborts_when_judge_would_overspend(self):
+        """Without room for the judge the debate should end with no calls."""
+        debaters = [self.with_estimate(create_acting_debater("debater_1"), 0.01)]
+        judge = self.with_estimate(create_acting_judge(), 0.02)
+        graph = create_debate_graph(debaters, judge, max_cost_usd=0.01)
+
+        result = await graph.ainvoke(create_initial_state(topic="Test"))
+
+        assert result["budget_exhausted"] is True
+        assert result["phase"] == "complete"
+        assert result["judge_verdict"] is None
+        assert result["messages"] == []
+        debaters[0].act.assert_not_awaited()
+        judge.act.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_skips_moderator_when_it_would_overspend(self):
+        """The moderator call should be skipped if it would leave no room for the judge."""
+        debaters = [self.with_estimate(create_acting_debater("debater_1"), 0.01)]
+        moderator = self.with_estimate(create_acting_moderator([False]), 0.05)
+        judge = self.with_estimate(create_acting_judge(), 0.02)
+        graph = create_debate_graph(debaters, judge, moderator=moderator, max_cost_usd=0.05)
+
+        result = await graph.ainvoke(create_initial_state(topic="Test", max_rounds=3))
+
+        moderator.act.assert_not_awaited()
+        assert result["budget_exhausted"] is True
+        assert [m["agent_id"] for m in result["messages"]] == ["debater_1", "judge"]
@@ -0,0 +1,176 @@
+"""Tests for native HTTP providers."""
+
+import json
+
+import httpx
+import pytest
+
+from mad.providers import http
+from mad.providers.anthropic_http import AnthropicHTTPProvider
+from mad.providers.openai_http import OpenAIHTTPProvider
+from mad.providers.registry import ProviderRegistry, get_provider
+
+
+def sse(*events):
+    """Encode events as a server-sent event stream."""
+    lines = [f"data: {json.dumps(event)}\n\n" for event in events]
+    return "".join(lines).encode()
+
+
+def mock_client(handler, requests):
+    """Create a client that records requests and answers with handler."""
+
+    def record(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return handler(request)
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(record))
+
+
+class TestSharedClient:
+    """Tests for the shared connection pool."""
+
+    @pytest.mark.asyncio
+    async def test_shared_client_is_reused(self):
+        """shared_client should return one client until closed."""
+        client = http.shared_client()
+
+        assert http.shared_client() is client
+
+        await http.close_shared_client()
+        assert client.is_closed
+        assert http.shared_client() is not client
+        await http.close_shared_client()
+
+    def test_providers_default_to_shared_client(self):
+        """Providers without an explicit client should use the shared pool."""
+        provider = AnthropicHTTPProvider(api_key="key")
+
+        assert provider.client is http.shared_client()
+
+
+class TestAnthropicHTTPProvider:
+    """Tests for AnthropicHTTPProvider."""
+
+    MESSAGES = [
+        {"role": "system", "content": "Be brief"},
+        {"role": "user", "content": "Hello"},
+    ]
+
+    @pytest.mark.asyncio
+    async def test_generate(self):
+        """generate should send a Messages API request and parse usage."""
+        requests = []
+        body = {
+            "content": [{"type": "text", "text": "Hi there"}],
+            "usage": {"input_tokens": 12, "output_tokens": 3},
+        }
+        client = mock_client(lambda _: httpx.Response(200, json=body), requests)
+        provider = AnthropicHTTPProvider(api_key="key", base_url="http://test", client=client)
+
+        response = await provider.generate(self.MESSAGES, "claude-sonnet-4-20250514")
+
+        assert response["content"] == "Hi there"
+        assert response["input_tokens"] == 12
+        assert response["output_tokens"] == 3
+        assert response["cost"] == provider.estimate_cost(12, 3, "claude-sonnet-4-20250514")
+
+        request = requests[0]
+        payload = json.loads(request.content)
+        assert str(request.url) == "http://test/v1/messages"
+        assert request.headers["x-api-key"] == "key"
+        assert payload["system"] == "Be brief"
+        assert payload["messages"] == [{"role": "user", "content": "Hello"}]
+
+    @pytest.mark.asyncio
+    async def test_generate_stream(self):
+        """generate_stream should forward text deltas and report exact usage."""
+        stream = sse(
+            {"type": "message_start", "message": {"usage": {"input_tokens": 9}}},
+            {"type": "content_block_delta", "delta": {"type": "text_delta", "text": "Hi"}},
+            {"type": "content_block_delta", "delta": {"type": "text_delta", "text": "!"}},
+            {"type": "message_delta", "usage": {"output_tokens": 2}},
+            {"type": "message_stop"},
+        )
+        client = mock_client(lambda _: httpx.Response(200, content=stream), [])
+        provider = AnthropicHTTPProvider(api_key="key", base_url="http://test", client=client)
+        chunks: list[str] = []
+
+        response = await provider.generate_stream(
+            self.MESSAGES, "claude-sonnet-4-20250514", on_token=chunks.append
+        )
+
+        assert chunks == ["Hi", "!"]
+        assert response["content"] == "Hi!"
+        assert response["input_tokens"] == 9
+        assert response["output_tokens"] == 2
+
+    @pytest.mark.asyncio
+    async def test_http_error_raises(self):
+        """Error statuses should raise httpx.HTTPStatusError."""
+        client = mock_client(lambda _: httpx.Response(500, json={"error": "boom"}), [])
+        provider = AnthropicHTTPProvider(api_key="key", base_url="http://test", client=client)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await provider.generate(self.MESSAGES, "claude-sonnet-4-20250514")
+
+
+class TestOpenAIHTTPProvider:
+    """Tests for OpenAIHTTPProvider."""
+
+    MESSAGES = [{"role": "user", "content": "Hello"}]
+
+    @pytest.mark.asyncio
+    async def test_generate(self):
+        """generate should send a Chat Completions request and parse usage."""
+        requests = []
+        body = {
+            "choices": [{"message": {"role": "assistant", "content": "Hi there"}}],
+            "usage": {"prompt_tokens": 7, "completion_tokens": 3},
+        }
+        client = mock_client(lambda _: httpx.Response(200, json=body), requests)
+        provider = OpenAIHTTPProvider(api_key="key", base_url="http://test/v1", client=client)
+
+        response = await provider.generate(self.MESSAGES, "gpt-4o", system="Be brief")
+
+        assert response["content"] == "Hi there"
+        assert response["input_tokens"] == 7
+        assert response["output_tokens"] == 3
+
+        request = requests[0]
+        payload = json.loads(request.content)
+        assert str(request.url) == "http://test/v1/chat/completions"
+        assert request.headers["authorization"] == "Bearer key"
+        assert payload["messages"][0] == {"role": "system", "content": "Be brief"}
+
+    @pytest.mark.asyncio
+    async def test_stream(self):
+        """stream should yield content deltas and skip the usage chunk."""
+        stream = (
+            sse(
+                {"choices": [{"delta": {"role": "assistant"}}]},
+                {"choices": [{"delta": {"content": "Hi"}}]},
+                {"choices": [{"delta": {"content": " you"}}]},
+                {"choices": [], "usage": {"prompt_tokens": 5, "completion_tokens": 2}},
+            )
+            + b"data: [DONE]\n\n"
+        )
+        requests = []
+        client = mock_client(lambda _: httpx.Response(200, content=stream), requests)
+        provider = OpenAIHTTPProvider(api_key="key", base_url="http://test/v1", client=client)
+
+        chunks = [chunk async for chunk in provider.stream(self.MESSAGES, "gpt-4o")]
+
+        assert chunks == ["Hi", " you"]
+        assert json.loads(requests[0].content)["stream_options"] == {"include_usage": True}
+
+
+class TestRegistry:
+    """Tests for HTTP provider registration."""
+
+    def test_http_providers_are_registered(self):
+        """The registry should expose the native HTTP providers."""
+        ProviderRegistry.clear_cache()
+
+        assert isinstance(get_provider("anthropic_http"), AnthropicHTTPProvider)
+        assert isinstance(get_provider("openai_http"), OpenAIHTTPProvider)
@@ -0,0 +1,193 @@
+"""Tests for the self-hosted OpenAI-compatible provider."""
+
+import asyncio
+import json
+
+import pytest
+
+from mad.core.config import DebateConfig, DebaterConfig, JudgeConfig, ModeratorConfig
+from mad.core.orchestrator import MAD
+from mad.providers import http
+from mad.providers.openai_compatible import OpenAICompatibleProvider
+from mad.providers.registry import ProviderRegistry, get_provider
+
+
+class StubServer:
+    """Local Chat Completions server answering by system prompt."""
+
+    def __init__(self):
+        self.requests = []
+        self.server = None
+
+    @property
+    def url(self):
+        host, port = self.server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}/v1"
+
+    async def __aenter__(self):
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await http.close_shared_client()
+        self.server.close()
+        await self.server.wait_closed()
+
+    @staticmethod
+    def answer(payload):
+        system = payload["messages"][0]["content"].lower()
+        if "judge" in system:
+            return '{"verdict": "Ship it", "confidence": 0.9}'
+        if "moderator" in system:
+            return '{"consensus_score": 0.9, "should_continue": false}'
+        return "An argument"
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.decode().split("\r\n"):
+                    if line.lower().startswith("content-length:"):
+                        length = int(line.split(":", 1)[1])
+                payload = json.loads(await reader.readexactly(length))
+                self.requests.append((head.decode().split(" ")[1], payload))
+
+                body = json.dumps(
+                    {
+                        "choices": [{"message": {"content": self.answer(payload)}}],
+                        "usage": {"prompt_tokens": 1000, "completion_tokens": 100},
+                    }
+                ).encode()
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                    + body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+class TestOpenAICompatibleProvider:
+    """Tests for OpenAICompatibleProvider."""
+
+    def test_free_by_default(self):
+        """Without a pricing table, calls should cost nothing."""
+        provider = OpenAICompatibleProvider(base_url="http://gpu:8000/v1")
+
+        assert provider.estimate_cost(1_000_000, 1_000_000, "llama") == 0.0
+
+    def test_custom_pricing_with_fallback(self):
+        """Model prices should apply, with '*' as the fallback."""
+        provider = OpenAICompatibleProvider(
+            base_url="http://gpu:8000/v1",
+            pricing={"big": {"input": 1.0, "output": 2.0}, "*": {"input": 0.1}},
+        )
+
+        assert provider.estimate_cost(1_000_000, 1_000_000, "big") == pytest.approx(3.0)
+        assert provider.estimate_cost(1_000_000, 1_000_000, "small") == pytest.approx(0.1)
+
+    def test_model_list(self):
+        """An empty model list should accept any model."""
+        open_provider = OpenAICompatibleProvider(base_url="http://gpu:8000/v1")
+        listed = OpenAICompatibleProvider(base_url="http://gpu:8000/v1", models=["llama"])
+
+        assert open_provider.validate_model("anything")
+        assert listed.validate_model("llama")
+        assert not listed.validate_model("other")
+
+    @pytest.mark.asyncio
+    async def test_generate_against_stub_server(self):
+        """generate should call the server's chat completions endpoint."""
+        async with StubServer() as server:
+            provider = OpenAICompatibleProvider(base_url=server.url, models=["llama"])
+            response = await provider.generate(
+                [{"role": "user", "content": "Hello"}], "llama", system="Be brief"
+            )
+
+        assert response["content"] == "An argument"
+        assert response["input_tokens"] == 1000
+        assert response["cost"] == 0.0
+        path, payload = server.requests[0]
+        assert path == "/v1/chat/completions"
+        assert payload["model"] == "llama"
+
+    @pytest.mark.asyncio
+    async def test_pool_stats_after_call(self):
+        """The connection should return to the pool as idle after a call."""
+        async with StubServer() as server:
+            provider = OpenAICompatibleProvider(base_url=server.url)
+            await provider.generate([{"role": "user", "content": "Hello"}], "llama")
+
+            assert provider.pool_stats() == {"open": 1, "idle": 1, "in_use": 0}
+
+
+class TestRegistryEndpoints:
+    """Tests for registering self-hosted endpoints."""
+
+    def test_get_with_base_url_creates_instance_per_url(self):
+        """Each base URL should get its own provider instance."""
+        a = get_provider("openai_compatible", "http://a:8000/v1")
+        b = get_provider("openai_compatible", "http://b:8000/v1")
+
+        assert a is not b
+        assert a is get_provider("openai_compatible", "http://a:8000/v1")
+        assert a.base_url == "http://a:8000/v1"
+
+    def test_register_endpoint_is_returned_by_get(self):
+        """A registered endpoint should carry its models and pricing."""
+        registered = ProviderRegistry.register_endpoint(
+            "http://c:8000/v1", models=["qwen"], pricing={"*": {"input": 0.5}}
+        )
+
+        assert get_provider("openai_compatible", "http://c:8000/v1") is registered
+        assert registered.supported_models == ["qwen"]
+
+    def test_base_url_rejected_for_langchain_providers(self):
+        """Providers that are not HTTP-based should reject a base_url."""
+        with pytest.raises(ValueError, match="base_url"):
+            get_provider("anthropic", "http://proxy")
+
+
+class TestDebateRouting:
+    """Tests for targeting self-hosted endpoints from debate configs."""
+
+    @pytest.mark.asyncio
+    async def test_all_roles_can_target_endpoint(self):
+        """Debaters, judge and moderator should reach the configured server."""
+        async with StubServer() as server:
+            target = {"provider": "openai_compatible", "model": "llama", "base_url": server.url}
+            config = DebateConfig(
+                debaters=[DebaterConfig(**target), DebaterConfig(**target)],
+                judge=JudgeConfig(**target),
+                moderator=ModeratorConfig(**target),
+                max_rounds=3,
+            )
+
+            result = await MAD(config).debate(topic="Test topic")
+
+        assert result.verdict == "Ship it"
+        assert result.total_cost == 0.0
+        # 1 round x (2 debaters + moderator) + judge; moderator stops early
+        assert len(server.requests) == 4
+        assert {payload["model"] for _, payload in server.requests} == {"llama"}
+
+    def test_routed_endpoint_replacement_rebuilds_graph(self, registry):
+        """Re-registering a routing candidate's endpoint should change the graph cache key."""
+        url = "http://routed:8000/v1"
+        target = {"provider": "openai_compatible", "model": "llama", "base_url": url}
+        config = DebateConfig(
+            debaters=[DebaterConfig(**target), DebaterConfig(**target)],
+            judge=JudgeConfig(**target),
+            moderator=ModeratorConfig(**target),
+            routing={"debater": {"candidates": [{**target, "base_url": "http://other:8000/v1"}]}},
+        )
+        registry.register_endpoint("http://other:8000/v1")
+        first = MAD(config)._cache_key()
+
+        registry.register_endpoint("http://other:8000/v1")
+
+        assert MAD(config)._cache_key() != first
@@ -0,0 +1,336 @@
+"""Tests for the MAD orchestrator."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from mad.core.config import DebateConfig, DebaterConfig
+from mad.core.orchestrator import MAD
+
+
+def create_mock_provider():
+    """Create a mock LLM provider that answers every agent."""
+    provider = MagicMock()
+    provider.name = "mock"
+
+    async def generate(messages, model, **kwargs):
+        system = kwargs.get("system") or ""
+        if "judge" in system.lower():
+            content = '{"verdict": "Use it carefully", "confidence": 0.8}'
+        elif "moderator" in system.lower():
+            content = '{"consensus_score": 0.2, "should_continue": true}'
+        else:
+            content = "An argument"
+        return {
+            "content": content,
+            "input_tokens": 100,
+            "output_tokens": 50,
+            "model": model,
+            "cost": 0.001,
+            "latency_ms": 1.0,
+        }
+
+    provider.generate = AsyncMock(side_effect=generate)
+    return provider
+
+
+@pytest.fixture
+def mock_provider():
+    """Patch provider lookup so MAD never talks to a real API."""
+    provider = create_mock_provider()
+    with patch("mad.core.orchestrator.get_provider", return_value=provider):
+        yield provider
+
+
+def create_mad(**overrides) -> MAD:
+    """Create a MAD instance with two debaters."""
+    config = DebateConfig(
+        debaters=[DebaterConfig(perspective="pro"), DebaterConfig(perspective="con")],
+        max_rounds=2,
+        **overrides,
+    )
+    return MAD(config)
+
+
+class TestDebate:
+    """Tests for MAD.debate."""
+
+    @pytest.mark.asyncio
+    async def test_debate_returns_result(self, mock_provider):
+        """debate should run the graph and build a DebateResult."""
+        mad = create_mad()
+
+        result = await mad.debate(topic="Test topic")
+
+        assert result.verdict == "Use it carefully"
+        assert result.confidence == 0.8
+        assert result.total_rounds == 2
+        # 2 rounds x (2 debaters + moderator) + judge
+        assert mock_provider.generate.await_count == 7
+        assert result.total_cost == pytest.approx(0.007)
+
+
+class TestDebateMany:
+    """Tests for MAD.debate_many."""
+
+    @pytest.mark.asyncio
+    async def test_yields_outcome_per_item(self, mock_provider):
+        """debate_many should yield one successful outcome per item."""
+        mad = create_mad()
+        items = [("Topic A", None), ("Topic B", "Some context")]
+
+        outcomes = [outcome async for outcome in mad.debate_many(items, concurrency=2)]
+
+        assert sorted(o.index for o in outcomes) == [0, 1]
+        assert all(o.ok for o in outcomes)
+        assert {o.topic for o in outcomes} == {"Topic A", "Topic B"}
+
+    @pytest.mark.asyncio
+    async def test_isolates_errors(self, mock_provider):
+        """A failing debate should not affect the others."""
+        mad = create_mad()
+        original = mad.debate
+
+        async def debate(topic, context=None):
+            if topic == "bad":
+                raise RuntimeError("provider exploded")
+            return await original(topic=topic, context=context)
+
+        mad.debate = debate  # type: ignore[method-assign]
+
+        outcomes = [o async for o in mad.debate_many([("good", None), ("bad", None)])]
+
+        by_topic = {o.topic: o for o in outcomes}
+        assert by_topic["good"].ok
+        assert by_topic["good"].result is not None
+        assert not by_topic["bad"].ok
+        assert isinstance(by_topic["bad"].error, RuntimeError)
+
+    @pytest.mark.asyncio
+    async def test_bounds_concurrency(self, mock_provider):
+        """No more than `concurrency` debates should run at once."""
+        mad = create_mad()
+        tracker = {"active": 0, "peak": 0}
+
+        async def debate(topic, context=None):
+            tracker["active"] += 1
+            tracker["peak"] = max(tracker["peak"], tracker["active"])
+            await asyncio.sleep(0.01)
+            tracker["active"] -= 1
+            return MagicMock()
+
+        mad.debate = debate  # type: ignore[method-assign]
+        items = [(f"Topic {i}", None) for i in range(10)]
+
+        outcomes = [o async for o in mad.debate_many(items, concurrency=3)]
+
+        assert len(outcomes) == 10
+        assert tracker["peak"] == 3
+
+    @pytest.mark.asyncio
+    async def test_accepts_async_iterable(self, mock_provider):
+        """debate_many should consume async iterables lazily."""
+        mad = create_mad()
+
+        async def items():
+            for i in range(3):
+                await asyncio.sleep(0)
+                yield (f"Topic {i}", None)
+
+        outcomes = [o async for o in mad.debate_many(items(), concurrency=2)]
+
+        assert sorted(o.index for o in outcomes) == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_yields_in_completion_order(self, mock_provider):
+        """Faster debates should be yielded before slower ones."""
+        mad = create_mad()
+
+        async def debate(topic, context=None):
+            await asyncio.sleep(0.05 if topic == "slow" else 0.0)
+            return MagicMock()
+
+        mad.debate = debate  # type: ignore[method-assign]
+
+        outcomes = [o async for o in mad.debate_many([("slow", None), ("fast", None)])]
+
+        assert [o.topic for o in outcomes] == ["fast", "slow"]
+
+    @pytest.mark.asyncio
+    async def test_rejects_invalid_concurrency(self, mock_provider):
+        """concurrency below 1 should raise ValueError."""
+        mad = create_mad()
+
+        with pytest.raises(ValueError, match="concurrency"):
+            async for _ in mad.debate_many([("Topic", None)], concurrency=0):
+                pass
+
+
+class TestStreamDebate:
+    """Tests for MAD.stream_debate."""
+
+    @pytest.mark.asyncio
+    async def test_yields_node_updates_by_default(self, mock_provider):
+        """Without stream_tokens, stream_debate yields raw node updates."""
+        mad = create_mad()
+
+        updates = [update async for update in mad.stream_debate(topic="Test")]
+
+        nodes = [next(iter(update)) for update in updates]
+        assert nodes[0] == "initialize"
+        assert nodes[-1] == "judge"
+
+    @staticmethod
+    def stream_words(provider):
+        """Make the mock provider stream each response word by word."""
+
+        async def generate_stream(messages, model, on_token, **kwargs):
+            response = await provider.generate(messages, model, **kwargs)
+            for word in response["content"].split(" "):
+                on_token(word + " ")
+            return response
+
+        provider.generate_stream = AsyncMock(side_effect=generate_stream)
+
+    @pytest.mark.asyncio
+    async def test_streams_tokens_for_every_agent(self, mock_provider):
+        """With stream_tokens, token events should cover debaters, moderator and judge."""
+        self.stream_words(mock_provider)
+        mad = create_mad()
+
+        events = [event async for event in mad.stream_debate(topic="Test", stream_tokens=True)]
+
+        tokens = [e for e in events if e["type"] == "token"]
+        assert {e["agent_role"] for e in tokens} == {"debater", "moderator", "judge"}
+        assert {(e["agent_id"], e["round"]) for e in tokens if e["agent_role"] == "debater"} == {
+            ("debater_1", 1),
+            ("debater_2", 1),
+            ("debater_1", 2),
+            ("debater_2", 2),
+        }
+
+        messages = [e["message"] for e in events if e["type"] == "message"]
+        judge_message = messages[-1]
+        judge_tokens = "".join(e["content"] for e in tokens if e["agent_role"] == "judge")
+        assert judge_message["agent_role"] == "judge"
+        assert judge_tokens.strip() == judge_message["content"]
+        assert judge_message["metadata"]["cost"] == 0.001
+
+        final = [e for e in events if e["type"] == "update" and e["node"] == "judge"]
+        assert final[0]["update"]["total_cost"] == pytest.approx(0.007)
+        mock_provider.generate.assert_awaited()
+
+    @pytest.mark.asyncio
+    async def test_streams_speculative_rounds(self, mock_provider):
+        """Debaters started speculatively should still stream tokens and messages."""
+        self.stream_words(mock_provider)
+        mad = create_mad(speculative_rounds=True)
+
+        events = [event async for event in mad.stream_debate(topic="Test", stream_tokens=True)]
+
+        tokens = [e for e in events if e["type"] == "token" and e["agent_role"] == "debater"]
+        assert {(e["agent_id"], e["round"]) for e in tokens} == {
+            ("debater_1", 1),
+            ("debater_2", 1),
+            ("debater_1", 2),
+            ("debater_2", 2),
+        }
+        messages = [e["message"] for e in events if e["type"] == "message"]
+        turns = [(m["agent_id"], m["round"]) for m in messages if m["agent_role"] == "debater"]
+        assert sorted(turns) == [
+            ("debater_1", 1),
+            ("debater_1", 2),
+            ("debater_2", 1),
+            ("debater_2", 2),
+        ]
+
+
+class TestCheckpointing:
+    """Tests for checkpointed debates and MAD.resume."""
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_completed_nodes(self, mock_provider, tmp_path):
+        """A debate that crashed at the judge should resume without re-running rounds."""
+        pytest.importorskip("langgraph.checkpoint.sqlite")
+        original = mock_provider.generate.side_effect
+        crash = {"judge": True}
+
+        async def generate(messages, model, **kwargs):
+            if crash["judge"] and "judge" in (kwargs.get("system") or "").lower():
+                crash["judge"] = False
+                raise RuntimeError("worker died")
+            return await original(messages, model, **kwargs)
+
+        mock_provider.generate.side_effect = generate
+        path = str(tmp_path / "debates.sqlite")
+
+        async with create_mad(checkpoint_path=path) as mad:
+            with pytest.raises(RuntimeError, match="worker died"):
+                await mad.debate(topic="Test topic", debate_id="debate-1")
+
+        calls_before_resume = mock_provider.generate.await_count
+        # 2 rounds x (2 debaters + moderator) + failed judge
+        assert calls_before_resume == 7
+
+        # A fresh orchestrator (new process) picks up from the same file
+        async with create_mad(checkpoint_path=path) as mad:
+            result = await mad.resume("debate-1")
+
+        assert mock_provider.generate.await_count == calls_before_resume + 1
+        assert result.verdict == "Use it carefully"
+        assert result.debate_id == "debate-1"
+        assert result.total_cost == pytest.approx(0.007)
+
+    @pytest.mark.asyncio
+    async def test_resume_finished_debate_returns_result(self, mock_provider, tmp_path):
+        """Resuming a finished debate should not call any provider."""
+        pytest.importorskip("langgraph.checkpoint.sqlite")
+
+        async with create_mad(checkpoint_path=str(tmp_path / "debates.sqlite")) as mad:
+            first = await mad.debate(topic="Test topic")
+            calls = mock_provider.generate.await_count
+
+            resumed = await mad.resume(first.debate_id)
+
+        assert mock_provider.generate.await_count == calls
+        assert resumed.verdict == first.verdict
+
+    @pytest.mark.asyncio
+    async def test_resume_unknown_debate_raises(self, mock_provider, tmp_path):
+        """Resuming an unknown debate id should raise ValueError."""
+        pytest.importorskip("langgraph.checkpoint.sqlite")
+
+        async with create_mad(checkpoint_path=str(tmp_path / "debates.sqlite")) as mad:
+            with pytest.raises(ValueError, match="No checkpoint"):
+                await mad.resume("missing")
+
+    @pytest.mark.asyncio
+    async def test_resume_requires_checkpointer(self, mock_provider):
+        """resume should raise when checkpointing is disabled."""
+        mad = create_mad()
+
+        with pytest.raises(ValueError, match="checkpointer"):
+            await mad.resume("debate-1")
+
+
+class TestResponseCache:
+    """Tests for per-role response caching."""
+
+    @pytest.mark.asyncio
+    async def test_cached_roles_skip_repeated_calls(self, mock_provider, tmp_path):
+        """A repeated judge prompt should be served from cache at zero cost."""
+        mad = create_mad(
+            response_cache_roles=["judge"],
+            response_cache_path=str(tmp_path / "responses.sqlite"),
+        )
+
+        first = await mad.debate(topic="Test topic")
+        second = await mad.debate(topic="Test topic")
+
+        # Debaters and moderator run again; the judge does not
+        assert mock_provider.generate.await_count == 7 + 6
+        assert second.verdict == first.verdict
+        assert second.total_cost == pytest.approx(first.total_cost - 0.001)
+        judge_message = second.final_state["messages"][-1]
+        assert judge_message["metadata"]["cache_hit"] is True
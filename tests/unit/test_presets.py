@@ -30,6 +30,7 @@ class TestCodeReviewPreset:
         assert config.preset == "code_review"
         assert len(config.debaters) == 3
         assert config.max_rounds == 2
+        assert config.parallel_debaters is True
 
 
 class TestQAAccuracyPreset:
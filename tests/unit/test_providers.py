@@ -1,11 +1,17 @@
 """Tests for LLM providers."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from mad.providers import hedging, resilience, response_cache, router
 from mad.providers.base import LLMProvider, ProviderResponse
+from mad.providers.hedging import HedgedProvider, hedged
 from mad.providers.registry import ProviderRegistry, get_provider
+from mad.providers.resilience import resilient
+from mad.providers.response_cache import cached, shared_response_cache
+from mad.providers.router import routed
 
 
 class TestProviderResponse:
@@ -145,6 +151,24 @@ class TestProviderRegistry:
         ProviderRegistry.clear_cache()
         assert "anthropic" not in ProviderRegistry._instances
 
+    def test_clear_cache_drops_wrappers(self):
+        """clear_cache should drop the shared wrappers built around old providers."""
+        ProviderRegistry.clear_cache()
+        provider = ProviderRegistry.get("anthropic")
+        limited = ProviderRegistry.rate_limited(provider)
+        hedged(resilient(limited))
+        cached(provider, shared_response_cache())
+        routed([(provider, "m")])
+
+        ProviderRegistry.clear_cache()
+
+        assert ProviderRegistry._rate_limited == {}
+        assert hedging._shared == {}
+        assert resilience._shared == {}
+        assert response_cache._wrappers == {}
+        assert router._shared == {}
+        assert ProviderRegistry.rate_limited(provider) is not limited
+
 
 class TestGetProviderFunction:
     """Tests for get_provider convenience function."""
@@ -213,6 +237,115 @@ class TestAnthropicProvider:
         assert provider.validate_model("claude-sonnet-4-20250514") is True
         assert provider.validate_model("nonexistent-model") is False
 
+    def test_cache_tokens_priced_separately(self):
+        """Cache writes and reads should use their own rates."""
+        from mad.providers.anthropic import anthropic_cost
+
+        model = "claude-sonnet-4-20250514"
+
+        assert anthropic_cost(1_000_000, 0, model) == pytest.approx(3.0)
+        assert anthropic_cost(1_000_000, 0, model, cache_write_tokens=1_000_000) == (
+            pytest.approx(3.75)
+        )
+        assert anthropic_cost(1_000_000, 0, model, cache_read_tokens=1_000_000) == (
+            pytest.approx(0.30)
+        )
+
+    def test_marks_cache_breakpoints(self):
+        """The system prompt and marked messages should carry cache_control."""
+        from mad.providers.anthropic import AnthropicProvider
+
+        provider = AnthropicProvider()
+        lc_messages = provider._prepare_messages(
+            [
+                {"role": "user", "content": "## Debate Topic", "cache_control": "ephemeral"},
+                {"role": "user", "content": "Round 1"},
+            ],
+            system="You are a debater",
+        )
+
+        system, topic, instruction = lc_messages
+        assert system.content[0]["cache_control"] == {"type": "ephemeral"}
+        assert topic.content[0] == {
+            "type": "text",
+            "text": "## Debate Topic",
+            "cache_control": {"type": "ephemeral"},
+        }
+        assert instruction.content == "Round 1"
+
+    def test_build_response_reports_cache_usage(self):
+        """Cache read/write tokens should be priced and reported in metadata."""
+        from langchain_core.messages import AIMessage
+
+        from mad.providers.anthropic import AnthropicProvider, anthropic_cost
+
+        provider = AnthropicProvider()
+        message = AIMessage(
+            content="Hi",
+            usage_metadata={
+                "input_tokens": 1200,
+                "output_tokens": 10,
+                "total_tokens": 1210,
+                "input_token_details": {"cache_read": 1000, "cache_creation": 150},
+            },
+        )
+
+        response = provider._build_response(message, "claude-sonnet-4-20250514", 0.0)
+
+        assert response["metadata"] == {"cache_read_tokens": 1000, "cache_write_tokens": 150}
+        assert response["cost"] == pytest.approx(
+            anthropic_cost(1200, 10, "claude-sonnet-4-20250514", 150, 1000)
+        )
+        assert response["cost"] < provider.estimate_cost(1200, 10, "claude-sonnet-4-20250514")
+
+    def test_clients_cached_per_model_not_temperature(self, monkeypatch):
+        """Calls at different temperatures should reuse one client."""
+        from mad.providers.anthropic import AnthropicProvider
+
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        provider = AnthropicProvider(max_clients=2)
+
+        client = provider._get_client("claude-sonnet-4-20250514")
+        assert provider._get_client("claude-sonnet-4-20250514") is client
+
+        provider._get_client("claude-3-5-haiku-latest")
+        provider._get_client("claude-3-opus-latest")
+        assert list(provider._clients) == ["claude-3-5-haiku-latest", "claude-3-opus-latest"]
+
+    def test_clients_share_one_pool(self, monkeypatch):
+        """Every cached model client should send through the provider's connection pool."""
+        from mad.providers.anthropic import AnthropicProvider
+
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        provider = AnthropicProvider(max_clients=1)
+
+        first = provider._get_client("claude-sonnet-4-20250514")
+        second = provider._get_client("claude-3-5-haiku-latest")
+
+        assert list(provider._clients) == ["claude-3-5-haiku-latest"]
+        assert first.http_async_client is second.http_async_client is provider._http
+        assert second._async_client._client is provider._http
+        assert provider.pool_stats() == {"open": 0, "idle": 0, "in_use": 0}
+
+    @pytest.mark.asyncio
+    async def test_temperature_passed_per_call(self, monkeypatch):
+        """Temperature should be sent with each call, not baked into the client."""
+        from langchain_core.messages import AIMessage
+
+        from mad.providers.anthropic import AnthropicProvider
+
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        provider = AnthropicProvider()
+        client = MagicMock()
+        client.ainvoke = AsyncMock(return_value=AIMessage(content="Hi"))
+
+        with patch.object(provider, "_get_client", return_value=client):
+            await provider.generate([{"role": "user", "content": "Q"}], "m", temperature=0.2)
+            await provider.generate([{"role": "user", "content": "Q"}], "m", temperature=0.9)
+
+        temperatures = [call.kwargs["temperature"] for call in client.ainvoke.call_args_list]
+        assert temperatures == [0.2, 0.9]
+
 
 class TestOpenAIProvider:
     """Tests for OpenAIProvider."""
@@ -262,3 +395,181 @@ class TestOpenAIProvider:
 
         assert provider.validate_model("gpt-4o") is True
         assert provider.validate_model("nonexistent-model") is False
+
+    def test_clients_share_one_pool(self, monkeypatch):
+        """Every cached model client should use the provider's connection pool."""
+        from mad.providers.openai import OpenAIProvider
+
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        provider = OpenAIProvider(max_clients=1)
+
+        first = provider._get_client("gpt-4o")
+        second = provider._get_client("gpt-4o-mini")
+
+        assert list(provider._clients) == ["gpt-4o-mini"]
+        assert first.http_async_client is second.http_async_client is provider._http
+        assert provider.pool_stats() == {"open": 0, "idle": 0, "in_use": 0}
+
+
+class TestGenerateStream:
+    """Tests for the default LLMProvider.generate_stream."""
+
+    @pytest.mark.asyncio
+    async def test_forwards_chunks_and_assembles_response(self):
+        """generate_stream should forward chunks and return the full content."""
+
+        class StreamingProvider(LLMProvider):
+            @property
+            def name(self):
+                return "test"
+
+            @property
+            def supported_models(self):
+                return ["model-a"]
+
+            async def generate(self, messages, model, **kwargs):
+                pass
+
+            async def stream(self, messages, model, **kwargs):
+                for chunk in ["Hello", ", ", "world"]:
+                    yield chunk
+
+            def estimate_cost(self, input_tokens, output_tokens, model):
+                return (input_tokens + output_tokens) * 0.001
+
+        provider = StreamingProvider()
+        chunks: list[str] = []
+
+        response = await provider.generate_stream(
+            messages=[{"role": "user", "content": "Say hello to the world"}],
+            model="model-a",
+            on_token=chunks.append,
+        )
+
+        assert chunks == ["Hello", ", ", "world"]
+        assert response["content"] == "Hello, world"
+        assert response["input_tokens"] > 0
+        assert response["output_tokens"] > 0
+        assert response["cost"] == pytest.approx(
+            (response["input_tokens"] + response["output_tokens"]) * 0.001
+        )
+
+
+class SlowProvider(LLMProvider):
+    """Provider whose calls take a configurable time."""
+
+    def __init__(self, delays, cost=0.01):
+        self.delays = list(delays)
+        self.cost = cost
+        self.calls = 0
+
+    @property
+    def name(self):
+        return "slow"
+
+    @property
+    def supported_models(self):
+        return ["model-a"]
+
+    async def generate(self, messages, model, **kwargs):
+        delay = self.delays[min(self.calls, len(self.delays) - 1)]
+        self.calls += 1
+        await asyncio.sleep(delay)
+        return ProviderResponse(
+            content=f"after {delay}",
+            input_tokens=10,
+            output_tokens=5,
+            model=model,
+            cost=self.cost,
+            latency_ms=delay * 1000,
+        )
+
+    async def stream(self, messages, model, **kwargs):
+        yield ""
+
+    def estimate_cost(self, input_tokens, output_tokens, model):
+        return 0.001
+
+
+class TestHedgedProvider:
+    """Tests for HedgedProvider."""
+
+    MESSAGES = [{"role": "user", "content": "Hello"}]
+
+    def test_rejects_invalid_percentile(self):
+        """Percentile must be strictly between 0 and 1."""
+        with pytest.raises(ValueError, match="percentile"):
+            HedgedProvider(SlowProvider([0]), percentile=1.0)
+
+    def test_hedge_delay_uses_percentile(self):
+        """hedge_delay_ms should return the nearest-rank percentile."""
+        provider = HedgedProvider(SlowProvider([0]), percentile=0.9, min_samples=5)
+        for latency in range(1, 11):
+            provider.record_latency("model-a", float(latency))
+
+        assert provider.hedge_delay_ms("model-a") == 9.0
+        assert provider.hedge_delay_ms("model-b") is None
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_before_min_samples(self):
+        """Calls should not be hedged until enough latencies are known."""
+        primary = SlowProvider([0.01])
+        provider = HedgedProvider(primary, min_samples=3)
+
+        response = await provider.generate(self.MESSAGES, "model-a")
+
+        assert primary.calls == 1
+        assert "metadata" not in response
+        assert provider.hedge_delay_ms("model-a") is None
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_is_not_hedged(self):
+        """A primary call within the percentile should not be duplicated."""
+        primary = SlowProvider([0.001])
+        provider = HedgedProvider(primary, min_samples=1)
+        provider.record_latency("model-a", 200.0)
+
+        response = await provider.generate(self.MESSAGES, "model-a")
+
+        assert primary.calls == 1
+        assert response["cost"] == 0.01
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged(self):
+        """A slow primary should be raced against a hedge and both billed."""
+        primary = SlowProvider([1.0])
+        alternate = SlowProvider([0.01], cost=0.02)
+        provider = HedgedProvider(primary, alternate=alternate, min_samples=1)
+        provider.record_latency("model-a", 10.0)
+
+        response = await provider.generate(self.MESSAGES, "model-a")
+
+        assert response["content"] == "after 0.01"
+        assert response["metadata"]["hedged"] is True
+        assert response["metadata"]["hedge_winner"] == "hedge"
+        # Hedge cost plus the estimated input cost of the cancelled primary
+        assert response["cost"] == pytest.approx(0.02 + 0.001)
+        assert response["metadata"]["hedge_cost"] == pytest.approx(0.001)
+        assert provider.hedges_sent == 1
+        assert provider.hedges_won == 1
+
+    @pytest.mark.asyncio
+    async def test_falls_back_when_hedge_fails(self):
+        """A failing hedge should not hide a successful primary."""
+        primary = SlowProvider([0.05])
+        alternate = SlowProvider([0])
+        alternate.generate = AsyncMock(side_effect=RuntimeError("boom"))
+        provider = HedgedProvider(primary, alternate=alternate, min_samples=1)
+        provider.record_latency("model-a", 5.0)
+
+        response = await provider.generate(self.MESSAGES, "model-a")
+
+        assert response["content"] == "after 0.05"
+        assert response["metadata"]["hedge_winner"] == "primary"
+
+    def test_hedged_shares_wrappers(self):
+        """hedged() should return one wrapper per provider and percentile."""
+        primary = SlowProvider([0])
+
+        assert hedged(primary, 0.9) is hedged(primary, 0.9)
+        assert hedged(primary, 0.9) is not hedged(primary, 0.95)
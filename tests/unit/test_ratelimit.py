@@ -0,0 +1,169 @@
+"""Tests for client-side rate limiting."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from mad.providers.base import ProviderResponse
+from mad.providers.ratelimit import RateLimit, RateLimiter, TokenBucket
+from mad.providers.registry import ProviderRegistry
+
+
+@pytest.fixture(autouse=True)
+def clear_rate_limits():
+    """Keep registry rate limits from leaking between tests."""
+    ProviderRegistry.clear_rate_limits()
+    yield
+    ProviderRegistry.clear_rate_limits()
+
+
+def create_mock_provider(input_tokens=10, output_tokens=5):
+    """Create a mock provider reporting fixed usage."""
+    provider = MagicMock()
+    provider.name = "mock"
+    provider.generate = AsyncMock(
+        return_value=ProviderResponse(
+            content="ok",
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            model="model-a",
+            cost=0.0,
+            latency_ms=1.0,
+        )
+    )
+    return provider
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_starts_full(self):
+        """A new bucket should allow a full minute's worth immediately."""
+        bucket = TokenBucket(60)
+
+        assert bucket.time_until(60) == 0.0
+
+    def test_wait_reflects_refill_rate(self):
+        """Waiting time should follow the per-second refill rate."""
+        bucket = TokenBucket(60)
+        bucket.take(60)
+
+        assert bucket.time_until(2) == pytest.approx(2.0, abs=0.05)
+
+    def test_adjust_can_go_negative(self):
+        """Charging more than reserved should create a debt."""
+        bucket = TokenBucket(60)
+        bucket.take(60)
+        bucket.adjust(-30)
+
+        assert bucket.level < 0
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_waits_when_requests_exhausted(self):
+        """Requests beyond the RPM budget should wait for a refill."""
+        limiter = RateLimiter(RateLimit(rpm=600))
+        limiter.requests.take(600)
+
+        start = asyncio.get_running_loop().time()
+        await limiter.acquire(0)
+
+        assert asyncio.get_running_loop().time() - start >= 0.09
+        assert limiter.waited_s > 0
+
+    @pytest.mark.asyncio
+    async def test_callers_are_served_in_arrival_order(self):
+        """Queued callers should be admitted first come, first served."""
+        limiter = RateLimiter(RateLimit(rpm=6000))
+        limiter.requests.take(6000)
+        order = []
+
+        async def call(i):
+            await limiter.acquire(0)
+            order.append(i)
+
+        await asyncio.gather(*(call(i) for i in range(5)))
+
+        assert order == [0, 1, 2, 3, 4]
+
+    def test_reconcile_corrects_reservation(self):
+        """Actual usage above the reservation should be charged."""
+        limiter = RateLimiter(RateLimit(tpm=1000))
+        limiter.tokens.take(100)
+        limiter.reconcile(reserved=100, actual=400)
+
+        assert limiter.tokens.level == pytest.approx(600, abs=1)
+
+
+class TestRegistryRateLimits:
+    """Tests for ProviderRegistry rate limit configuration."""
+
+    def test_unlimited_by_default(self):
+        """Providers without limits should have no limiter."""
+        assert ProviderRegistry.limiter("anthropic", "model-a") is None
+
+    def test_limiters_are_per_model_and_shared(self):
+        """Each model gets its own limiter, reused on every lookup."""
+        ProviderRegistry.set_rate_limit("anthropic", rpm=50)
+
+        limiter_a = ProviderRegistry.limiter("anthropic", "model-a")
+
+        assert limiter_a is ProviderRegistry.limiter("anthropic", "model-a")
+        assert limiter_a is not ProviderRegistry.limiter("anthropic", "model-b")
+        assert ProviderRegistry.limiter("openai", "model-a") is None
+
+    def test_model_limit_overrides_default(self):
+        """A model-specific limit should take precedence over '*'."""
+        ProviderRegistry.set_rate_limit("anthropic", rpm=50)
+        ProviderRegistry.set_rate_limit("anthropic", "model-a", tpm=1000)
+
+        assert ProviderRegistry.limiter("anthropic", "model-a").limit == RateLimit(tpm=1000)
+        assert ProviderRegistry.limiter("anthropic", "model-b").limit == RateLimit(rpm=50)
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_provider_reserves_and_reconciles(self):
+        """Calls should reserve estimated tokens and settle with actual usage."""
+        ProviderRegistry.set_rate_limit("mock", rpm=100, tpm=10_000)
+        provider = ProviderRegistry.rate_limited(create_mock_provider(100, 50))
+
+        await provider.generate([{"role": "user", "content": "Hello"}], "model-a")
+
+        limiter = ProviderRegistry.limiter("mock", "model-a")
+        assert limiter.requests.level == pytest.approx(99, abs=0.1)
+        assert limiter.tokens.level == pytest.approx(10_000 - 150, abs=1)
+
+    def test_rate_limited_wrappers_are_shared(self):
+        """Wrapping the same provider twice should return one wrapper."""
+        provider = create_mock_provider()
+
+        assert ProviderRegistry.rate_limited(provider) is ProviderRegistry.rate_limited(provider)
+
+    @pytest.mark.asyncio
+    async def test_limits_keyed_by_registry_name(self):
+        """Limits set under a registry alias should apply though provider.name differs."""
+        ProviderRegistry.set_rate_limit("anthropic_http", rpm=100)
+        provider = ProviderRegistry.rate_limited(create_mock_provider(), "anthropic_http")
+
+        await provider.generate([{"role": "user", "content": "Hello"}], "model-a")
+
+        limiter = ProviderRegistry.limiter("anthropic_http", "model-a")
+        assert limiter.requests.level == pytest.approx(99, abs=0.1)
+        assert ProviderRegistry.limiter("mock", "model-a") is None
+
+    @pytest.mark.asyncio
+    async def test_failed_call_refunds_reservation(self):
+        """A call that raises should give its reserved tokens back."""
+        ProviderRegistry.set_rate_limit("mock", tpm=10_000)
+        primary = create_mock_provider()
+        primary.generate = AsyncMock(side_effect=ConnectionError("reset"))
+        provider = ProviderRegistry.rate_limited(primary)
+
+        with pytest.raises(ConnectionError):
+            await provider.generate([{"role": "user", "content": "Hello " * 500}], "model-a")
+
+        limiter = ProviderRegistry.limiter("mock", "model-a")
+        assert limiter.tokens.level == pytest.approx(10_000, abs=1)
@@ -0,0 +1,293 @@
+"""Tests for provider retries and circuit breaking."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from mad.providers.anthropic_http import AnthropicHTTPProvider
+from mad.providers.base import LLMProvider
+from mad.providers.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    ResilienceMetrics,
+    ResilientProvider,
+    RetryPolicy,
+    is_retryable,
+    retry_after,
+)
+
+MODEL = "claude-sonnet-4-20250514"
+MESSAGES = [{"role": "user", "content": "Hello"}]
+OK_BODY = {
+    "content": [{"type": "text", "text": "Hi"}],
+    "usage": {"input_tokens": 5, "output_tokens": 1},
+}
+
+
+class FakeServer:
+    """Local HTTP server answering requests from a script of responses."""
+
+    def __init__(self, script):
+        self.script = list(script)
+        self.requests = 0
+        self.server = None
+
+    @property
+    def url(self):
+        host, port = self.server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    async def __aenter__(self):
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        self.client = httpx.AsyncClient()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.client.aclose()
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle(self, reader, writer):
+        try:
+            await self.serve(reader, writer)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, reader, writer):
+        while True:
+            headers = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in headers.decode().split("\r\n"):
+                if line.lower().startswith("content-length:"):
+                    length = int(line.split(":", 1)[1])
+            await reader.readexactly(length)
+
+            index = min(self.requests, len(self.script) - 1)
+            status, extra_headers, body = self.script[index]
+            self.requests += 1
+
+            payload = json.dumps(body).encode()
+            head = [f"HTTP/1.1 {status} X", f"Content-Length: {len(payload)}"]
+            head += [f"{name}: {value}" for name, value in extra_headers.items()]
+            writer.write(("\r\n".join(head) + "\r\n\r\n").encode() + payload)
+            await writer.drain()
+
+
+def create_provider(server, metrics, **kwargs):
+    """Create a resilient HTTP provider pointed at a fake server."""
+    primary = AnthropicHTTPProvider(api_key="key", base_url=server.url, client=server.client)
+    policy = RetryPolicy(max_attempts=kwargs.pop("max_attempts", 4), initial_delay=0.001)
+    return ResilientProvider(primary, policy=policy, metrics=metrics, **kwargs)
+
+
+class TestHelpers:
+    """Tests for error classification helpers."""
+
+    def test_classifies_status_codes(self):
+        """Rate limits and overloads are retryable; client errors are not."""
+        request = httpx.Request("POST", "http://test")
+
+        def error(status):
+            response = httpx.Response(status, request=request)
+            return httpx.HTTPStatusError("error", request=request, response=response)
+
+        assert is_retryable(error(429))
+        assert is_retryable(error(529))
+        assert is_retryable(error(503))
+        assert not is_retryable(error(400))
+        assert is_retryable(httpx.ConnectError("refused"))
+        assert not is_retryable(ValueError("bad"))
+
+    def test_reads_retry_after(self):
+        """retry_after should parse the header in seconds."""
+        request = httpx.Request("POST", "http://test")
+        response = httpx.Response(429, headers={"retry-after": "2"}, request=request)
+        exc = httpx.HTTPStatusError("error", request=request, response=response)
+
+        assert retry_after(exc) == 2.0
+        assert retry_after(ValueError("bad")) is None
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+
+    def test_opens_after_threshold(self):
+        """The breaker should open after consecutive failures."""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+
+        assert not breaker.record_failure()
+        assert breaker.record_failure()
+        assert breaker.state == "open"
+        assert not breaker.allow()
+
+    def test_half_open_allows_single_trial(self):
+        """After the timeout, one trial call is allowed through."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+
+        assert breaker.state == "half_open"
+        assert breaker.allow()
+        assert not breaker.allow()
+
+        breaker.record_success()
+        assert breaker.state == "closed"
+
+
+class TestResilientProvider:
+    """Tests for ResilientProvider against a local fake server."""
+
+    @pytest.mark.asyncio
+    async def test_retries_rate_limits(self):
+        """A 429 then a 529 should be retried until the call succeeds."""
+        script = [
+            (429, {"Retry-After": "0"}, {"error": "rate limited"}),
+            (529, {}, {"error": "overloaded"}),
+            (200, {}, OK_BODY),
+        ]
+        metrics = ResilienceMetrics()
+
+        async with FakeServer(script) as server:
+            provider = create_provider(server, metrics)
+            response = await provider.generate(MESSAGES, MODEL)
+
+        assert response["content"] == "Hi"
+        assert server.requests == 3
+        stats = metrics.snapshot()[f"anthropic:{MODEL}"]
+        assert stats["attempts"] == 3
+        assert stats["retries"] == 2
+        assert stats["breaker_state"] == "closed"
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_not_retried(self):
+        """A 400 should fail immediately."""
+        metrics = ResilienceMetrics()
+
+        async with FakeServer([(400, {}, {"error": "bad request"})]) as server:
+            provider = create_provider(server, metrics)
+            with pytest.raises(httpx.HTTPStatusError):
+                await provider.generate(MESSAGES, MODEL)
+
+        assert server.requests == 1
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self):
+        """Persistent failures should raise the last error."""
+        metrics = ResilienceMetrics()
+
+        async with FakeServer([(503, {}, {"error": "unavailable"})]) as server:
+            provider = create_provider(server, metrics, max_attempts=3)
+            with pytest.raises(httpx.HTTPStatusError):
+                await provider.generate(MESSAGES, MODEL)
+
+        assert server.requests == 3
+
+    @pytest.mark.asyncio
+    async def test_breaker_rejects_calls_once_open(self):
+        """An open breaker should reject calls without hitting the server."""
+        metrics = ResilienceMetrics()
+
+        async with FakeServer([(503, {}, {"error": "unavailable"})]) as server:
+            provider = create_provider(
+                server, metrics, max_attempts=5, failure_threshold=2, reset_timeout=60
+            )
+            with pytest.raises(httpx.HTTPStatusError):
+                await provider.generate(MESSAGES, MODEL)
+            with pytest.raises(CircuitOpenError):
+                await provider.generate(MESSAGES, MODEL)
+
+        assert server.requests == 2
+        stats = metrics.snapshot()[f"anthropic:{MODEL}"]
+        assert stats["breaker_state"] == "open"
+        assert stats["breaker_opens"] == 1
+        assert stats["rejections"] == 1
+
+
+class BlockingProvider(LLMProvider):
+    """Provider whose calls block, fail or stream according to flags."""
+
+    def __init__(self):
+        self.started = asyncio.Event()
+        self.error = None
+
+    @property
+    def name(self):
+        return "anthropic"
+
+    @property
+    def supported_models(self):
+        return []
+
+    async def generate(self, messages, model, **kwargs):
+        if self.error is not None:
+            raise self.error
+        self.started.set()
+        await asyncio.sleep(3600)
+
+    async def stream(self, messages, model, **kwargs):
+        yield "partial"
+        raise self.error
+
+    def estimate_cost(self, input_tokens, output_tokens, model):
+        return 0.0
+
+
+def half_open_provider(primary, metrics):
+    """Wrap a provider whose breaker has just gone half-open."""
+    provider = ResilientProvider(
+        primary, RetryPolicy(max_attempts=1), failure_threshold=1, reset_timeout=0, metrics=metrics
+    )
+    metrics.breaker(f"anthropic:{MODEL}", 1, 0).record_failure()
+    return provider
+
+
+class TestHalfOpenTrials:
+    """Tests for releasing the half-open trial slot."""
+
+    @pytest.mark.asyncio
+    async def test_cancelled_trial_releases_slot(self):
+        """Cancelling a half-open trial (e.g. a losing hedge) should allow the next call."""
+        metrics = ResilienceMetrics()
+        primary = BlockingProvider()
+        provider = half_open_provider(primary, metrics)
+
+        task = asyncio.create_task(provider.generate(MESSAGES, MODEL))
+        await primary.started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert metrics.breakers[f"anthropic:{MODEL}"].allow()
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_trial_releases_slot(self):
+        """A half-open trial failing with a client error should not wedge the breaker."""
+        metrics = ResilienceMetrics()
+        primary = BlockingProvider()
+        primary.error = ValueError("bad request")
+        provider = half_open_provider(primary, metrics)
+
+        with pytest.raises(ValueError, match="bad request"):
+            await provider.generate(MESSAGES, MODEL)
+
+        assert metrics.breakers[f"anthropic:{MODEL}"].allow()
+
+    @pytest.mark.asyncio
+    async def test_failed_stream_records_failure(self):
+        """A stream failing with a retryable error should re-open the breaker."""
+        metrics = ResilienceMetrics()
+        primary = BlockingProvider()
+        primary.error = httpx.ConnectError("reset")
+        provider = half_open_provider(primary, metrics)
+
+        with pytest.raises(httpx.ConnectError):
+            async for _ in provider.stream(MESSAGES, MODEL):
+                pass
+
+        stats = metrics.snapshot()[f"anthropic:{MODEL}"]
+        assert stats["failures"] == 1
+        assert stats["breaker_opens"] == 0
+        assert metrics.breakers[f"anthropic:{MODEL}"].opened_at is not None
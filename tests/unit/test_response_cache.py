@@ -0,0 +1,174 @@
+"""Tests for the provider response cache."""
+
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from mad.providers.base import ProviderResponse
+from mad.providers.openai_compatible import OpenAICompatibleProvider
+from mad.providers.ratelimit import RateLimitedProvider
+from mad.providers.response_cache import (
+    CachedProvider,
+    ResponseCache,
+    response_cache_key,
+)
+
+MESSAGES = [{"role": "user", "content": "Hello"}]
+
+
+def create_response(content="Hi"):
+    """Create a provider response."""
+    return ProviderResponse(
+        content=content,
+        input_tokens=10,
+        output_tokens=5,
+        model="model-a",
+        cost=0.01,
+        latency_ms=100.0,
+    )
+
+
+def create_mock_provider():
+    """Create a mock provider returning a fixed response."""
+    provider = MagicMock()
+    provider.name = "mock"
+    provider.generate = AsyncMock(return_value=create_response())
+    provider.generate_stream = AsyncMock(return_value=create_response())
+    return provider
+
+
+class TestResponseCacheKey:
+    """Tests for response_cache_key."""
+
+    def test_equal_requests_hash_equally(self):
+        """Identical requests should produce the same key."""
+        key1 = response_cache_key("p", "m", 0.3, "sys", MESSAGES, 100)
+        key2 = response_cache_key("p", "m", 0.3, "sys", [dict(MESSAGES[0])], 100)
+
+        assert key1 == key2
+
+    def test_any_field_changes_key(self):
+        """Changing any part of the request should change the key."""
+        base = response_cache_key("p", "m", 0.3, "sys", MESSAGES, 100)
+
+        assert base != response_cache_key("q", "m", 0.3, "sys", MESSAGES, 100)
+        assert base != response_cache_key("p", "m", 0.7, "sys", MESSAGES, 100)
+        assert base != response_cache_key("p", "m", 0.3, None, MESSAGES, 100)
+        assert base != response_cache_key("p", "m", 0.3, "sys", MESSAGES, 200)
+        assert base != response_cache_key("p", "m", 0.3, "sys", MESSAGES, 100, "http://a/v1")
+
+
+class TestResponseCache:
+    """Tests for ResponseCache."""
+
+    @pytest.mark.asyncio
+    async def test_memory_hit_and_miss(self):
+        """Stored responses should be returned and counted as hits."""
+        cache = ResponseCache()
+
+        assert await cache.get("k") is None
+        await cache.set("k", create_response())
+
+        assert (await cache.get("k"))["content"] == "Hi"
+        assert cache.stats.memory_hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.bytes_stored > 0
+        assert cache.stats.bytes_served == cache.stats.bytes_stored
+
+    @pytest.mark.asyncio
+    async def test_lru_evicts_oldest(self):
+        """The least recently used entry should be evicted past maxsize."""
+        cache = ResponseCache(maxsize=2)
+        await cache.set("a", create_response("a"))
+        await cache.set("b", create_response("b"))
+        await cache.get("a")
+        await cache.set("c", create_response("c"))
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") is not None
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_miss(self):
+        """Entries older than the TTL should not be served."""
+        cache = ResponseCache(ttl_s=0.01)
+        await cache.set("k", create_response())
+        time.sleep(0.02)
+
+        assert await cache.get("k") is None
+
+    @pytest.mark.asyncio
+    async def test_disk_tier_survives_new_instance(self, tmp_path):
+        """A new cache on the same file should serve entries from disk."""
+        path = str(tmp_path / "responses.sqlite")
+        first = ResponseCache(path=path)
+        await first.set("k", create_response())
+        first.close()
+
+        second = ResponseCache(path=path)
+        response = await second.get("k")
+        second.close()
+
+        assert response["content"] == "Hi"
+        assert second.stats.disk_hits == 1
+
+
+class TestCachedProvider:
+    """Tests for CachedProvider."""
+
+    @pytest.mark.asyncio
+    async def test_hit_is_free_and_marked(self):
+        """A repeated request should skip the provider and cost nothing."""
+        provider = create_mock_provider()
+        cached = CachedProvider(provider, ResponseCache())
+
+        first = await cached.generate(MESSAGES, "model-a", temperature=0.3)
+        second = await cached.generate(MESSAGES, "model-a", temperature=0.3)
+
+        assert provider.generate.await_count == 1
+        assert first["cost"] == 0.01
+        assert "metadata" not in first
+        assert second["cost"] == 0.0
+        assert second["content"] == first["content"]
+        assert second["metadata"]["cache_hit"] is True
+
+    @pytest.mark.asyncio
+    async def test_different_temperature_misses(self):
+        """Temperature is part of the key."""
+        provider = create_mock_provider()
+        cached = CachedProvider(provider, ResponseCache())
+
+        await cached.generate(MESSAGES, "model-a", temperature=0.3)
+        await cached.generate(MESSAGES, "model-a", temperature=0.7)
+
+        assert provider.generate.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_endpoints_do_not_share_entries(self):
+        """Servers reporting the same provider name should be cached separately."""
+        cache = ResponseCache()
+        servers = []
+        for url in ("http://a:8000/v1", "http://b:8000/v1"):
+            server = OpenAICompatibleProvider(base_url=url)
+            server.generate = AsyncMock(return_value=create_response(url))
+            servers.append(server)
+        wrapped = [CachedProvider(RateLimitedProvider(s, lambda m: None), cache) for s in servers]
+
+        responses = [await provider.generate(MESSAGES, "llama") for provider in wrapped]
+
+        assert [r["content"] for r in responses] == ["http://a:8000/v1", "http://b:8000/v1"]
+        assert all(server.generate.await_count == 1 for server in servers)
+
+    @pytest.mark.asyncio
+    async def test_stream_hit_replays_content(self):
+        """A streaming hit should forward the cached content as one chunk."""
+        provider = create_mock_provider()
+        cached = CachedProvider(provider, ResponseCache())
+        chunks: list[str] = []
+
+        await cached.generate_stream(MESSAGES, "model-a", on_token=chunks.append)
+        response = await cached.generate_stream(MESSAGES, "model-a", on_token=chunks.append)
+
+        assert provider.generate_stream.await_count == 1
+        assert chunks == ["Hi"]
+        assert response["metadata"]["cache_hit"] is True
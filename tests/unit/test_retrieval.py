@@ -0,0 +1,206 @@
+"""Tests for per-perspective context retrieval."""
+
+from unittest.mock import MagicMock
+
+from mad.agents.debater import DebaterAgent
+from mad.agents.retrieval import (
+    BM25Index,
+    ContextRetriever,
+    chunk_context,
+    open_disagreements,
+    terms,
+)
+from mad.core.state import create_initial_state, create_message
+from mad.tokens import count_tokens, estimate_prompt_tokens
+
+FILLER = "    total = total + value  # accumulate the running figure\n" * 12
+
+SECTIONS = {
+    "render": "def renderTemplate(page):\n    return html_layout(page)\n",
+    "sanitize": "def sanitize_input(request):\n    return escape(request.user_input)\n",
+    "cache": "def warm_cache(keys):\n    return prefetch(keys, latency_budget)\n",
+    "sql": "def load_user(db, user_id):\n    return db.execute(sql_query, user_id)\n",
+}
+
+
+def large_context(repeat=6):
+    """Build a source file where each topic lives in its own section."""
+    blocks = []
+    for _ in range(repeat):
+        for name, code in SECTIONS.items():
+            blocks.append(f"# section: {name}\n{code}{FILLER}")
+    return "\n".join(blocks)
+
+
+def debate_state(context, messages=()):
+    """Build a debate state with a context and optional transcript."""
+    state = create_initial_state(topic="Review this module", context=context, debate_id="d1")
+    state["messages"] = list(messages)
+    state["current_round"] = 1
+    return state
+
+
+def debater(perspective):
+    """Build a debater without a live provider."""
+    provider = MagicMock()
+    provider.name = "anthropic"
+    return DebaterAgent("debater_1", provider, "m", perspective=perspective)
+
+
+class TestBM25:
+    """Tests for chunking and BM25 ranking."""
+
+    def test_terms_split_identifiers(self):
+        """Terms should split snake_case, camelCase and digits."""
+        assert terms("renderTemplate(user_input, HTTPServer2)") == [
+            "render",
+            "template",
+            "user",
+            "input",
+            "http",
+            "server",
+            "2",
+        ]
+
+    def test_chunks_cover_context(self):
+        """Chunks should cover every line, in order, near the target size."""
+        context = large_context(repeat=2)
+        chunks = chunk_context(context, chunk_tokens=100)
+
+        assert "\n".join(chunk.text for chunk in chunks) == context.rstrip("\n")
+        assert chunks[0].start_line == 1
+        assert chunks[-1].end_line == len(context.splitlines())
+        assert all(a.end_line + 1 == b.start_line for a, b in zip(chunks, chunks[1:], strict=False))
+        assert all(count_tokens(chunk.text) <= 110 for chunk in chunks)
+
+    def test_long_lines_split(self):
+        """A line longer than the chunk size should be split into fitting pieces."""
+        line = " ".join(f"word{i}" for i in range(400))
+        chunks = chunk_context(f"first\n{line}\nlast", chunk_tokens=50)
+
+        assert chunks[0].text == "first"
+        assert chunks[-1].text == "last"
+        assert "".join(chunk.text for chunk in chunks[1:-1]) == line
+        assert all(chunk.start_line == chunk.end_line == 2 for chunk in chunks[1:-1])
+        assert all(count_tokens(chunk.text) <= 50 for chunk in chunks)
+
+    def test_matching_chunk_ranks_first(self):
+        """The chunk sharing the query's rare terms should score highest."""
+        chunks = chunk_context(large_context(repeat=1), chunk_tokens=100)
+        index = BM25Index(chunks)
+
+        scores = index.scores("sanitize the user input")
+        best = max(range(len(chunks)), key=scores.__getitem__)
+
+        assert "sanitize_input" in chunks[best].text
+        assert index.scores("unrelated words") == [0.0] * len(chunks)
+
+
+class TestContextRetriever:
+    """Tests for ContextRetriever."""
+
+    def test_small_context_unchanged(self):
+        """A context within budget should be passed through whole."""
+        retriever = ContextRetriever(budget_tokens=10_000)
+        state = debate_state(large_context(repeat=1))
+
+        assert retriever.select(state, "security") == state["context"]
+
+    def test_selects_relevant_excerpts_within_budget(self):
+        """Large contexts should be cut to the best chunks that fit the budget."""
+        retriever = ContextRetriever(budget_tokens=400, top_k=4, chunk_tokens=100)
+        state = debate_state(large_context())
+
+        selected = retriever.select(state, "sanitize user input escape")
+
+        assert selected.startswith("(Excerpts: ")
+        assert "sanitize_input" in selected
+        assert "renderTemplate" not in selected
+        assert count_tokens(selected) < 500
+
+    def test_single_line_context_has_excerpts(self):
+        """A large context on one line should still yield excerpts within budget."""
+        retriever = ContextRetriever(budget_tokens=200)
+        state = debate_state(large_context().replace("\n", " "))
+
+        selected = retriever.select(state, "sanitize user input escape")
+
+        assert not selected.startswith("(Excerpts: 0 ")
+        assert "sanitize_input" in selected
+        assert count_tokens(selected) < 300
+
+    def test_oversize_chunk_truncated(self):
+        """When no chunk fits the budget, the best one should be cut to fit."""
+        retriever = ContextRetriever(budget_tokens=50, chunk_tokens=200)
+        state = debate_state(large_context())
+
+        selected = retriever.select(state, "sanitize user input escape")
+
+        assert selected.startswith("(Excerpts: 1 of ")
+        assert count_tokens(selected) < 80
+
+    def test_index_built_once_per_debate(self):
+        """The index should be reused until the debate's context changes."""
+        retriever = ContextRetriever()
+        state = debate_state(large_context())
+
+        first = retriever.index(state)
+        assert retriever.index(state) is first
+
+        assert retriever.index(state, "openai") is not first
+
+        state["context"] = large_context(repeat=2)
+        assert retriever.index(state) is not first
+
+    def test_open_disagreements_from_moderator(self):
+        """The latest moderator assessment should supply the open disagreements."""
+        moderation = '{"consensus_score": 0.3, "key_disagreements": ["cache latency"]}'
+        state = debate_state(
+            None, [create_message("moderator", "moderator", "anthropic", "m", moderation, 1)]
+        )
+
+        assert open_disagreements(state) == ["cache latency"]
+        assert open_disagreements(debate_state(None)) == []
+
+
+class TestDebaterRetrieval:
+    """Tests for retrieval in debater prompts."""
+
+    def test_perspective_narrows_context(self):
+        """Each debater should see the excerpts for its own perspective."""
+        retriever = ContextRetriever(budget_tokens=400, top_k=4, chunk_tokens=100)
+        state = debate_state(large_context())
+        security, performance = debater("sanitize input"), debater("cache latency")
+        security.retriever = performance.retriever = retriever
+
+        security_prompt = security._build_prompt(state)[0]["content"]
+        performance_prompt = performance._build_prompt(state)[0]["content"]
+
+        assert "sanitize_input" in security_prompt
+        assert "warm_cache" not in security_prompt
+        assert "warm_cache" in performance_prompt
+
+    def test_disagreements_steer_retrieval(self):
+        """Open disagreements should pull their code into the next round's prompt."""
+        moderation = '{"key_disagreements": ["sql query for load user"]}'
+        message = create_message("moderator", "moderator", "anthropic", "m", moderation, 1)
+        agent = debater("sanitize input")
+        agent.retriever = ContextRetriever(budget_tokens=400, top_k=4, chunk_tokens=100)
+
+        prompt = agent._build_prompt(debate_state(large_context(), [message]))[0]["content"]
+
+        assert "sql_query" in prompt
+
+    def test_input_tokens_reduced(self):
+        """Retrieval should shrink the prompt for a large context."""
+        state = debate_state(large_context(repeat=20))
+        full = debater("sanitize input")
+        narrowed = debater("sanitize input")
+        narrowed.retriever = ContextRetriever(budget_tokens=1000)
+
+        full_tokens = estimate_prompt_tokens(full._build_prompt(state), provider="anthropic")
+        narrowed_tokens = estimate_prompt_tokens(
+            narrowed._build_prompt(state), provider="anthropic"
+        )
+
+        assert narrowed_tokens < full_tokens / 5
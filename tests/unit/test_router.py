@@ -0,0 +1,207 @@
+"""Tests for latency- and cost-aware routing."""
+
+from unittest.mock import patch
+
+import pytest
+
+from mad.core.config import DebateConfig, DebaterConfig
+from mad.core.orchestrator import MAD
+from mad.providers.base import LLMProvider, ProviderResponse
+from mad.providers.router import RouterProvider, routed
+
+
+class FakeProvider(LLMProvider):
+    """Provider with fixed latency and price that can be made to fail."""
+
+    def __init__(self, name, latency_ms=100.0, price=1.0, fail=False):
+        self._name = name
+        self.latency_ms = latency_ms
+        self.price = price
+        self.fail = fail
+        self.calls = []
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def supported_models(self):
+        return []
+
+    async def generate(self, messages, model, **kwargs):
+        self.calls.append(model)
+        if self.fail:
+            raise ConnectionError(f"{self._name} is down")
+        system = (kwargs.get("system") or "").lower()
+        if "judge" in system:
+            content = '{"verdict": "Routed", "confidence": 0.8}'
+        elif "moderator" in system:
+            content = '{"consensus_score": 0.2, "should_continue": true}'
+        else:
+            content = f"from {self._name}"
+        return ProviderResponse(
+            content=content,
+            input_tokens=100,
+            output_tokens=50,
+            model=model,
+            cost=self.estimate_cost(100, 50, model),
+            latency_ms=self.latency_ms,
+        )
+
+    async def stream(self, messages, model, **kwargs):
+        if self.fail:
+            raise ConnectionError(f"{self._name} is down")
+        yield f"from {self._name}"
+
+    def estimate_cost(self, input_tokens, output_tokens, model):
+        return (input_tokens + output_tokens) * self.price / 1_000_000
+
+
+MESSAGES = [{"role": "user", "content": "Question"}]
+
+
+class TestRouterProvider:
+    """Tests for RouterProvider."""
+
+    @pytest.mark.asyncio
+    async def test_cheapest_policy(self):
+        """The cheapest candidate should get the call."""
+        cheap = FakeProvider("cheap", price=0.1)
+        pricey = FakeProvider("pricey", price=10.0)
+        router = RouterProvider([(pricey, "big"), (cheap, "small")], policy="cheapest")
+
+        response = await router.generate(MESSAGES, "ignored")
+
+        assert response["content"] == "from cheap"
+        assert response["model"] == "small"
+        assert response["metadata"] == {
+            "route": "cheap:small",
+            "route_policy": "cheapest",
+            "route_failovers": 0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_prompt_sized_per_candidate_tokenizer(self):
+        """Each candidate's cost should use its own provider's token count."""
+        anthropic = FakeProvider("anthropic", price=1.0)
+        openai = FakeProvider("openai", price=1.0)
+        router = RouterProvider([(anthropic, "a"), (openai, "b")], policy="cheapest")
+
+        # Same price, but the Anthropic tokenizer yields more tokens for this prompt
+        response = await router.generate([{"role": "user", "content": "x" * 40_000}], "ignored")
+
+        assert response["metadata"]["route"] == "openai:b"
+
+    @pytest.mark.asyncio
+    async def test_fastest_policy_uses_observed_latency(self):
+        """After trying each candidate, the fastest should be preferred."""
+        slow = FakeProvider("slow", latency_ms=900.0)
+        fast = FakeProvider("fast", latency_ms=50.0)
+        router = RouterProvider([(slow, "a"), (fast, "b")], policy="fastest")
+
+        for _ in range(4):
+            await router.generate(MESSAGES, "ignored")
+
+        assert len(slow.calls) == 1
+        assert len(fast.calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_cheapest_under_p95(self):
+        """A cheap candidate over the latency target should lose to a fast one."""
+        cheap_slow = FakeProvider("cheap_slow", latency_ms=5000.0, price=0.1)
+        fast = FakeProvider("fast", latency_ms=200.0, price=1.0)
+        router = RouterProvider(
+            [(cheap_slow, "a"), (fast, "b")],
+            policy="cheapest_under_p95",
+            p95_target_ms=1000.0,
+        )
+
+        first = await router.generate(MESSAGES, "ignored")
+        second = await router.generate(MESSAGES, "ignored")
+
+        assert first["metadata"]["route"] == "cheap_slow:a"
+        assert second["metadata"]["route"] == "fast:b"
+
+    @pytest.mark.asyncio
+    async def test_fails_over_and_moves_traffic(self):
+        """A failing vendor should be skipped and then ranked last."""
+        down = FakeProvider("down", price=0.1, fail=True)
+        up = FakeProvider("up", price=1.0)
+        router = RouterProvider([(down, "a"), (up, "b")], policy="cheapest", alpha=0.5)
+
+        first = await router.generate(MESSAGES, "ignored")
+        second = await router.generate(MESSAGES, "ignored")
+
+        assert first["metadata"]["route_failovers"] == 1
+        assert second["metadata"]["route_failovers"] == 0
+        assert len(down.calls) == 1
+        assert router.degraded(router.routes[0])
+
+    @pytest.mark.asyncio
+    async def test_all_candidates_failing_raises(self):
+        """The last error should propagate when every candidate fails."""
+        router = RouterProvider(
+            [(FakeProvider("a", fail=True), "a"), (FakeProvider("b", fail=True), "b")]
+        )
+
+        with pytest.raises(ConnectionError, match="b is down"):
+            await router.generate(MESSAGES, "ignored")
+
+    @pytest.mark.asyncio
+    async def test_stream_fails_over_before_first_chunk(self):
+        """Streaming should move to the next candidate if nothing was yielded."""
+        router = RouterProvider(
+            [(FakeProvider("down", fail=True), "a"), (FakeProvider("up"), "b")],
+            policy="cheapest",
+        )
+
+        chunks = [chunk async for chunk in router.stream(MESSAGES, "ignored")]
+
+        assert chunks == ["from up"]
+
+    def test_requires_candidates(self):
+        """An empty candidate list should be rejected."""
+        with pytest.raises(ValueError, match="candidate"):
+            RouterProvider([])
+
+    def test_routed_is_shared(self):
+        """routed should return one router per candidate set and policy."""
+        provider = FakeProvider("p")
+
+        assert routed([(provider, "m")], "cheapest") is routed([(provider, "m")], "cheapest")
+        assert routed([(provider, "m")], "cheapest") is not routed([(provider, "m")], "fastest")
+
+
+class TestDebateRouting:
+    """Tests for routing roles from DebateConfig."""
+
+    @pytest.mark.asyncio
+    async def test_routed_role_records_route(self):
+        """Debater messages should record the route taken."""
+        providers = {"anthropic": FakeProvider("anthropic", price=3.0)}
+        providers["openai"] = FakeProvider("openai", price=0.5)
+        config = DebateConfig(
+            debaters=[DebaterConfig(perspective="pro"), DebaterConfig(perspective="con")],
+            max_rounds=1,
+            routing={
+                "debater": {
+                    "candidates": [
+                        {"provider": "anthropic", "model": "claude-3-5-haiku-latest"},
+                        {"provider": "openai", "model": "gpt-4o-mini"},
+                    ],
+                    "policy": "cheapest",
+                }
+            },
+        )
+
+        with patch(
+            "mad.core.orchestrator.get_provider",
+            side_effect=lambda name, base_url=None: providers[name],
+        ):
+            result = await MAD(config).debate(topic="Test topic")
+
+        debater_messages = [
+            m for m in result.final_state["messages"] if m["agent_role"] == "debater"
+        ]
+        assert {m["metadata"]["route"] for m in debater_messages} == {"openai:gpt-4o-mini"}
+        assert result.verdict == "Routed"
@@ -52,6 +52,15 @@ class TestCreateInitialState:
         assert state["start_time"] is not None
         assert state["end_time"] is None
 
+    def test_generates_unique_debate_ids(self):
+        """Each state should get its own debate id unless one is given."""
+        first = create_initial_state(topic="Test")
+        second = create_initial_state(topic="Test")
+        named = create_initial_state(topic="Test", debate_id="debate-1")
+
+        assert first["debate_id"] != second["debate_id"]
+        assert named["debate_id"] == "debate-1"
+
 
 class TestCreateMessage:
     """Tests for create_message function."""
@@ -0,0 +1,110 @@
+"""Tests for offline token counting."""
+
+import time
+
+import pytest
+
+from mad import tokens
+from mad.agents.debater import DebaterAgent
+from mad.core.state import create_initial_state, create_message
+
+
+@pytest.fixture(autouse=True)
+def fresh_tokenizers():
+    """Restore registered tokenizers and the memo after each test."""
+    registered = dict(tokens._tokenizers)
+    tokens.clear_cache()
+    yield
+    tokens._tokenizers.clear()
+    tokens._tokenizers.update(registered)
+    tokens.clear_cache()
+
+
+class CountingTokenizer(tokens.Tokenizer):
+    """Tokenizer that counts words and records every call."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def count(self, text):
+        self.calls += 1
+        return len(text.split())
+
+
+class TestHeuristicTokenizer:
+    """Tests for HeuristicTokenizer."""
+
+    def test_ascii_ratio(self):
+        """ASCII text should be counted at chars_per_token."""
+        tokenizer = tokens.HeuristicTokenizer(chars_per_token=4.0)
+
+        assert tokenizer.count("") == 0
+        assert tokenizer.count("hi") == 1
+        assert tokenizer.count("a" * 400) == 100
+
+    def test_non_ascii_counts_more(self):
+        """Hangul and CJK text should cost about a token per character."""
+        tokenizer = tokens.HeuristicTokenizer(chars_per_token=4.0)
+
+        assert tokenizer.count("안녕하세요") == 5
+        assert tokenizer.count("안녕하세요") > tokenizer.count("hello")
+
+    def test_providers_have_calibrated_defaults(self):
+        """Anthropic should count more tokens than OpenAI for the same text."""
+        text = "The quick brown fox jumps over the lazy dog. " * 20
+
+        assert tokens.count_tokens(text, "anthropic") > tokens.count_tokens(text, "openai")
+        assert tokens.get_tokenizer("unknown") is tokens.get_tokenizer(None)
+
+
+class TestTiktokenTokenizer:
+    """Tests for TiktokenTokenizer."""
+
+    def test_falls_back_when_encoding_unavailable(self):
+        """An unloadable encoding should fall back to the heuristic."""
+        tokenizer = tokens.TiktokenTokenizer("no_such_encoding")
+
+        assert tokenizer.count("a" * 400) == 100
+
+
+class TestMemoization:
+    """Tests for memoized counting."""
+
+    def test_register_tokenizer(self):
+        """A registered tokenizer should be used for its provider."""
+        tokens.register_tokenizer("custom", CountingTokenizer())
+
+        assert tokens.count_tokens("one two three", "custom") == 3
+
+    def test_transcript_counted_once_per_message(self):
+        """Re-estimating a growing transcript should only tokenize new messages."""
+        tokenizer = CountingTokenizer()
+        tokens.register_tokenizer("custom", tokenizer)
+        transcript = [{"role": "user", "content": f"message {i}"} for i in range(10)]
+
+        first = tokens.estimate_prompt_tokens(transcript, system="be brief", provider="custom")
+        transcript.append({"role": "user", "content": "message 10"})
+        second = tokens.estimate_prompt_tokens(transcript, system="be brief", provider="custom")
+
+        assert first == 2 + 10 * (2 + tokens.MESSAGE_OVERHEAD)
+        assert second == first + 2 + tokens.MESSAGE_OVERHEAD
+        assert tokenizer.calls == 12
+        assert tokens.cache_info()["hits"] == 11
+
+    def test_debater_prompt_estimate_is_fast(self):
+        """A full debater prompt should be estimated in microseconds once warm."""
+        debater = DebaterAgent("debater_1", None, "model")
+        state = create_initial_state(topic="Topic " * 50, max_rounds=3)
+        state["messages"] = [
+            create_message(f"debater_{i % 2 + 1}", "debater", "p", "m", "Argument " * 300, 1)
+            for i in range(20)
+        ]
+        prompt = debater._build_prompt(state)
+        tokens.estimate_prompt_tokens(prompt, provider="anthropic")
+
+        start = time.perf_counter()
+        for _ in range(100):
+            tokens.estimate_prompt_tokens(prompt, provider="anthropic")
+        per_call_us = (time.perf_counter() - start) / 100 * 1_000_000
+
+        assert per_call_us < 1000